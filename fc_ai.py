@@ -2,9 +2,19 @@
 
 import argparse
 import asyncio
+import atexit
+import logging
 import os
+import queue
 import sys
 import signal
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
 
 from fc_client.client import FreeCivClient
 
@@ -28,54 +38,47 @@ def parse_args():
     return parser.parse_args()
 
 
-async def main() -> int:
+def setup_logging() -> QueueListener:
     """
-    Main entry point for the FreeCiv AI client.
-
-    Implements an event-driven architecture with:
-    - Continuous packet reading loop
-    - Signal handling for clean shutdown (SIGINT, SIGTERM)
-    - Graceful connection cleanup
-    """
-    # Parse command-line arguments
-    args = parse_args()
+    Configure root logging so records are written by a background thread.
 
-    shutdown_event = asyncio.Event()
-
-    # Create client with optional packet debugging and validation
-    try:
-        client = FreeCivClient(
-            debug_packets_dir=args.debug_packets, validate_packets=args.validate_packets
-        )
-    except FileExistsError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return os.EX_USAGE  # Exit code 64
+    Handlers only enqueue records; a QueueListener thread does the console
+    I/O, so logging never blocks the event loop on a slow terminal.
 
-    # Setup signal handlers for clean shutdown
-    def signal_handler(signum):
-        """Handle Unix signals by setting shutdown event"""
-        sig_name = signal.Signals(signum).name
-        print(f"\nReceived {sig_name}, shutting down gracefully...")
-        shutdown_event.set()
+    Returns:
+        The started listener (stopped automatically at interpreter exit)
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    # Records are formatted by the QueueHandler before being enqueued
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
 
-    # Get the running event loop
-    loop = asyncio.get_running_loop()
+    listener.start()
+    atexit.register(listener.stop)  # Flushes queued records on exit
+    return listener
 
-    # Register signal handlers with the event loop
-    # Handle SIGTERM availability for cross-platform compatibility
-    signals = [signal.SIGINT]
-    if hasattr(signal, "SIGTERM"):
-        signals.append(signal.SIGTERM)
 
-    for sig in signals:
-        loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+async def run_client(
+    client: FreeCivClient,
+    shutdown_event: asyncio.Event,
+    task_group: Optional["asyncio.TaskGroup"] = None,
+) -> None:
+    """
+    Connect, join and run the client until shutdown_event is set.
 
+    Args:
+        client: Client to run
+        shutdown_event: Event that will be set to trigger shutdown
+        task_group: Optional asyncio.TaskGroup that owns the packet reader task
+    """
     try:
         # Connect to server
         await client.connect("192.168.86.33", 6556)
 
         # Start packet reader task (runs in background)
-        await client.start_packet_reader(shutdown_event)
+        await client.start_packet_reader(shutdown_event, task_group)
 
         # Send join request packet
         await client.send_join_request("ai-user")
@@ -103,8 +106,71 @@ async def main() -> int:
         await client.stop_and_disconnect()
         print("Disconnected cleanly")
 
+
+async def main() -> int:
+    """
+    Main entry point for the FreeCiv AI client.
+
+    Implements an event-driven architecture with:
+    - Continuous packet reading loop
+    - Signal handling for clean shutdown (SIGINT, SIGTERM)
+    - Graceful connection cleanup
+    """
+    # Parse command-line arguments
+    args = parse_args()
+
+    # Client library diagnostics go through logging; per-packet messages are DEBUG
+    setup_logging()
+
+    shutdown_event = asyncio.Event()
+
+    # Create client with optional packet debugging and validation
+    try:
+        client = FreeCivClient(
+            debug_packets_dir=args.debug_packets, validate_packets=args.validate_packets
+        )
+    except FileExistsError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return os.EX_USAGE  # Exit code 64
+
+    # Signals to handle (SIGTERM availability varies across platforms), with
+    # names resolved once up front for the handler
+    signals = [signal.SIGINT]
+    if hasattr(signal, "SIGTERM"):
+        signals.append(signal.SIGTERM)
+    sig_names = {int(sig): sig.name for sig in signals}
+
+    # Setup signal handlers for clean shutdown
+    def signal_handler(signum):
+        """Handle Unix signals by setting shutdown event"""
+        sig_name = sig_names.get(signum, str(signum))
+        print(f"\nReceived {sig_name}, shutting down gracefully...")
+        shutdown_event.set()
+
+    # Get the running event loop
+    loop = asyncio.get_running_loop()
+
+    # Run new tasks eagerly until their first real suspension (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    # Register signal handlers with the event loop
+    for sig in signals:
+        loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+
+    # On Python 3.11+ a TaskGroup owns the client's background tasks, so none
+    # outlive main() even if it exits with an exception
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as task_group:
+            await run_client(client, shutdown_event, task_group)
+    else:
+        await run_client(client, shutdown_event)
+
     return os.EX_OK
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-based event loop when available; fall back to stock asyncio
+    if uvloop is not None:
+        uvloop.install()
     sys.exit(asyncio.run(main()))
@@ -1,19 +1,248 @@
+from __future__ import annotations
+
 import asyncio
-import traceback
-from typing import Optional, Dict, Callable, Awaitable
+import logging
+from typing import Optional, List, Callable, Awaitable
 from . import protocol
 from . import handlers
 from .game_state import GameState
 from .packet_debugger import PacketDebugger
 from .delta_cache import DeltaCache
 
+try:
+    import aiofastnet
+except ImportError:  # aiofastnet is optional; fall back to the stock asyncio transport
+    aiofastnet = None
+
+logger = logging.getLogger(__name__)
+
+
+class FreeCivProtocol(asyncio.BufferedProtocol):
+    """
+    Buffered asyncio protocol for the FreeCiv server connection.
+
+    The transport receives directly into a preallocated bytearray owned by this
+    protocol (via get_buffer/buffer_updated), avoiding the intermediate bytes
+    object and buffer extension that asyncio.StreamReader performs for every
+    chunk received from the socket.
+
+    Implements the subset of the StreamReader/StreamWriter API used by the
+    client (readexactly, write, drain, close, wait_closed), so the same object
+    serves as both reader and writer and protocol.read_packet() works unchanged.
+    """
+
+    BUFFER_SIZE = 64 * 1024  # Initial receive buffer size
+    MIN_FREE = 4096  # Minimum free space handed to the transport per read
+    HIGH_WATER = 4 * BUFFER_SIZE  # Pause reading above this many unread bytes
+
+    def __init__(self):
+        self.transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray(self.BUFFER_SIZE)
+        self._start = 0  # Read cursor (first unread byte)
+        self._end = 0  # Write cursor (end of received data)
+        self._eof = False
+        self._exception: Optional[BaseException] = None
+        self._read_waiter: Optional[asyncio.Future] = None
+        self._reading_paused = False
+        self._writing_paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._connection_lost = False
+        self._closed: Optional[asyncio.Future] = None
+
+    # ------------------------------------------------------------------
+    # asyncio.BufferedProtocol callbacks
+    # ------------------------------------------------------------------
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return a writable view of the free space at the end of the buffer."""
+        if self._start == self._end:
+            # Everything consumed - rewind cursors instead of compacting
+            self._start = self._end = 0
+
+        needed = max(sizehint, self.MIN_FREE)
+        if len(self._buffer) - self._end < needed:
+            # Compact unread data to the front of the buffer
+            unread = self._end - self._start
+            self._buffer[:unread] = self._buffer[self._start : self._end]
+            self._start, self._end = 0, unread
+
+            if len(self._buffer) - self._end < needed:
+                self._buffer.extend(bytes(max(needed, len(self._buffer))))
+
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+
+        if not self._reading_paused and self._end - self._start > self.HIGH_WATER:
+            self._reading_paused = True
+            self.transport.pause_reading()
+
+        self._wake_reader()
+
+    def eof_received(self) -> None:
+        self._eof = True
+        self._wake_reader()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._connection_lost = True
+        self._eof = True
+        if exc is not None:
+            self._exception = exc
+        self._wake_reader()
+
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _wake_reader(self) -> None:
+        waiter = self._read_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    # ------------------------------------------------------------------
+    # StreamReader-compatible API
+    # ------------------------------------------------------------------
+
+    async def readexactly(self, n: int) -> bytes:
+        """
+        Read exactly n bytes from the receive buffer.
+
+        Raises:
+            asyncio.IncompleteReadError: If EOF is reached before n bytes are available
+        """
+        while self._end - self._start < n:
+            if self._exception is not None:
+                raise self._exception
+            if self._eof:
+                partial = bytes(self._buffer[self._start : self._end])
+                self._start = self._end = 0
+                raise asyncio.IncompleteReadError(partial, n)
+
+            # Reads larger than HIGH_WATER would otherwise wait forever on a
+            # paused transport (as StreamReader does, resume before waiting)
+            if self._reading_paused:
+                self._reading_paused = False
+                self.transport.resume_reading()
+
+            self._read_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._read_waiter
+            finally:
+                self._read_waiter = None
+
+        start = self._start
+        with memoryview(self._buffer) as view:
+            data = bytes(view[start : start + n])
+        self._start = start + n
+
+        if self._reading_paused and self._end - self._start <= self.HIGH_WATER // 2:
+            self._reading_paused = False
+            self.transport.resume_reading()
+
+        return data
+
+    def at_eof(self) -> bool:
+        """Return True if EOF was received and the buffer is fully consumed."""
+        return self._eof and self._start == self._end
+
+    # ------------------------------------------------------------------
+    # StreamWriter-compatible API
+    # ------------------------------------------------------------------
+
+    def write(self, data: bytes) -> None:
+        self.transport.write(data)
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer drops below its high-water mark."""
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+        if not self._writing_paused:
+            return
+
+        self._drain_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._drain_waiter
+        finally:
+            self._drain_waiter = None
+
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+
+    def is_closing(self) -> bool:
+        return self.transport is None or self.transport.is_closing()
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+    async def wait_closed(self) -> None:
+        if self._connection_lost or self.transport is None:
+            return
+        if self._closed is None:
+            self._closed = asyncio.get_running_loop().create_future()
+        await self._closed
+
+
+PacketHandler = Callable[["FreeCivClient", GameState, bytes], Awaitable[None]]
+SyncPacketHandler = Callable[["FreeCivClient", GameState, bytes], None]
+
+# Initial size of the handler table (packet type numbers are small and dense)
+HANDLER_TABLE_SIZE = 512
+
+# Outbound write batching: drain after this many writes or once the
+# transport's write buffer grows beyond WRITE_HIGH_WATER bytes
+DRAIN_THRESHOLD = 16
+WRITE_HIGH_WATER = 64 * 1024
+
+# Packet debugger queue: the reader waits for space when the queue is full (the
+# capture must not lose packets), and the writer task writes up to
+# DEBUG_BATCH_SIZE packets per executor call
+DEBUG_QUEUE_SIZE = 1024
+DEBUG_BATCH_SIZE = 64
+
 
 class FreeCivClient:
-    reader: Optional[asyncio.StreamReader]
-    writer: Optional[asyncio.StreamWriter]
+    __slots__ = (
+        "reader",
+        "writer",
+        "_shutdown_event",
+        "_join_successful",
+        "_packet_handlers",
+        "_sync_handlers",
+        "_packet_reader_task",
+        "game_state",
+        "_packet_debugger",
+        "_debug_queue",
+        "_debug_writer_task",
+        "_use_two_byte_type",
+        "_delta_cache",
+        "_validate_packets",
+        "_pending_writes",
+        "_drain_threshold",
+    )
+
+    reader: Optional[FreeCivProtocol]
+    writer: Optional[FreeCivProtocol]
     _shutdown_event: Optional[asyncio.Event]
     _join_successful: asyncio.Event
-    _packet_handlers: Dict[int, Callable[["FreeCivClient", GameState, bytes], Awaitable[None]]]
+    _packet_handlers: List[Optional[PacketHandler]]
+    _sync_handlers: List[Optional[SyncPacketHandler]]
     _packet_reader_task: Optional[asyncio.Task]
     game_state: Optional[GameState]
     _packet_debugger: Optional[PacketDebugger]
@@ -25,124 +254,167 @@ class FreeCivClient:
         self.writer = None
         self._shutdown_event = None
         self._join_successful = asyncio.Event()
-        self._packet_handlers = {}
+        self._packet_handlers = [None] * HANDLER_TABLE_SIZE  # Async handlers by packet type
+        self._sync_handlers = [None] * HANDLER_TABLE_SIZE  # Non-awaiting handlers by packet type
         self._packet_reader_task = None
         self.game_state = None
         self._use_two_byte_type = False  # Start with 1-byte type, switch after JOIN_REPLY
-        self._delta_cache = DeltaCache()  # Cache for delta protocol
+        # Cache for delta protocol (validation mode also checks cache ownership)
+        self._delta_cache = DeltaCache(check_ownership=validate_packets)
         self._validate_packets = validate_packets  # Enable validation logging
+        self._pending_writes = 0  # Writes since the last drain
+        self._drain_threshold = DRAIN_THRESHOLD
 
         # Initialize packet debugger if requested
+        # Inbound packets are queued and written by a background task
+        self._debug_queue = None
+        self._debug_writer_task = None
         if debug_packets_dir:
             self._packet_debugger = PacketDebugger(debug_packets_dir)
-            print(f"Packet debugging enabled: {debug_packets_dir}/")
+            self._debug_queue = asyncio.Queue(maxsize=DEBUG_QUEUE_SIZE)
+            logger.info("Packet debugging enabled: %s/", debug_packets_dir)
         else:
             self._packet_debugger = None
 
         if self._validate_packets:
-            print("Packet validation mode enabled")
+            logger.info("Packet validation mode enabled")
 
         # Register packet handlers
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_PROCESSING_STARTED, handlers.handle_processing_started
         )
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_PROCESSING_FINISHED, handlers.handle_processing_finished
         )
-        self.register_handler(protocol.PACKET_SERVER_JOIN_REPLY, handlers.handle_server_join_reply)
-        self.register_handler(protocol.PACKET_SERVER_INFO, handlers.handle_server_info)
+        self.register_sync_handler(
+            protocol.PACKET_SERVER_JOIN_REPLY, handlers.handle_server_join_reply
+        )
+        self.register_sync_handler(protocol.PACKET_SERVER_INFO, handlers.handle_server_info)
         self.register_handler(protocol.PACKET_GAME_INFO, handlers.handle_game_info)
         self.register_handler(protocol.PACKET_CHAT_MSG, handlers.handle_chat_msg)
-        self.register_handler(protocol.PACKET_RULESET_CONTROL, handlers.handle_ruleset_control)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_CONTROL, handlers.handle_ruleset_control)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_TERRAIN_CONTROL, handlers.handle_ruleset_terrain_control
         )
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_RULESET_TERRAIN_FLAG, handlers.handle_ruleset_terrain_flag
         )
-        self.register_handler(protocol.PACKET_RULESET_IMPR_FLAG, handlers.handle_ruleset_impr_flag)
-        self.register_handler(protocol.PACKET_RULESET_STYLE, handlers.handle_ruleset_style)
-        self.register_handler(protocol.PACKET_RULESET_MUSIC, handlers.handle_ruleset_music)
-        self.register_handler(protocol.PACKET_RULESET_EFFECT, handlers.handle_ruleset_effect)
-        self.register_handler(protocol.PACKET_RULESET_BUILDING, handlers.handle_ruleset_building)
-        self.register_handler(protocol.PACKET_RULESET_CITY, handlers.handle_ruleset_city)
-        self.register_handler(protocol.PACKET_RULESET_TERRAIN, handlers.handle_ruleset_terrain)
-        self.register_handler(protocol.PACKET_RULESET_GAME, handlers.handle_ruleset_game)
-        self.register_handler(
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_IMPR_FLAG, handlers.handle_ruleset_impr_flag
+        )
+        self.register_sync_handler(protocol.PACKET_RULESET_STYLE, handlers.handle_ruleset_style)
+        self.register_sync_handler(protocol.PACKET_RULESET_MUSIC, handlers.handle_ruleset_music)
+        self.register_sync_handler(protocol.PACKET_RULESET_EFFECT, handlers.handle_ruleset_effect)
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_BUILDING, handlers.handle_ruleset_building
+        )
+        self.register_sync_handler(protocol.PACKET_RULESET_CITY, handlers.handle_ruleset_city)
+        self.register_sync_handler(protocol.PACKET_RULESET_TERRAIN, handlers.handle_ruleset_terrain)
+        self.register_sync_handler(protocol.PACKET_RULESET_GAME, handlers.handle_ruleset_game)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_SPECIALIST, handlers.handle_ruleset_specialist
         )
-        self.register_handler(protocol.PACKET_RULESET_SUMMARY, handlers.handle_ruleset_summary)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_SUMMARY, handlers.handle_ruleset_summary)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_DESCRIPTION_PART, handlers.handle_ruleset_description_part
         )
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_RULESET_NATION_GROUPS, handlers.handle_ruleset_nation_groups
         )
-        self.register_handler(protocol.PACKET_RULESET_NATION, handlers.handle_ruleset_nation)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_NATION, handlers.handle_ruleset_nation)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_NATION_SETS, handlers.handle_ruleset_nation_sets
         )
-        self.register_handler(protocol.PACKET_RULESET_DISASTER, handlers.handle_ruleset_disaster)
-        self.register_handler(protocol.PACKET_RULESET_TRADE, handlers.handle_ruleset_trade)
-        self.register_handler(protocol.PACKET_RULESET_RESOURCE, handlers.handle_ruleset_resource)
-        self.register_handler(
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_DISASTER, handlers.handle_ruleset_disaster
+        )
+        self.register_sync_handler(protocol.PACKET_RULESET_TRADE, handlers.handle_ruleset_trade)
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_RESOURCE, handlers.handle_ruleset_resource
+        )
+        self.register_sync_handler(
             protocol.PACKET_RULESET_ACHIEVEMENT, handlers.handle_ruleset_achievement
         )
-        self.register_handler(protocol.PACKET_RULESET_TECH_FLAG, handlers.handle_ruleset_tech_flag)
-        self.register_handler(
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_TECH_FLAG, handlers.handle_ruleset_tech_flag
+        )
+        self.register_sync_handler(
             protocol.PACKET_RULESET_EXTRA_FLAG, handlers.handle_ruleset_extra_flag
         )
-        self.register_handler(protocol.PACKET_RULESET_EXTRA, handlers.handle_ruleset_extra)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_EXTRA, handlers.handle_ruleset_extra)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_UNIT_CLASS, handlers.handle_ruleset_unit_class
         )
-        self.register_handler(protocol.PACKET_RULESET_BASE, handlers.handle_ruleset_base)
-        self.register_handler(protocol.PACKET_RULESET_ROAD, handlers.handle_ruleset_road)
-        self.register_handler(protocol.PACKET_RULESET_GOODS, handlers.handle_ruleset_goods)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_BASE, handlers.handle_ruleset_base)
+        self.register_sync_handler(protocol.PACKET_RULESET_ROAD, handlers.handle_ruleset_road)
+        self.register_sync_handler(protocol.PACKET_RULESET_GOODS, handlers.handle_ruleset_goods)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_UNIT_CLASS_FLAG, handlers.handle_ruleset_unit_class_flag
         )
-        self.register_handler(protocol.PACKET_RULESET_UNIT_FLAG, handlers.handle_ruleset_unit_flag)
-        self.register_handler(
+        self.register_sync_handler(
+            protocol.PACKET_RULESET_UNIT_FLAG, handlers.handle_ruleset_unit_flag
+        )
+        self.register_sync_handler(
             protocol.PACKET_RULESET_UNIT_BONUS, handlers.handle_ruleset_unit_bonus
         )
-        self.register_handler(protocol.PACKET_RULESET_TECH, handlers.handle_ruleset_tech)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_TECH, handlers.handle_ruleset_tech)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_GOVERNMENT_RULER_TITLE,
             handlers.handle_ruleset_government_ruler_title,
         )
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_RULESET_GOVERNMENT, handlers.handle_ruleset_government
         )
-        self.register_handler(protocol.PACKET_RULESET_UNIT, handlers.handle_ruleset_unit)
-        self.register_handler(protocol.PACKET_RULESET_ACTION, handlers.handle_ruleset_action)
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_UNIT, handlers.handle_ruleset_unit)
+        self.register_sync_handler(protocol.PACKET_RULESET_ACTION, handlers.handle_ruleset_action)
+        self.register_sync_handler(
             protocol.PACKET_RULESET_ACTION_ENABLER, handlers.handle_ruleset_action_enabler
         )
-        self.register_handler(
+        self.register_sync_handler(
             protocol.PACKET_RULESET_ACTION_AUTO, handlers.handle_ruleset_action_auto
         )
-        self.register_handler(protocol.PACKET_RULESET_CLAUSE, handlers.handle_ruleset_clause)
-        self.register_handler(
-            protocol.PACKET_RULESETS_READY, handlers.handle_rulesets_ready
-        )
-        self.register_handler(
+        self.register_sync_handler(protocol.PACKET_RULESET_CLAUSE, handlers.handle_ruleset_clause)
+        self.register_sync_handler(protocol.PACKET_RULESETS_READY, handlers.handle_rulesets_ready)
+        self.register_sync_handler(
             protocol.PACKET_NATION_AVAILABILITY, handlers.handle_nation_availability
         )
 
-    def register_handler(
-        self,
-        packet_type: int,
-        handler: Callable[["FreeCivClient", GameState, bytes], Awaitable[None]],
-    ) -> None:
+    @staticmethod
+    def _set_table_entry(table: list, packet_type: int, handler: Optional[Callable]) -> None:
+        """Store handler at table[packet_type], growing the table if needed."""
+        if packet_type >= len(table):
+            table.extend([None] * (packet_type + 1 - len(table)))
+        table[packet_type] = handler
+
+    def register_handler(self, packet_type: int, handler: PacketHandler) -> None:
         """
         Register a packet handler function for a specific packet type.
 
+        Handlers are stored in a list indexed by packet type, which grows if a
+        packet type beyond the current table size is registered. Replaces any
+        sync handler previously registered for the same packet type.
+
         Args:
             packet_type: The packet type number to handle
             handler: Async function that takes (client, game_state, payload) and processes the packet
         """
-        self._packet_handlers[packet_type] = handler
+        self._set_table_entry(self._packet_handlers, packet_type, handler)
+        self._set_table_entry(self._sync_handlers, packet_type, None)
+
+    def register_sync_handler(self, packet_type: int, handler: SyncPacketHandler) -> None:
+        """
+        Register a non-awaiting packet handler function for a specific packet type.
+
+        Sync handlers are called directly by the dispatcher, skipping the
+        coroutine creation and await for handlers that never perform I/O.
+        Replaces any async handler previously registered for the same packet type.
+
+        Args:
+            packet_type: The packet type number to handle
+            handler: Function that takes (client, game_state, payload) and processes the packet
+        """
+        self._set_table_entry(self._sync_handlers, packet_type, handler)
+        self._set_table_entry(self._packet_handlers, packet_type, None)
 
     async def connect(self, host: str, port: int) -> bool:
         """
@@ -155,8 +427,18 @@ class FreeCivClient:
         Returns:
             True if connection successful
         """
-        self.reader, self.writer = await asyncio.open_connection(host, port)
-        print(f"Connected to {host}:{port}")
+        loop = asyncio.get_running_loop()
+        if aiofastnet is not None:
+            # Cython/C transport implementation when available
+            _, stream = await aiofastnet.create_connection(
+                loop, FreeCivProtocol, host=host, port=port
+            )
+        else:
+            _, stream = await loop.create_connection(FreeCivProtocol, host, port)
+
+        # The buffered protocol provides both the reader and writer APIs
+        self.reader = self.writer = stream
+        logger.info("Connected to %s:%d", host, port)
         self.game_state = GameState()
         return True
 
@@ -170,7 +452,7 @@ class FreeCivClient:
             username: Username to join as
         """
         if not self.reader or not self.writer:
-            print("Error: Not connected to server")
+            logger.error("Not connected to server")
             return
 
         # Encode and send JOIN_REQ packet
@@ -182,19 +464,108 @@ class FreeCivClient:
                 join_req_packet, protocol.PACKET_SERVER_JOIN_REQ
             )
 
-        self.writer.write(join_req_packet)
-        await self.writer.drain()
-        print(f"Sent JOIN_REQ for user '{username}'")
+        await self._send(join_req_packet)
+        logger.info("Sent JOIN_REQ for user '%s'", username)
 
-    async def start_packet_reader(self, shutdown_event: asyncio.Event) -> None:
+    async def _send(self, packet: bytes) -> None:
+        """
+        Write a packet to the server, draining in batches.
+
+        drain() is only awaited once every _drain_threshold writes, or when the
+        transport's write buffer exceeds WRITE_HIGH_WATER, so bursts of small
+        packets don't pay an event loop round-trip each. Call _flush() to drain
+        any remaining pending writes.
+
+        Args:
+            packet: Complete encoded packet bytes
+        """
+        writer = self.writer
+        writer.write(packet)
+        self._pending_writes += 1
+
+        if (
+            self._pending_writes >= self._drain_threshold
+            or writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER
+        ):
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """
+        Drain the writer if any writes are pending since the last drain.
+
+        The drain is skipped when the transport already accepted every byte
+        (empty write buffer), which is the common case for small packets.
+        """
+        writer = self.writer
+        if self._pending_writes and writer:
+            self._pending_writes = 0
+            if writer.transport.get_write_buffer_size() > 0:
+                await writer.drain()
+
+    async def start_packet_reader(
+        self, shutdown_event: asyncio.Event, task_group: Optional[asyncio.TaskGroup] = None
+    ) -> None:
         """
         Start the packet reading loop in the background.
 
         Args:
             shutdown_event: Event that will be set to trigger shutdown
+            task_group: Optional asyncio.TaskGroup (Python 3.11+) to own the
+                background tasks; any tasks still running when the group exits
+                are cancelled and awaited by the group
         """
+        create_task = task_group.create_task if task_group is not None else asyncio.create_task
+
         self._shutdown_event = shutdown_event
-        self._packet_reader_task = asyncio.create_task(self._packet_reading_loop())
+        if self._debug_queue is not None:
+            self._debug_writer_task = create_task(self._debug_writer_loop())
+        self._packet_reader_task = create_task(self._packet_reading_loop())
+
+    async def _debug_writer_loop(self) -> None:
+        """
+        Background task that writes queued inbound packets to the packet debugger.
+
+        Pulls batches of up to DEBUG_BATCH_SIZE packets from the debug queue and
+        writes them in the default executor, keeping disk I/O off the event loop.
+        """
+        queue = self._debug_queue
+        write_batch = self._packet_debugger.write_inbound_batch
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < DEBUG_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await loop.run_in_executor(None, write_batch, batch)
+            except (RuntimeError, OSError) as e:
+                # A failed write verification must not take the client down with it
+                logger.error("Packet debugger failed to write batch: %s", e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _stop_debug_writer(self) -> None:
+        """Wait for queued debug packets to be written, then stop the writer task."""
+        task = self._debug_writer_task
+        if task is None:
+            return
+        self._debug_writer_task = None
+
+        if not task.done():
+            # Drain the queue unless the writer task exits first (e.g. write failure)
+            join = asyncio.ensure_future(self._debug_queue.join())
+            await asyncio.wait({join, task}, return_when=asyncio.FIRST_COMPLETED)
+            join.cancel()
+            task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Packet debugger writer failed: %s", e)
 
     async def _packet_reading_loop(self) -> None:
         """
@@ -202,33 +573,42 @@ class FreeCivClient:
 
         Runs until shutdown event is set or a connection error occurs.
         """
+        # Bind loop-invariant lookups to locals once, outside the hot loop
+        read_packet = protocol.read_packet
+        reader = self.reader
+        is_shutdown = self._shutdown_event.is_set  # _shutdown_event is not reassigned while running
+        debug_queue = self._debug_queue
+        dispatch = self._dispatch_packet
+        validate = self._validate_packets
+
         try:
-            while not self._shutdown_event.is_set():
+            while not is_shutdown():
                 # Read next packet (now returns 3-tuple including raw bytes)
-                packet_type, payload, raw_packet = await protocol.read_packet(
-                    self.reader,
+                # _use_two_byte_type is read each time: it flips after JOIN_REPLY
+                packet_type, payload, raw_packet = await read_packet(
+                    reader,
                     use_two_byte_type=self._use_two_byte_type,
-                    validate=self._validate_packets,
+                    validate=validate,
                 )
 
-                # Debug: Write inbound packet
-                if self._packet_debugger:
-                    self._packet_debugger.write_inbound_packet(raw_packet, packet_type)
+                # Debug: Queue inbound packet for the background writer
+                # (waits for space when full, so the capture stays complete)
+                if debug_queue is not None:
+                    await debug_queue.put((raw_packet, packet_type))
 
-                print(f"Received packet type: {packet_type}")
+                logger.debug("Received packet type: %d", packet_type)
 
                 # Dispatch to handler
-                await self._dispatch_packet(packet_type, payload)
+                await dispatch(packet_type, payload)
 
         except asyncio.IncompleteReadError:
-            print("Connection closed by server")
+            logger.info("Connection closed by server")
             self._shutdown_event.set()
         except ConnectionError as e:
-            print(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             self._shutdown_event.set()
         except Exception as e:
-            print(f"Unexpected error in packet reading loop: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error in packet reading loop: %s", e)
             self._shutdown_event.set()
 
     async def _dispatch_packet(self, packet_type: int, payload: bytes) -> None:
@@ -242,8 +622,17 @@ class FreeCivClient:
             payload: The packet payload bytes
         """
         try:
-            # Look up handler
-            handler = self._packet_handlers.get(packet_type)
+            # Sync handlers first: called directly without creating a coroutine
+            sync_handlers = self._sync_handlers
+            if packet_type < len(sync_handlers):
+                sync_handler = sync_handlers[packet_type]
+                if sync_handler is not None:
+                    sync_handler(self, self.game_state, payload)
+                    return
+
+            # Look up async handler (direct index into the handler table)
+            packet_handlers = self._packet_handlers
+            handler = packet_handlers[packet_type] if packet_type < len(packet_handlers) else None
 
             if handler:
                 # Call the registered handler
@@ -253,10 +642,14 @@ class FreeCivClient:
                 await handlers.handle_unknown_packet(self, self.game_state, packet_type, payload)
 
         except Exception as e:
-            print(f"Error in packet handler for type {packet_type}: {e}")
-            print(f"Payload size: {len(payload)} bytes")
-            print(f"First 40 bytes: {payload[:40].hex()}")
-            traceback.print_exc()
+            logger.exception(
+                "Error in packet handler for type %d: %s\nPayload size: %d bytes\n"
+                "First 40 bytes: %s",
+                packet_type,
+                e,
+                len(payload),
+                payload[:40].hex(),
+            )
             self._shutdown_event.set()
 
     async def wait_for_join(self, timeout: float = 10.0) -> bool:
@@ -287,6 +680,15 @@ class FreeCivClient:
             except asyncio.CancelledError:
                 pass
 
+        # Finish writing queued debug packets
+        await self._stop_debug_writer()
+
+        # Flush any batched writes before closing (connection may already be gone)
+        try:
+            await self._flush()
+        except ConnectionError:
+            pass
+
         # Disconnect
         await self.disconnect()
 
@@ -303,5 +705,5 @@ class FreeCivClient:
         if self.writer:
             self.writer.close()
             await self.writer.wait_closed()
-            print("Disconnected from server")
+            logger.info("Disconnected from server")
         return True
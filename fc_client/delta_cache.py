@@ -1,5 +1,7 @@
 """Delta cache for FreeCiv protocol delta encoding."""
 
+from __future__ import annotations
+
 from typing import Dict, Tuple, Any, Optional
 
 
@@ -10,12 +12,26 @@ class DeltaCache:
     only changed fields using bitvectors. This cache stores previous packet
     values so that unchanged fields can be reconstructed from cache.
 
-    Cache structure: {packet_type: {key_tuple: {field_name: value}}}
+    Cache structure: {(packet_type, key_tuple): {field_name: value}}
+
+    A single flat dict keyed by (packet_type, key_tuple) keeps every lookup
+    and update to one hash probe.
     """
 
-    def __init__(self):
-        """Initialize empty delta cache."""
-        self._cache: Dict[int, Dict[Tuple, Dict[str, Any]]] = {}
+    __slots__ = ("_cache", "_snapshots", "_check_ownership")
+
+    def __init__(self, check_ownership: bool = False):
+        """Initialize empty delta cache.
+
+        Args:
+            check_ownership: Keep a snapshot of every cached packet and verify on
+                lookup that it was not mutated after update_cache() (costs a copy
+                per update and a compare per hit, so it is opt-in)
+        """
+        self._cache: Dict[Tuple[int, Tuple], Dict[str, Any]] = {}
+        self._check_ownership = check_ownership
+        # Snapshots used to detect ownership violations (only with check_ownership)
+        self._snapshots: Dict[Tuple[int, Tuple], Dict[str, Any]] = {}
 
     def get_cached_packet(
         self, packet_type: int, key_values: Tuple = ()
@@ -30,26 +46,36 @@ class DeltaCache:
         Returns:
             Dictionary of field values if cached, None if not found
         """
-        if packet_type not in self._cache:
-            return None
-        return self._cache[packet_type].get(key_values)
+        cached = self._cache.get((packet_type, key_values))
+        if self._check_ownership and cached is not None:
+            assert cached == self._snapshots[(packet_type, key_values)], (
+                f"Cached fields for packet type {packet_type} key {key_values} "
+                f"were mutated after update_cache()"
+            )
+        return cached
 
     def update_cache(self, packet_type: int, key_values: Tuple, fields: Dict[str, Any]) -> None:
         """Update cache with new packet data.
 
+        Ownership of fields passes to the cache: the dict is stored as-is, so
+        callers must not mutate it afterwards. Decoders build a fresh dict per
+        packet, which makes a defensive copy unnecessary; handlers that keep a
+        decoded dict in GameState store their own copy. With check_ownership,
+        a snapshot is kept and get_cached_packet() verifies it.
+
         Args:
             packet_type: The packet type number
             key_values: Tuple of key field values
             fields: Complete dictionary of all field values for this packet
         """
-        if packet_type not in self._cache:
-            self._cache[packet_type] = {}
-        # Store a copy to prevent external modifications
-        self._cache[packet_type][key_values] = fields.copy()
+        self._cache[(packet_type, key_values)] = fields
+        if self._check_ownership:
+            self._snapshots[(packet_type, key_values)] = fields.copy()
 
     def clear_all(self) -> None:
         """Clear entire cache (should be called on disconnect)."""
         self._cache.clear()
+        self._snapshots.clear()
 
     def clear_packet_type(self, packet_type: int) -> None:
         """Clear cache for a specific packet type.
@@ -57,10 +83,11 @@ class DeltaCache:
         Args:
             packet_type: The packet type to clear
         """
-        if packet_type in self._cache:
-            del self._cache[packet_type]
+        for cache_key in [k for k in self._cache if k[0] == packet_type]:
+            del self._cache[cache_key]
+            self._snapshots.pop(cache_key, None)
 
     def __repr__(self) -> str:
         """String representation showing cache statistics."""
-        total_entries = sum(len(cache) for cache in self._cache.values())
-        return f"DeltaCache(packet_types={len(self._cache)}, total_entries={total_entries})"
+        packet_types = len({packet_type for packet_type, _ in self._cache})
+        return f"DeltaCache(packet_types={packet_types}, total_entries={len(self._cache)})"
@@ -5,11 +5,114 @@ The GameState class maintains the current state of the game as packets
 are received and processed from the server.
 """
 
+from __future__ import annotations
+
+import functools
+import sys
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+# Ruleset records are written once per ruleset load, so they are frozen (hashable,
+# safe to share) and slotted: no per-instance __dict__ (smaller records, faster
+# attribute access). dataclass(slots=True) needs Python 3.10+; older interpreters
+# fall back to regular dataclasses.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Identifier-like strings (rule names, display names, graphics and sound tags)
+# repeat across records and ruleset reloads, so record classes intern them in
+# __post_init__. Long free text (legend, helptext, ...) is kept as raw bytes
+# and only decoded when read, since the agent rarely looks at it.
+# Records are frozen, so that assignment goes through object.__setattr__.
+
+T = TypeVar("T")
+
+
+def store_by_id(table: List[Optional[T]], entity_id: int, value: T) -> None:
+    """
+    Store value at table[entity_id] in a dense ID-indexed list.
+
+    Ruleset entity IDs are contiguous from 0, so tables are plain lists with
+    None for IDs not received yet. The list is grown if entity_id is beyond
+    the size announced in PACKET_RULESET_CONTROL (or if none was received).
+    """
+    if entity_id >= len(table):
+        table.extend([None] * (entity_id + 1 - len(table)))
+    table[entity_id] = value
+
 
+class FlagTable(Generic[T]):
+    """
+    Flag names and help texts for one ruleset flag category, indexed by flag ID.
+
+    Flag packets (tech, extra, terrain, improvement, unit class and unit) carry
+    only an id, a name and a help text, so the table keeps two dense parallel
+    lists instead of one record per flag. Indexing builds a record of the
+    category's flag class (TechFlag, UnitFlag, ...) on demand.
+    """
+
+    __slots__ = ("record_type", "names", "helptxts_raw")
+
+    def __init__(self, record_type: Type[T]):
+        self.record_type = record_type
+        self.names: List[Optional[str]] = []  # None for IDs not received yet
+        self.helptxts_raw: List[bytes] = []  # Raw UTF-8 helptxt, decoded on access
+
+    def store(self, flag_id: int, name: str, helptxt_raw: bytes) -> None:
+        """Store (or replace) the definition of flag flag_id."""
+        if flag_id >= len(self.names):
+            grow = flag_id + 1 - len(self.names)
+            self.names.extend([None] * grow)
+            self.helptxts_raw.extend([b""] * grow)
+        self.names[flag_id] = sys.intern(name)
+        self.helptxts_raw[flag_id] = helptxt_raw
+
+    def name(self, flag_id: int) -> str:
+        """Return the name of flag flag_id (KeyError if not received)."""
+        if flag_id not in self:
+            raise KeyError(flag_id)
+        return self.names[flag_id]
+
+    def helptxt(self, flag_id: int) -> str:
+        """Return the decoded help text of flag flag_id (KeyError if not received)."""
+        if flag_id not in self:
+            raise KeyError(flag_id)
+        return self.helptxts_raw[flag_id].decode("utf-8")
+
+    def __contains__(self, flag_id: object) -> bool:
+        return (
+            isinstance(flag_id, int)
+            and 0 <= flag_id < len(self.names)
+            and self.names[flag_id] is not None
+        )
 
-@dataclass
+    def __getitem__(self, flag_id: int) -> T:
+        return self.record_type(
+            id=flag_id, name=self.name(flag_id), helptxt_raw=self.helptxts_raw[flag_id]
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return (flag_id for flag_id, name in enumerate(self.names) if name is not None)
+
+    def __len__(self) -> int:
+        return len(self.names) - self.names.count(None)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RulesetControl:
     """
     Ruleset configuration from PACKET_RULESET_CONTROL (packet 155).
@@ -55,8 +158,16 @@ class RulesetControl:
     desc_length: int  # UINT32
     num_counters: int  # UINT16
 
+    def __post_init__(self):
+        object.__setattr__(self, "preferred_tileset", sys.intern(self.preferred_tileset))
+        object.__setattr__(self, "preferred_soundset", sys.intern(self.preferred_soundset))
+        object.__setattr__(self, "preferred_musicset", sys.intern(self.preferred_musicset))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "version", sys.intern(self.version))
+        object.__setattr__(self, "alt_dir", sys.intern(self.alt_dir))
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class NationSet:
     """
     Represents a nation set from PACKET_RULESET_NATION_SETS (packet 236).
@@ -67,10 +178,19 @@ class NationSet:
 
     name: str  # Display name (MAX_LEN_NAME = 48 bytes)
     rule_name: str  # Internal identifier (MAX_LEN_NAME = 48 bytes)
-    description: str  # Descriptive text (MAX_LEN_MSG = 1536 bytes)
+    description_raw: bytes  # Raw UTF-8 description, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
 
+    @property
+    def description(self) -> str:
+        """Descriptive text."""
+        return self.description_raw.decode("utf-8")
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class NationGroup:
     """
     Represents a nation group from PACKET_RULESET_NATION_GROUPS (packet 147).
@@ -82,8 +202,11 @@ class NationGroup:
     name: str  # Display name (MAX_LEN_NAME = 48 bytes)
     hidden: bool  # Whether the group is hidden from player selection
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
 
-@dataclass
+@dataclass(repr=False, frozen=True, **_SLOTS)
 class Nation:
     """
     Represents a nation/civilization from PACKET_RULESET_NATION (packet 148).
@@ -99,27 +222,66 @@ class Nation:
     noun_plural: str  # Plural form (e.g., "Romans")
     graphic_str: str  # Primary graphics tag
     graphic_alt: str  # Alternative graphics tag
-    legend: str  # Descriptive text/legend
+    legend_raw: bytes  # Raw UTF-8 legend, decoded on access
     style: int  # Nation style ID
-    leader_count: int  # Number of leaders
     leader_name: List[str]  # Leader names
-    leader_is_male: List[bool]  # Leader genders (True=male)
+    leader_is_male_mask: int  # Leader genders, bit i set = leader i is male
     is_playable: bool  # Whether human players can select this nation
     barbarian_type: int  # Barbarian type (0=not barbarian)
-    nsets: int  # Number of nation sets
-    sets: List[int]  # Nation set IDs
-    ngroups: int  # Number of nation groups
-    groups: List[int]  # Nation group IDs
+    sets: Sequence[int]  # Nation set IDs (array('H'))
+    groups: Sequence[int]  # Nation group IDs (array('H'))
     init_government_id: int  # Starting government (-1=none)
-    init_techs_count: int  # Number of starting techs
-    init_techs: List[int]  # Starting technology IDs
-    init_units_count: int  # Number of starting units
-    init_units: List[int]  # Starting unit type IDs
-    init_buildings_count: int  # Number of starting buildings
-    init_buildings: List[int]  # Starting building/improvement IDs
-
-
-@dataclass
+    init_techs: Sequence[int]  # Starting technology IDs (array('H'))
+    init_units: Sequence[int]  # Starting unit type IDs (array('H'))
+    init_buildings: Sequence[int]  # Starting building/improvement IDs (array('H'))
+
+    def __post_init__(self):
+        object.__setattr__(self, "translation_domain", sys.intern(self.translation_domain))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+
+    def is_leader_male(self, idx: int) -> bool:
+        """Return True if leader idx is male."""
+        return bool((self.leader_is_male_mask >> idx) & 1)
+
+    @property
+    def leader_count(self) -> int:
+        """Number of leaders."""
+        return len(self.leader_name)
+
+    @property
+    def nsets(self) -> int:
+        """Number of nation sets."""
+        return len(self.sets)
+
+    @property
+    def ngroups(self) -> int:
+        """Number of nation groups."""
+        return len(self.groups)
+
+    @property
+    def init_techs_count(self) -> int:
+        """Number of starting techs."""
+        return len(self.init_techs)
+
+    @property
+    def init_units_count(self) -> int:
+        """Number of starting units."""
+        return len(self.init_units)
+
+    @property
+    def init_buildings_count(self) -> int:
+        """Number of starting buildings."""
+        return len(self.init_buildings)
+
+    @property
+    def legend(self) -> str:
+        """Descriptive text/legend."""
+        return self.legend_raw.decode("utf-8")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RulesetGame:
     """
     Ruleset game configuration from PACKET_RULESET_GAME (packet 141).
@@ -129,39 +291,132 @@ class RulesetGame:
     """
 
     default_specialist: int  # Default specialist type ID
-    global_init_techs_count: int  # Number of global starting techs
-    global_init_techs: List[int]  # Tech IDs given to all civilizations
-    global_init_buildings_count: int  # Number of global starting buildings
-    global_init_buildings: List[int]  # Building IDs given to all civilizations
-    veteran_levels: int  # Number of veteran levels
+    global_init_techs: Sequence[int]  # Tech IDs given to all civilizations (array('H'))
+    global_init_buildings: Sequence[int]  # Building IDs given to all civs (array('H'))
     veteran_name: List[str]  # Names for each veteran level
-    power_fact: List[int]  # Power factor for each level (UINT16)
-    move_bonus: List[int]  # Move bonus for each level (MOVEFRAGS=UINT32)
-    base_raise_chance: List[int]  # Base raise chance % for each level
-    work_raise_chance: List[int]  # Work raise chance % for each level
+    power_fact: Sequence[int]  # Power factor for each level (UINT16, array('H'))
+    move_bonus: Sequence[int]  # Move bonus for each level (MOVEFRAGS=UINT32, array('I'))
+    base_raise_chance: Sequence[int]  # Base raise chance % for each level (array('B'))
+    work_raise_chance: Sequence[int]  # Work raise chance % for each level (array('B'))
     background_red: int  # Background color red component (0-255)
     background_green: int  # Background color green component (0-255)
     background_blue: int  # Background color blue component (0-255)
 
+    def __post_init__(self):
+        object.__setattr__(self, "veteran_name", [sys.intern(n) for n in self.veteran_name])
+
+    @property
+    def global_init_techs_count(self) -> int:
+        """Number of global starting techs."""
+        return len(self.global_init_techs)
+
+    @property
+    def global_init_buildings_count(self) -> int:
+        """Number of global starting buildings."""
+        return len(self.global_init_buildings)
+
+    @property
+    def veteran_levels(self) -> int:
+        """Number of veteran levels."""
+        return len(self.veteran_name)
 
-@dataclass
+
+# Requirements are immutable and repeat heavily across a ruleset (the same tech
+# or government requirement guards many buildings, units and enablers), so
+# handlers share one instance per distinct packed value via Requirement.shared.
+_REQUIREMENT_POOL: Dict[int, Requirement] = {}
+
+
+@dataclass(init=False, repr=False, frozen=True, **_SLOTS)
 class Requirement:
     """
     Game requirement for disasters, buildings, techs, etc.
 
     Requirements specify conditions that must be met for game elements to be
     available or active. Used in multiple packet types including PACKET_RULESET_DISASTER.
+
+    Rulesets carry thousands of these, so all six fields are packed into one
+    int; equality and hashing compare that single int.
     """
 
-    type: int  # universals_n enum (VUT_*)
-    value: int  # Integer value (meaning depends on type)
-    range: int  # req_range enum
-    survives: bool  # Whether destroyed sources satisfy requirement
-    present: bool  # Whether requirement must be present (vs absent)
-    quiet: bool  # Whether to hide from help text
+    packed: int  # type, range, flags and value (see pack)
+
+    # packed bit layout: type (bits 0-7), range (bits 8-15), survives (bit 16),
+    # present (bit 17), quiet (bit 18), value (bits 32+, signed)
+    SURVIVES = 1 << 16
+    PRESENT = 1 << 17
+    QUIET = 1 << 18
+    RANGE_SHIFT = 8
+    VALUE_SHIFT = 32
+
+    def __init__(
+        self, type: int, value: int, range: int, survives: bool, present: bool, quiet: bool
+    ):
+        object.__setattr__(
+            self, "packed", Requirement.pack(type, value, range, survives, present, quiet)
+        )
+
+    @staticmethod
+    def pack(type: int, value: int, range: int, survives: bool, present: bool, quiet: bool) -> int:
+        """Pack the requirement fields into a single int."""
+        return (
+            type
+            | (range << Requirement.RANGE_SHIFT)
+            | (Requirement.SURVIVES if survives else 0)
+            | (Requirement.PRESENT if present else 0)
+            | (Requirement.QUIET if quiet else 0)
+            | (value << Requirement.VALUE_SHIFT)
+        )
+
+    @classmethod
+    def shared(
+        cls, type: int, value: int, range: int, survives: bool, present: bool, quiet: bool
+    ) -> Requirement:
+        """Return the pooled Requirement for these fields, creating it on first use."""
+        packed = cls.pack(type, value, range, survives, present, quiet)
+        req = _REQUIREMENT_POOL.get(packed)
+        if req is None:
+            req = _REQUIREMENT_POOL[packed] = cls(type, value, range, survives, present, quiet)
+        return req
+
+    @property
+    def type(self) -> int:
+        """universals_n enum (VUT_*)."""
+        return self.packed & 0xFF
+
+    @property
+    def value(self) -> int:
+        """Integer value (meaning depends on type)."""
+        return self.packed >> Requirement.VALUE_SHIFT
+
+    @property
+    def range(self) -> int:
+        """req_range enum."""
+        return (self.packed >> Requirement.RANGE_SHIFT) & 0xFF
+
+    @property
+    def survives(self) -> bool:
+        """Whether destroyed sources satisfy requirement."""
+        return bool(self.packed & Requirement.SURVIVES)
+
+    @property
+    def present(self) -> bool:
+        """Whether requirement must be present (vs absent)."""
+        return bool(self.packed & Requirement.PRESENT)
+
+    @property
+    def quiet(self) -> bool:
+        """Whether to hide from help text."""
+        return bool(self.packed & Requirement.QUIET)
+
+    def __repr__(self) -> str:
+        return (
+            f"Requirement(type={self.type}, value={self.value}, range={self.range}, "
+            f"survives={self.survives}, present={self.present}, quiet={self.quiet})"
+        )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DisasterType:
     """
     Disaster type configuration from PACKET_RULESET_DISASTER (packet 224).
@@ -173,13 +428,21 @@ class DisasterType:
     id: int  # Disaster type ID (key)
     name: str  # Display name (variable-length, null-terminated)
     rule_name: str  # Internal identifier (variable-length, null-terminated)
-    reqs_count: int  # Number of requirements
     reqs: List[Requirement]  # Requirements list
     frequency: int  # Base probability
     effects: int  # Bitvector of disaster_effect_id flags
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
 
-@dataclass
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class AchievementType:
     """
     Achievement type configuration from PACKET_RULESET_ACHIEVEMENT (packet 233).
@@ -196,8 +459,12 @@ class AchievementType:
     type: int  # Achievement type enum (ACHIEVEMENT_TYPE)
     unique: bool  # Whether only one player can achieve this
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TradeRouteType:
     """Trade route type configuration from PACKET_RULESET_TRADE (227)."""
 
@@ -207,7 +474,7 @@ class TradeRouteType:
     bonus_type: int  # Trade bonus type (TR_BONUS_TYPE enum)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Resource:
     """Resource type from PACKET_RULESET_RESOURCE (177).
 
@@ -216,10 +483,10 @@ class Resource:
     """
 
     id: int
-    output: List[int]  # Length O_LAST=6
+    output: Sequence[int]  # Length O_LAST=6 (UINT8, array('B'))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Specialist:
     """Specialist type definition from PACKET_RULESET_SPECIALIST (142).
 
@@ -233,12 +500,26 @@ class Specialist:
     short_name: str  # Abbreviated display name
     graphic_str: str  # Primary graphic tag
     graphic_alt: str  # Alternate graphic tag
-    reqs_count: int  # Number of requirements
     reqs: List[Requirement]  # Requirements for specialist availability
-    helptext: str  # Help text description
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
 
+    @property
+    def helptext(self) -> str:
+        """Help text description."""
+        return self.helptext_raw.decode("utf-8")
 
-@dataclass
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Goods:
     """Goods type from PACKET_RULESET_GOODS (248).
 
@@ -249,16 +530,29 @@ class Goods:
     id: int  # Goods type ID (key)
     name: str  # Display name
     rule_name: str  # Internal identifier
-    reqs_count: int  # Number of requirements
     reqs: List[Requirement]  # Requirements for goods availability
     from_pct: int  # Trade income % for source (0-65535)
     to_pct: int  # Trade income % for destination (0-65535)
     onetime_pct: int  # One-time bonus % (0-65535)
     flags: int  # Bitvector: bit0=Bidirectional, bit1=Depletes, bit2=Self-Provided
-    helptext: str  # Help text description
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+
+    @property
+    def helptext(self) -> str:
+        """Help text description."""
+        return self.helptext_raw.decode("utf-8")
+
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
 
 
-@dataclass
+@dataclass(repr=False, frozen=True, **_SLOTS)
 class ActionType:
     """Action type configuration from PACKET_RULESET_ACTION (246).
 
@@ -269,19 +563,61 @@ class ActionType:
 
     id: int  # Action type ID (key)
     ui_name: str  # Display name (e.g., "Establish %sEmbassy%s")
-    quiet: bool  # Whether to suppress UI notifications
+    flags: int  # Packed quiet/actor_consuming_always/kinds (see pack_flags)
     result: int  # Action result enum (ACTRES_*)
     sub_results: int  # Sub-results bitvector (success/failure conditions)
-    actor_consuming_always: bool  # Whether actor unit is always consumed
-    act_kind: int  # Actor kind enum (0=Unit, 1=Player, 2=City, 3=Tile)
-    tgt_kind: int  # Target kind enum (0=City, 1=Unit, 2=Units, 3=Tile, 4=Extras, 5=Self)
-    sub_tgt_kind: int  # Sub-target kind enum
     min_distance: int  # Minimum distance to target
     max_distance: int  # Maximum distance to target (-1 = unlimited)
     blocked_by: int  # Bitvector of blocking actions
 
+    # flags bit layout: quiet (bit 0), actor_consuming_always (bit 1),
+    # act_kind (bits 2-4), tgt_kind (bits 5-7), sub_tgt_kind (bits 8-11)
+    QUIET = 1 << 0
+    ACTOR_CONSUMING_ALWAYS = 1 << 1
+    ACT_KIND_SHIFT = 2
+    TGT_KIND_SHIFT = 5
+    SUB_TGT_KIND_SHIFT = 8
+
+    @staticmethod
+    def pack_flags(
+        quiet: bool, actor_consuming_always: bool, act_kind: int, tgt_kind: int, sub_tgt_kind: int
+    ) -> int:
+        """Pack the boolean and small enum fields into a flags int."""
+        return (
+            (ActionType.QUIET if quiet else 0)
+            | (ActionType.ACTOR_CONSUMING_ALWAYS if actor_consuming_always else 0)
+            | (act_kind << ActionType.ACT_KIND_SHIFT)
+            | (tgt_kind << ActionType.TGT_KIND_SHIFT)
+            | (sub_tgt_kind << ActionType.SUB_TGT_KIND_SHIFT)
+        )
+
+    @property
+    def quiet(self) -> bool:
+        """Whether to suppress UI notifications."""
+        return bool(self.flags & ActionType.QUIET)
+
+    @property
+    def actor_consuming_always(self) -> bool:
+        """Whether actor unit is always consumed."""
+        return bool(self.flags & ActionType.ACTOR_CONSUMING_ALWAYS)
+
+    @property
+    def act_kind(self) -> int:
+        """Actor kind enum (0=Unit, 1=Player, 2=City, 3=Tile)."""
+        return (self.flags >> ActionType.ACT_KIND_SHIFT) & 0x7
+
+    @property
+    def tgt_kind(self) -> int:
+        """Target kind enum (0=City, 1=Unit, 2=Units, 3=Tile, 4=Extras, 5=Self)."""
+        return (self.flags >> ActionType.TGT_KIND_SHIFT) & 0x7
 
-@dataclass
+    @property
+    def sub_tgt_kind(self) -> int:
+        """Sub-target kind enum."""
+        return (self.flags >> ActionType.SUB_TGT_KIND_SHIFT) & 0xF
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ActionEnabler:
     """Action enabler from PACKET_RULESET_ACTION_ENABLER (235).
 
@@ -291,13 +627,21 @@ class ActionEnabler:
     """
 
     enabled_action: int  # Action ID this enabler applies to
-    actor_reqs_count: int  # Number of actor requirements
     actor_reqs: List[Requirement]  # Requirements for the actor
-    target_reqs_count: int  # Number of target requirements
     target_reqs: List[Requirement]  # Requirements for the target
 
+    @property
+    def actor_reqs_count(self) -> int:
+        """Number of actor requirements."""
+        return len(self.actor_reqs)
+
+    @property
+    def target_reqs_count(self) -> int:
+        """Number of target requirements."""
+        return len(self.target_reqs)
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ActionAutoPerformer:
     """Automatic action configuration from PACKET_RULESET_ACTION_AUTO (252).
 
@@ -308,13 +652,21 @@ class ActionAutoPerformer:
 
     id: int  # Configuration ID
     cause: int  # enum action_auto_perf_cause (AAPC_*)
-    reqs_count: int  # Number of requirements
     reqs: List[Requirement]  # Requirements that must be met
-    alternatives_count: int  # Number of alternative actions
     alternatives: List[int]  # Alternative action IDs (tried in order)
 
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
+
+    @property
+    def alternatives_count(self) -> int:
+        """Number of alternative actions."""
+        return len(self.alternatives)
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ClauseType:
     """Diplomatic clause type configuration from PACKET_RULESET_CLAUSE (512).
 
@@ -324,13 +676,21 @@ class ClauseType:
 
     type: int  # Clause type enum (0=Advance, 1=Gold, 2=Map, 3=Seamap, 4=City, 5=Ceasefire, 6=Peace, 7=Alliance, 8=Vision, 9=Embassy, 10=SharedTiles)
     enabled: bool  # Whether this clause type is enabled in the ruleset
-    giver_reqs_count: int  # Number of requirements for the giver
     giver_reqs: List[Requirement]  # Requirements the giver must meet
-    receiver_reqs_count: int  # Number of requirements for the receiver
     receiver_reqs: List[Requirement]  # Requirements the receiver must meet
 
+    @property
+    def giver_reqs_count(self) -> int:
+        """Number of giver requirements."""
+        return len(self.giver_reqs)
+
+    @property
+    def receiver_reqs_count(self) -> int:
+        """Number of receiver requirements."""
+        return len(self.receiver_reqs)
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TechFlag:
     """Technology flag from PACKET_RULESET_TECH_FLAG (234).
 
@@ -340,10 +700,18 @@ class TechFlag:
 
     id: int  # Technology flag ID (key)
     name: str  # Flag name
-    helptxt: str  # Help text describing the flag
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
 
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag."""
+        return self.helptxt_raw.decode("utf-8")
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ExtraFlag:
     """
     Extra flag from PACKET_RULESET_EXTRA_FLAG (packet 226).
@@ -356,10 +724,18 @@ class ExtraFlag:
 
     id: int  # Extra flag identifier
     name: str  # Flag name (MAX_LEN_NAME)
-    helptxt: str  # Help text describing the flag's effect (MAX_LEN_PACKET)
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag's effect."""
+        return self.helptxt_raw.decode("utf-8")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TerrainFlag:
     """Terrain flag from PACKET_RULESET_TERRAIN_FLAG (231).
 
@@ -371,10 +747,18 @@ class TerrainFlag:
 
     id: int  # Terrain flag identifier (UINT8)
     name: str  # Flag name (MAX_LEN_NAME)
-    helptxt: str  # Help text describing the flag's effect (MAX_LEN_PACKET)
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag's effect."""
+        return self.helptxt_raw.decode("utf-8")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ImprFlag:
     """Improvement flag from PACKET_RULESET_IMPR_FLAG (20).
 
@@ -384,10 +768,18 @@ class ImprFlag:
 
     id: int  # Improvement flag identifier (UINT8)
     name: str  # Flag name (MAX_LEN_NAME)
-    helptxt: str  # Help text describing the flag's effect (MAX_LEN_PACKET)
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
 
-@dataclass
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag's effect."""
+        return self.helptxt_raw.decode("utf-8")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Style:
     """Style from PACKET_RULESET_STYLE (239).
 
@@ -399,8 +791,12 @@ class Style:
     name: str  # Display name (MAX_LEN_NAME)
     rule_name: str  # Rule reference name (MAX_LEN_NAME)
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class MusicStyle:
     """Music style from PACKET_RULESET_MUSIC (240).
 
@@ -412,11 +808,15 @@ class MusicStyle:
     id: int  # Music style identifier (UINT8)
     music_peaceful: str  # Peaceful music track name (MAX_LEN_NAME)
     music_combat: str  # Combat music track name (MAX_LEN_NAME)
-    reqs_count: int  # Number of requirements (UINT8)
     reqs: List["Requirement"]  # Requirements for style activation
 
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RulesetEffect:
     """Effect definition from PACKET_RULESET_EFFECT (175).
 
@@ -428,11 +828,15 @@ class RulesetEffect:
     effect_value: int  # Signed value (meaning depends on effect_type)
     has_multiplier: bool  # Whether this effect uses a multiplier
     multiplier: int  # Multiplier ID (meaningful only if has_multiplier=True)
-    reqs_count: int  # Number of requirements
     reqs: List["Requirement"]  # Requirements for effect activation
 
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Building:
     """Building/improvement type from PACKET_RULESET_BUILDING (150).
 
@@ -448,9 +852,7 @@ class Building:
     graphic_str: str  # Primary graphics tag
     graphic_alt: str  # Alternative graphics tag
     graphic_alt2: str  # Second alternative graphics tag
-    reqs_count: int  # Number of build requirements
     reqs: List["Requirement"]  # Requirements to build
-    obs_count: int  # Number of obsolescence requirements
     obs_reqs: List["Requirement"]  # Requirements that obsolete this building
     build_cost: int  # Production cost to build
     upkeep: int  # Gold upkeep per turn
@@ -459,10 +861,35 @@ class Building:
     soundtag: str  # Primary sound tag
     soundtag_alt: str  # Alternative sound tag
     soundtag_alt2: str  # Second alternative sound tag
-    helptext: str  # Help text description
-
-
-@dataclass
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+        object.__setattr__(self, "graphic_alt2", sys.intern(self.graphic_alt2))
+        object.__setattr__(self, "soundtag", sys.intern(self.soundtag))
+        object.__setattr__(self, "soundtag_alt", sys.intern(self.soundtag_alt))
+        object.__setattr__(self, "soundtag_alt2", sys.intern(self.soundtag_alt2))
+
+    @property
+    def helptext(self) -> str:
+        """Help text description."""
+        return self.helptext_raw.decode("utf-8")
+
+    @property
+    def reqs_count(self) -> int:
+        """Number of build requirements."""
+        return len(self.reqs)
+
+    @property
+    def obs_count(self) -> int:
+        """Number of obsolescence requirements."""
+        return len(self.obs_reqs)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CityStyle:
     """City graphical style from PACKET_RULESET_CITY (149).
 
@@ -477,13 +904,24 @@ class CityStyle:
     name: str  # Display name (MAX_LEN_NAME)
     rule_name: str  # Rule reference name (MAX_LEN_NAME)
     citizens_graphic: str  # Citizens sprite tag (MAX_LEN_NAME)
-    reqs_count: int  # Number of requirements (UINT8)
     reqs: List["Requirement"]  # Build requirements
     graphic: str  # Primary city graphics tag (MAX_LEN_NAME)
     graphic_alt: str  # Alternative graphics tag (MAX_LEN_NAME)
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "citizens_graphic", sys.intern(self.citizens_graphic))
+        object.__setattr__(self, "graphic", sys.intern(self.graphic))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ExtraType:
     """
     Extra type from PACKET_RULESET_EXTRA (232).
@@ -514,21 +952,17 @@ class ExtraType:
     graphic_alt: str
 
     # Build requirements
-    reqs_count: int
     reqs: List["Requirement"]
 
     # Removal requirements
-    rmreqs_count: int
     rmreqs: List["Requirement"]
 
     # Appearance
     appearance_chance: int
-    appearance_reqs_count: int
     appearance_reqs: List["Requirement"]
 
     # Disappearance
     disappearance_chance: int
-    disappearance_reqs_count: int
     disappearance_reqs: List["Requirement"]
 
     # Visibility
@@ -560,10 +994,47 @@ class ExtraType:
     no_aggr_near_city: int  # SINT8
 
     # Help text
-    helptext: str
-
-
-@dataclass
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "activity_gfx", sys.intern(self.activity_gfx))
+        object.__setattr__(self, "act_gfx_alt", sys.intern(self.act_gfx_alt))
+        object.__setattr__(self, "act_gfx_alt2", sys.intern(self.act_gfx_alt2))
+        object.__setattr__(self, "rmact_gfx", sys.intern(self.rmact_gfx))
+        object.__setattr__(self, "rmact_gfx_alt", sys.intern(self.rmact_gfx_alt))
+        object.__setattr__(self, "rmact_gfx_alt2", sys.intern(self.rmact_gfx_alt2))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+
+    @property
+    def helptext(self) -> str:
+        """Help text."""
+        return self.helptext_raw.decode("utf-8")
+
+    @property
+    def reqs_count(self) -> int:
+        """Number of build requirements."""
+        return len(self.reqs)
+
+    @property
+    def rmreqs_count(self) -> int:
+        """Number of removal requirements."""
+        return len(self.rmreqs)
+
+    @property
+    def appearance_reqs_count(self) -> int:
+        """Number of appearance requirements."""
+        return len(self.appearance_reqs)
+
+    @property
+    def disappearance_reqs_count(self) -> int:
+        """Number of disappearance requirements."""
+        return len(self.disappearance_reqs)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class UnitClassFlag:
     """Unit class flag from PACKET_RULESET_UNIT_CLASS_FLAG (230).
 
@@ -573,10 +1044,18 @@ class UnitClassFlag:
 
     id: int  # Unit class flag ID (key)
     name: str  # Flag name
-    helptxt: str  # Help text describing the flag
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag."""
+        return self.helptxt_raw.decode("utf-8")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class UnitFlag:
     """Unit flag from PACKET_RULESET_UNIT_FLAG (229).
 
@@ -586,10 +1065,18 @@ class UnitFlag:
 
     id: int  # Unit flag ID
     name: str  # Flag name
-    helptxt: str  # Help text describing the flag
+    helptxt_raw: bytes  # Raw UTF-8 helptxt, decoded on access
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
 
-@dataclass
+    @property
+    def helptxt(self) -> str:
+        """Help text describing the flag."""
+        return self.helptxt_raw.decode("utf-8")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class UnitBonus:
     """
     Represents a unit combat bonus from PACKET_RULESET_UNIT_BONUS (packet 228).
@@ -606,7 +1093,7 @@ class UnitBonus:
     quiet: bool  # If true, don't show bonus in UI help text
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class UnitClass:
     """Unit class from PACKET_RULESET_UNIT_CLASS (152).
 
@@ -621,10 +1108,19 @@ class UnitClass:
     hp_loss_pct: int  # HP loss percentage (0-100)
     non_native_def_pct: int  # Defense penalty on non-native terrain (0-65535)
     flags: int  # Bitvector of unit class flags (32 bits)
-    helptext: str  # Descriptive help text
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
 
+    @property
+    def helptext(self) -> str:
+        """Descriptive help text."""
+        return self.helptext_raw.decode("utf-8")
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class BaseType:
     """Base type from PACKET_RULESET_BASE (153).
 
@@ -640,7 +1136,7 @@ class BaseType:
     vision_subs_sq: int  # Vision radius for submarines (squared)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RoadType:
     """Road type from PACKET_RULESET_ROAD (220).
 
@@ -650,21 +1146,25 @@ class RoadType:
 
     id: int  # Road type identifier
     gui_type: int  # GUI type: 0=Road, 1=Railroad, 2=Maglev, 3=Other
-    first_reqs_count: int  # Number of build requirements
     first_reqs: List[Requirement]  # Requirements to build this road
     move_cost: int  # Movement cost (-1 = no effect)
     move_mode: int  # 0=Cardinal, 1=Relaxed, 2=FastAlways
-    tile_incr_const: List[
+    tile_incr_const: Sequence[
         int
-    ]  # Constant tile output increment [Food, Shield, Trade, Gold, Luxury, Science]
-    tile_incr: List[int]  # Percentage tile output increment [O_LAST=6]
-    tile_bonus: List[int]  # Tile output bonus [O_LAST=6]
+    ]  # Constant tile output increment [Food, Shield, Trade, Gold, Luxury, Science] (array('H'))
+    tile_incr: Sequence[int]  # Percentage tile output increment [O_LAST=6] (array('H'))
+    tile_bonus: Sequence[int]  # Tile output bonus [O_LAST=6] (array('H'))
     compat: int  # Compatibility: 0=Road, 1=Railroad, 2=River, 3=None
     integrates: int  # Bitvector (250 bits) of extras this integrates with
     flags: int  # Bitvector (4 bits) of road flags
 
+    @property
+    def first_reqs_count(self) -> int:
+        """Number of build requirements."""
+        return len(self.first_reqs)
+
 
-@dataclass
+@dataclass(repr=False, frozen=True, **_SLOTS)
 class Tech:
     """Technology from PACKET_RULESET_TECH (144).
 
@@ -673,7 +1173,6 @@ class Tech:
 
     id: int
     root_req: int
-    research_reqs_count: int
     research_reqs: List[Requirement]
     tclass: int
     removed: bool
@@ -682,17 +1181,32 @@ class Tech:
     num_reqs: int
     name: str
     rule_name: str
-    helptext: str
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
     graphic_str: str
     graphic_alt: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
 
-@dataclass
+    @property
+    def research_reqs_count(self) -> int:
+        """Number of research requirements."""
+        return len(self.research_reqs)
+
+    @property
+    def helptext(self) -> str:
+        """Help text."""
+        return self.helptext_raw.decode("utf-8")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Government:
     """Government type from PACKET_RULESET_GOVERNMENT (145)."""
 
     id: int
-    reqs_count: int
     reqs: List[Requirement]
     name: str
     rule_name: str
@@ -701,10 +1215,29 @@ class Government:
     sound_str: str
     sound_alt: str
     sound_alt2: str
-    helptext: str
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+        object.__setattr__(self, "sound_str", sys.intern(self.sound_str))
+        object.__setattr__(self, "sound_alt", sys.intern(self.sound_alt))
+        object.__setattr__(self, "sound_alt2", sys.intern(self.sound_alt2))
+
+    @property
+    def reqs_count(self) -> int:
+        """Number of requirements."""
+        return len(self.reqs)
 
+    @property
+    def helptext(self) -> str:
+        """Help text."""
+        return self.helptext_raw.decode("utf-8")
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TerrainControl:
     """Terrain control settings from PACKET_RULESET_TERRAIN_CONTROL (146)."""
 
@@ -722,7 +1255,7 @@ class TerrainControl:
     gui_type_base1: str  # GUI type base 1 name
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class GovernmentRulerTitle:
     """Ruler title for government/nation combination from PACKET_RULESET_GOVERNMENT_RULER_TITLE (143)."""
 
@@ -732,7 +1265,7 @@ class GovernmentRulerTitle:
     female_title: str  # Female ruler title (e.g., "Queen", "Empress")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class UnitType:
     """Unit type from PACKET_RULESET_UNIT (140)."""
 
@@ -755,7 +1288,9 @@ class UnitType:
     build_cost: int
     pop_cost: int
     happy_cost: int
-    upkeep: List[int]  # Length O_LAST (6): FOOD, SHIELD, TRADE, GOLD, LUXURY, SCIENCE
+    upkeep: Sequence[
+        int
+    ]  # Length O_LAST (6): FOOD, SHIELD, TRADE, GOLD, LUXURY, SCIENCE (array('B'))
 
     # Combat stats
     attack_strength: int
@@ -768,7 +1303,6 @@ class UnitType:
     fuel: int
 
     # Requirements
-    build_reqs_count: int
     build_reqs: List[Requirement]
 
     # Vision and transport
@@ -795,12 +1329,11 @@ class UnitType:
     vlayer: int  # Enum (vision_layer)
 
     # Veteran system
-    veteran_levels: int
     veteran_name: List[str]
-    power_fact: List[int]  # UINT16
-    move_bonus: List[int]  # UINT32
-    base_raise_chance: List[int]  # UINT8
-    work_raise_chance: List[int]  # UINT8
+    power_fact: Sequence[int]  # UINT16, array('H')
+    move_bonus: Sequence[int]  # UINT32, array('I')
+    base_raise_chance: Sequence[int]  # UINT8, array('B')
+    work_raise_chance: Sequence[int]  # UINT8, array('B')
 
     # Flags and abilities
     flags: int  # Bitvector (BV_UTYPE_FLAGS)
@@ -808,10 +1341,38 @@ class UnitType:
     worker: bool
 
     # Help text
-    helptext: str
-
-
-@dataclass
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+        object.__setattr__(self, "graphic_alt2", sys.intern(self.graphic_alt2))
+        object.__setattr__(self, "sound_move", sys.intern(self.sound_move))
+        object.__setattr__(self, "sound_move_alt", sys.intern(self.sound_move_alt))
+        object.__setattr__(self, "sound_fight", sys.intern(self.sound_fight))
+        object.__setattr__(self, "sound_fight_alt", sys.intern(self.sound_fight_alt))
+        # Veteran level names ("green", "veteran", ...) repeat across unit types
+        object.__setattr__(self, "veteran_name", [sys.intern(n) for n in self.veteran_name])
+
+    @property
+    def helptext(self) -> str:
+        """Help text."""
+        return self.helptext_raw.decode("utf-8")
+
+    @property
+    def build_reqs_count(self) -> int:
+        """Number of build requirements."""
+        return len(self.build_reqs)
+
+    @property
+    def veteran_levels(self) -> int:
+        """Number of veteran levels."""
+        return len(self.veteran_name)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Terrain:
     """Terrain type from PACKET_RULESET_TERRAIN (151)."""
 
@@ -835,15 +1396,14 @@ class Terrain:
     defense_bonus: int  # SINT16, can be negative
 
     # Production (6 outputs: FOOD, SHIELD, TRADE, GOLD, LUXURY, SCIENCE)
-    output: List[int]  # Length O_LAST (6), each UINT8
+    output: Sequence[int]  # Length O_LAST (6), each UINT8 (array('B'))
 
     # Resources
-    num_resources: int
-    resources: List[int]  # Resource IDs (UINT8), length num_resources
-    resource_freq: List[int]  # UINT8, length num_resources
+    resources: List[int]  # Resource IDs (UINT8)
+    resource_freq: List[int]  # UINT8, parallel to resources
 
     # Road/base improvements
-    road_output_incr_pct: List[int]  # Length O_LAST (6), each UINT16
+    road_output_incr_pct: Sequence[int]  # Length O_LAST (6), each UINT16 (array('H'))
     base_time: int
     road_time: int
 
@@ -863,8 +1423,7 @@ class Terrain:
     pillage_time: int
 
     # Extras
-    extra_count: int
-    extra_removal_times: List[int]  # UINT8, length extra_count
+    extra_removal_times: List[int]  # UINT8, one per extra
 
     # Appearance
     color_red: int
@@ -872,51 +1431,174 @@ class Terrain:
     color_blue: int
 
     # Help
-    helptext: str
+    helptext_raw: bytes  # Raw UTF-8 helptext, decoded on access
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "rule_name", sys.intern(self.rule_name))
+        object.__setattr__(self, "graphic_str", sys.intern(self.graphic_str))
+        object.__setattr__(self, "graphic_alt", sys.intern(self.graphic_alt))
+        object.__setattr__(self, "graphic_alt2", sys.intern(self.graphic_alt2))
 
-class GameState:
-    """Tracks the current game state as packets are processed."""
+    @property
+    def helptext(self) -> str:
+        """Help text."""
+        return self.helptext_raw.decode("utf-8")
+
+    @property
+    def num_resources(self) -> int:
+        """Number of resources."""
+        return len(self.resources)
+
+    @property
+    def extra_count(self) -> int:
+        """Number of extras with removal times."""
+        return len(self.extra_removal_times)
+
+
+# universals_n value of a technology requirement (Requirement.type)
+VUT_ADVANCE = 1
+
+# Derived ruleset queries are memoized per RulesetBundle; past this many
+# entries the cache is simply emptied (AI search can ask about many tech sets)
+_QUERY_CACHE_SIZE = 4096
+
+
+def _cached_query(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memoize a RulesetBundle query on (query name, args).
+
+    The cache lives on the bundle, so it is dropped together with the ruleset
+    it was computed from; _invalidate_rule_caches() empties it. Until the
+    ruleset burst has finished (_mark_loaded()) results are computed but not
+    stored, since handlers are still adding entries. Arguments must be
+    hashable and results immutable (tuples), since they are shared.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "RulesetBundle", *args: Any) -> T:
+        if not self._queries_cacheable:
+            return method(self, *args)
+        key = (name, args)
+        cache = self._query_cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        if len(cache) >= _QUERY_CACHE_SIZE:
+            cache.clear()
+        result = cache[key] = method(self, *args)
+        return result
+
+    return wrapper
+
+
+class RulesetBundle:
+    """
+    Ruleset data sent by the server during the ruleset burst (PACKET_RULESET_*).
+
+    Each PACKET_RULESET_CONTROL starts a fresh bundle, which the ruleset
+    handlers fill in place; once PACKET_RULESETS_READY arrives it is only read.
+    GameState holds the bundle by reference, so rollout clones share it
+    instead of copying the whole ruleset.
+    """
+
+    # Fixed attribute set: no per-instance __dict__, and handlers cannot
+    # silently create misspelled attributes
+    __slots__ = (
+        "ruleset_control",
+        "terrain_control",
+        "terrains",
+        "ruleset_summary",
+        "ruleset_description_buf",
+        "ruleset_description",
+        "_description_progress_pct",
+        "nation_set_names",
+        "nation_set_rule_names",
+        "nation_set_descriptions_raw",
+        "nation_group_names",
+        "nation_groups_hidden",
+        "nations",
+        "ruleset_game",
+        "disasters",
+        "trade_routes",
+        "resources",
+        "achievements",
+        "specialists",
+        "goods",
+        "actions",
+        "action_enablers",
+        "clause_types",
+        "action_auto_performers",
+        "tech_flags",
+        "extra_flags",
+        "extras",
+        "unit_class_flags",
+        "unit_flags",
+        "unit_bonuses",
+        "unit_classes",
+        "base_types",
+        "road_types",
+        "techs",
+        "governments",
+        "government_ruler_titles",
+        "unit_types",
+        "terrain_flags",
+        "improvement_flags",
+        "styles",
+        "music_styles",
+        "effects",
+        "buildings",
+        "city_styles",
+        "_unit_by_rule_name",
+        "_terrain_by_rule_name",
+        "_building_by_rule_name",
+        "_extra_by_rule_name",
+        "_query_cache",
+        "_queries_cacheable",
+    )
 
     def __init__(self):
-        """Initialize a new game state with default values."""
-        self.server_info = None
-        self.game_info: Optional[Dict[str, Any]] = None  # Game state information (PACKET_GAME_INFO)
-        self.chat_history = []  # List of chat message dicts with timestamps
+        """Initialize an empty ruleset."""
         self.ruleset_control: Optional[RulesetControl] = (
             None  # Ruleset configuration (PACKET_RULESET_CONTROL)
         )
         self.terrain_control: Optional[TerrainControl] = (
             None  # Terrain control settings (PACKET_RULESET_TERRAIN_CONTROL)
         )
-        self.terrains: Dict[int, Terrain] = {}  # Terrain types by ID (PACKET_RULESET_TERRAIN)
+        self.terrains: List[Optional[Terrain]] = []  # Terrain types by ID (PACKET_RULESET_TERRAIN)
         self.ruleset_summary: Optional[str] = None  # Ruleset summary text (PACKET_RULESET_SUMMARY)
-        self.ruleset_description_parts: List[str] = []  # Accumulator for description chunks
+        self.ruleset_description_buf: bytearray = bytearray()  # Raw UTF-8 description chunks
         self.ruleset_description: Optional[str] = None  # Complete assembled description
-        self.nation_sets: List[NationSet] = []  # Available nation sets (PACKET_RULESET_NATION_SETS)
-        self.nation_groups: List[NationGroup] = (
-            []
-        )  # Available nation groups (PACKET_RULESET_NATION_GROUPS)
-        self.nations: Dict[int, Nation] = {}  # Nations by ID (PACKET_RULESET_NATION)
-        self.nation_availability: Optional[Dict[str, Any]] = (
-            None  # Nation availability tracking (PACKET_NATION_AVAILABILITY)
-        )
+        self._description_progress_pct: int = -100  # Last description progress % printed
+        # Nation sets and groups are stored as parallel arrays indexed by set/group
+        # ID (PACKET_RULESET_NATION_SETS / PACKET_RULESET_NATION_GROUPS); the
+        # nation_sets / nation_groups properties materialize record views
+        self.nation_set_names: Tuple[str, ...] = ()
+        self.nation_set_rule_names: Tuple[str, ...] = ()
+        self.nation_set_descriptions_raw: Tuple[bytes, ...] = ()
+        self.nation_group_names: Tuple[str, ...] = ()
+        self.nation_groups_hidden: int = 0  # Bit g set = group g hidden from selection
+        self.nations: List[Optional[Nation]] = []  # Nations by ID (PACKET_RULESET_NATION)
         self.ruleset_game: Optional[RulesetGame] = (
             None  # Core game configuration (PACKET_RULESET_GAME)
         )
-        self.disasters: Dict[int, DisasterType] = {}  # Disasters by ID (PACKET_RULESET_DISASTER)
-        self.trade_routes: Dict[int, TradeRouteType] = (
-            {}
+        self.disasters: List[Optional[DisasterType]] = (
+            []
+        )  # Disasters by ID (PACKET_RULESET_DISASTER)
+        self.trade_routes: List[Optional[TradeRouteType]] = (
+            []
         )  # Trade routes by ID (PACKET_RULESET_TRADE)
         self.resources: Dict[int, Resource] = {}  # Resources by ID (PACKET_RULESET_RESOURCE)
-        self.achievements: Dict[int, AchievementType] = (
-            {}
+        self.achievements: List[Optional[AchievementType]] = (
+            []
         )  # Achievements by ID (PACKET_RULESET_ACHIEVEMENT)
-        self.specialists: Dict[int, Specialist] = (
-            {}
+        self.specialists: List[Optional[Specialist]] = (
+            []
         )  # Specialists by ID (PACKET_RULESET_SPECIALIST)
-        self.goods: Dict[int, Goods] = {}  # Goods by ID (PACKET_RULESET_GOODS)
-        self.actions: Dict[int, ActionType] = {}  # Actions by ID (PACKET_RULESET_ACTION)
+        self.goods: List[Optional[Goods]] = []  # Goods by ID (PACKET_RULESET_GOODS)
+        self.actions: List[Optional[ActionType]] = []  # Actions by ID (PACKET_RULESET_ACTION)
         self.action_enablers: List[ActionEnabler] = (
             []
         )  # Action enablers (PACKET_RULESET_ACTION_ENABLER)
@@ -924,42 +1606,273 @@ class GameState:
         self.action_auto_performers: List[ActionAutoPerformer] = (
             []
         )  # Auto action configs (PACKET_RULESET_ACTION_AUTO)
-        self.tech_flags: Dict[int, TechFlag] = (
-            {}
+        self.tech_flags: FlagTable[TechFlag] = FlagTable(
+            TechFlag
         )  # Technology flags by ID (PACKET_RULESET_TECH_FLAG)
-        self.extra_flags: Dict[int, ExtraFlag] = {}  # Extra flags by ID (PACKET_RULESET_EXTRA_FLAG)
-        self.extras: Dict[int, ExtraType] = {}  # Extras by ID (PACKET_RULESET_EXTRA)
-        self.unit_class_flags: Dict[int, UnitClassFlag] = (
-            {}
+        self.extra_flags: FlagTable[ExtraFlag] = FlagTable(
+            ExtraFlag
+        )  # Extra flags by ID (PACKET_RULESET_EXTRA_FLAG)
+        self.extras: List[Optional[ExtraType]] = []  # Extras by ID (PACKET_RULESET_EXTRA)
+        self.unit_class_flags: FlagTable[UnitClassFlag] = FlagTable(
+            UnitClassFlag
         )  # Unit class flags by ID (PACKET_RULESET_UNIT_CLASS_FLAG)
-        self.unit_flags: Dict[int, UnitFlag] = {}  # Unit flags by ID (PACKET_RULESET_UNIT_FLAG)
+        self.unit_flags: FlagTable[UnitFlag] = FlagTable(
+            UnitFlag
+        )  # Unit flags by ID (PACKET_RULESET_UNIT_FLAG)
         self.unit_bonuses: List[UnitBonus] = (
             []
         )  # Combat bonuses by unit/flag combinations (PACKET_RULESET_UNIT_BONUS)
-        self.unit_classes: Dict[int, UnitClass] = (
-            {}
+        self.unit_classes: List[Optional[UnitClass]] = (
+            []
         )  # Unit classes by ID (PACKET_RULESET_UNIT_CLASS)
         self.base_types: Dict[int, BaseType] = {}  # Base types by ID (PACKET_RULESET_BASE)
         self.road_types: Dict[int, RoadType] = {}  # Road types by ID (PACKET_RULESET_ROAD)
-        self.techs: Dict[int, Tech] = {}  # Technologies by ID (PACKET_RULESET_TECH)
-        self.governments: Dict[int, Government] = (
-            {}
+        self.techs: List[Optional[Tech]] = []  # Technologies by ID (PACKET_RULESET_TECH)
+        self.governments: List[Optional[Government]] = (
+            []
         )  # Governments by ID (PACKET_RULESET_GOVERNMENT)
         self.government_ruler_titles: List[GovernmentRulerTitle] = (
             []
         )  # Ruler titles (PACKET_RULESET_GOVERNMENT_RULER_TITLE)
-        self.unit_types: Dict[int, UnitType] = {}  # Unit types by ID (PACKET_RULESET_UNIT)
-        self.terrain_flags: Dict[int, TerrainFlag] = (
-            {}
+        self.unit_types: List[Optional[UnitType]] = []  # Unit types by ID (PACKET_RULESET_UNIT)
+        self.terrain_flags: FlagTable[TerrainFlag] = FlagTable(
+            TerrainFlag
         )  # Terrain flags by ID (PACKET_RULESET_TERRAIN_FLAG)
-        self.improvement_flags: Dict[int, ImprFlag] = (
-            {}
+        self.improvement_flags: FlagTable[ImprFlag] = FlagTable(
+            ImprFlag
         )  # Improvement flags by ID (PACKET_RULESET_IMPR_FLAG)
-        self.styles: Dict[int, Style] = {}  # Styles by ID (PACKET_RULESET_STYLE)
-        self.music_styles: Dict[int, MusicStyle] = {}  # Music styles by ID (PACKET_RULESET_MUSIC)
+        self.styles: List[Optional[Style]] = []  # Styles by ID (PACKET_RULESET_STYLE)
+        self.music_styles: List[Optional[MusicStyle]] = (
+            []
+        )  # Music styles by ID (PACKET_RULESET_MUSIC)
         self.effects: List[RulesetEffect] = []  # Effects list (PACKET_RULESET_EFFECT)
-        self.buildings: Dict[int, Building] = (
-            {}
+        self.buildings: List[Optional[Building]] = (
+            []
         )  # Buildings/improvements by ID (PACKET_RULESET_BUILDING)
-        self.city_styles: Dict[int, CityStyle] = {}  # City styles by ID (PACKET_RULESET_CITY)
+        self.city_styles: List[Optional[CityStyle]] = []  # City styles by ID (PACKET_RULESET_CITY)
+        # Reverse indexes rule_name -> ID, filled by handlers or on first lookup
+        self._unit_by_rule_name: Dict[str, int] = {}
+        self._terrain_by_rule_name: Dict[str, int] = {}
+        self._building_by_rule_name: Dict[str, int] = {}
+        self._extra_by_rule_name: Dict[str, int] = {}
+        # Memoized derived queries (see _cached_query)
+        self._query_cache: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+        self._queries_cacheable = False  # Set once PACKET_RULESETS_READY arrives
+
+    @classmethod
+    def from_control(cls, rc: RulesetControl) -> "RulesetBundle":
+        """Start the bundle for a new ruleset announced by PACKET_RULESET_CONTROL."""
+        bundle = cls()
+        bundle.ruleset_control = rc
+        bundle._allocate_from_control(rc)
+        return bundle
+
+    @property
+    def nation_sets(self) -> List[NationSet]:
+        """Available nation sets as NationSet records (built on access)."""
+        return [
+            NationSet(name=name, rule_name=rule_name, description_raw=description_raw)
+            for name, rule_name, description_raw in zip(
+                self.nation_set_names, self.nation_set_rule_names, self.nation_set_descriptions_raw
+            )
+        ]
+
+    @nation_sets.setter
+    def nation_sets(self, nation_sets: List[NationSet]) -> None:
+        self.nation_set_names = tuple(s.name for s in nation_sets)
+        self.nation_set_rule_names = tuple(s.rule_name for s in nation_sets)
+        self.nation_set_descriptions_raw = tuple(s.description_raw for s in nation_sets)
+
+    @property
+    def nation_groups(self) -> List[NationGroup]:
+        """Available nation groups as NationGroup records (built on access)."""
+        return [
+            NationGroup(name=name, hidden=self.is_nation_group_hidden(i))
+            for i, name in enumerate(self.nation_group_names)
+        ]
+
+    @nation_groups.setter
+    def nation_groups(self, nation_groups: List[NationGroup]) -> None:
+        self.nation_group_names = tuple(g.name for g in nation_groups)
+        self.nation_groups_hidden = sum(1 << i for i, g in enumerate(nation_groups) if g.hidden)
+
+    def is_nation_group_hidden(self, group_id: int) -> bool:
+        """Return True if nation group group_id is hidden from player selection."""
+        return bool((self.nation_groups_hidden >> group_id) & 1)
+
+    def _allocate_from_control(self, rc: RulesetControl) -> None:
+        """Pre-size dense ID tables for entities whose count the ruleset announces.
+
+        PACKET_RULESET_CONTROL arrives before the ruleset burst, so the tables
+        are allocated once instead of growing entry-by-entry. Tables without a
+        count in RulesetControl (actions, trade routes) still grow via store_by_id.
+        Resources, bases and roads are keyed by extra ID, so those stay dicts;
+        flag tables have no announced count and grow as flags arrive.
+        """
+        self.nations = [None] * rc.nation_count
+        self.disasters = [None] * rc.num_disaster_types
+        self.achievements = [None] * rc.num_achievement_types
+        self.techs = [None] * rc.num_tech_types
+        self.governments = [None] * rc.government_count
+        self.terrains = [None] * rc.terrain_count
+        self.specialists = [None] * rc.num_specialist_types
+        self.goods = [None] * rc.num_goods_types
+        self.extras = [None] * rc.num_extra_types
+        self.unit_classes = [None] * rc.num_unit_classes
+        self.unit_types = [None] * rc.num_unit_types
+        self.styles = [None] * rc.num_styles
+        self.music_styles = [None] * rc.num_music_styles
+        self.buildings = [None] * rc.num_impr_types
+        self.city_styles = [None] * rc.num_city_styles
+        self._invalidate_rule_caches()
+
+    def _invalidate_rule_caches(self) -> None:
+        """Drop the rule_name reverse indexes and memoized queries (tables changed)."""
+        self._unit_by_rule_name.clear()
+        self._terrain_by_rule_name.clear()
+        self._building_by_rule_name.clear()
+        self._extra_by_rule_name.clear()
+        self._query_cache.clear()
+
+    def _mark_loaded(self) -> None:
+        """Ruleset burst finished: drop partial derived data and start memoizing queries."""
+        self._invalidate_rule_caches()
+        self._queries_cacheable = True
+
+    @staticmethod
+    def _id_by_rule_name(index: Dict[str, int], table: List[Any], rule_name: str) -> Optional[int]:
+        """Look up rule_name in index, building it from table on first use."""
+        if not index:
+            for entity in table:
+                if entity is not None:
+                    index[entity.rule_name] = entity.id
+        return index.get(rule_name)
+
+    def unit_id_by_rule_name(self, rule_name: str) -> Optional[int]:
+        """Return the unit type ID for rule_name (e.g. "Settlers"), or None."""
+        return self._id_by_rule_name(self._unit_by_rule_name, self.unit_types, rule_name)
+
+    def terrain_id_by_rule_name(self, rule_name: str) -> Optional[int]:
+        """Return the terrain ID for rule_name (e.g. "Grassland"), or None."""
+        return self._id_by_rule_name(self._terrain_by_rule_name, self.terrains, rule_name)
+
+    def building_id_by_rule_name(self, rule_name: str) -> Optional[int]:
+        """Return the building ID for rule_name (e.g. "Granary"), or None."""
+        return self._id_by_rule_name(self._building_by_rule_name, self.buildings, rule_name)
+
+    def extra_id_by_rule_name(self, rule_name: str) -> Optional[int]:
+        """Return the extra ID for rule_name (e.g. "Irrigation"), or None."""
+        return self._id_by_rule_name(self._extra_by_rule_name, self.extras, rule_name)
+
+    @_cached_query
+    def extras_hidden_by(self, extra_id: int) -> Tuple[int, ...]:
+        """Return the IDs of extras that extra_id hides (their hidden_by has its bit set)."""
+        return tuple(
+            extra.id
+            for extra in self.extras
+            if extra is not None and (extra.hidden_by >> extra_id) & 1
+        )
+
+    @staticmethod
+    def _tech_reqs_met(reqs: Sequence[Requirement], known_techs: FrozenSet[int]) -> bool:
+        """Return True if every present tech requirement in reqs is in known_techs."""
+        return all(
+            req.value in known_techs for req in reqs if req.type == VUT_ADVANCE and req.present
+        )
+
+    @_cached_query
+    def unit_types_buildable_with(self, known_techs: FrozenSet[int]) -> Tuple[int, ...]:
+        """
+        Return the IDs of unit types whose tech build requirements are all known.
+
+        Only tech (VUT_ADVANCE) requirements are checked; other requirement
+        kinds (buildings, governments, terrain, ...) depend on runtime state.
+        """
+        return tuple(
+            unit.id
+            for unit in self.unit_types
+            if unit is not None and self._tech_reqs_met(unit.build_reqs, known_techs)
+        )
+
+    @_cached_query
+    def buildings_buildable_with(self, known_techs: FrozenSet[int]) -> Tuple[int, ...]:
+        """
+        Return the IDs of buildings whose tech requirements are all known.
+
+        Only tech (VUT_ADVANCE) requirements are checked, as for
+        unit_types_buildable_with().
+        """
+        return tuple(
+            building.id
+            for building in self.buildings
+            if building is not None and self._tech_reqs_met(building.reqs, known_techs)
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ChatMessage:
+    """Chat message from PACKET_CHAT_MSG (25), as stored in GameState.chat_history."""
+
+    timestamp: str  # Local receive time (ISO 8601)
+    message: str  # Message text
+    tile: int  # Related tile index (-1 = none)
+    event: int  # Event type (E_* enum)
+    turn: int  # Game turn
+    phase: int  # Turn phase
+    conn_id: int  # Sending connection ID (-1 = server)
+
+
+# Number of chat messages GameState keeps; older messages are evicted, since
+# the agent only needs recent context and long games produce many thousands
+CHAT_HISTORY_LIMIT = 256
+
+
+class GameState:
+    """
+    Tracks the current game state as packets are processed.
+
+    Ruleset data lives in self.ruleset (see RulesetBundle); the remaining
+    attributes are runtime state that changes during play.
+    """
+
+    # Fixed attribute set: no per-instance __dict__, and handlers cannot
+    # silently create misspelled attributes
+    __slots__ = (
+        "server_info",
+        "game_info",
+        "chat_history",
+        "ruleset",
+        "nation_availability",
+        "rulesets_ready",
+    )
+
+    def __init__(self):
+        """Initialize a new game state with default values."""
+        self.server_info = None
+        self.game_info: Optional[Dict[str, Any]] = None  # Game state information (PACKET_GAME_INFO)
+        self.chat_history: Deque[ChatMessage] = deque(
+            maxlen=CHAT_HISTORY_LIMIT
+        )  # Most recent chat messages, oldest evicted first
+        self.ruleset: RulesetBundle = RulesetBundle()  # Ruleset data (PACKET_RULESET_*)
+        self.nation_availability: Optional[Dict[str, Any]] = (
+            None  # Nation availability tracking (PACKET_NATION_AVAILABILITY)
+        )
         self.rulesets_ready: bool = False  # Whether PACKET_RULESETS_READY has been received
+
+    def clone_for_rollout(self) -> "GameState":
+        """
+        Return a copy of this state for AI rollouts / planning.
+
+        The ruleset bundle is shared by reference; runtime containers are
+        shallow-copied, so the clone can be updated without affecting self.
+        """
+        clone = GameState.__new__(GameState)
+        clone.server_info = self.server_info
+        clone.game_info = dict(self.game_info) if self.game_info is not None else None
+        clone.chat_history = deque(self.chat_history, maxlen=self.chat_history.maxlen)
+        clone.ruleset = self.ruleset
+        clone.nation_availability = (
+            dict(self.nation_availability) if self.nation_availability is not None else None
+        )
+        clone.rulesets_ready = self.rulesets_ready
+        return clone
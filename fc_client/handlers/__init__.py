@@ -1,9 +1,12 @@
 """
 Packet handler functions for the FreeCiv client.
 
-Each handler is an async function that processes a specific packet type.
-Handlers receive the client instance and the packet payload, and are
-responsible for decoding the payload and updating client state as needed.
+Each handler is a function that processes a specific packet type. Handlers
+that never await (most ruleset handlers just update game state) are plain
+functions registered with FreeCivClient.register_sync_handler(); the rest are
+async functions registered with register_handler(). Handlers receive the
+client instance and the packet payload, and are responsible for decoding the
+payload and updating client state as needed.
 """
 
 from typing import TYPE_CHECKING
@@ -1,47 +1,60 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
 from typing_extensions import TYPE_CHECKING
 
 from fc_client import protocol
-from fc_client.game_state import GameState
+from fc_client.game_state import ChatMessage, GameState
 
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
+logger = logging.getLogger(__name__)
+
+# Packet spec bound once at import instead of looked up per packet
+_CHAT_MSG_SPEC = protocol.PACKET_SPECS[protocol.PACKET_CHAT_MSG]
+
 
 async def handle_chat_msg(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_CHAT_MSG.
 
     Decodes chat message using delta protocol, stores in game state with timestamp,
-    and displays to console.
+    and logs it to the console.
     """
-    from datetime import datetime
-
     # Decode packet using delta protocol
-    packet_spec = protocol.PACKET_SPECS[protocol.PACKET_CHAT_MSG]
-    data = protocol.decode_delta_packet(payload, packet_spec, client._delta_cache)
+    data = protocol.decode_delta_packet(payload, _CHAT_MSG_SPEC, client._delta_cache)
 
     # Create history entry with timestamp
-    timestamp = datetime.now().isoformat()
-    history_entry = {
-        "timestamp": timestamp,
-        "message": data["message"],
-        "tile": data["tile"],
-        "event": data["event"],
-        "turn": data["turn"],
-        "phase": data["phase"],
-        "conn_id": data["conn_id"],
-    }
+    now = datetime.now()
+    history_entry = ChatMessage(
+        timestamp=now.isoformat(),
+        message=data["message"],
+        tile=data["tile"],
+        event=data["event"],
+        turn=data["turn"],
+        phase=data["phase"],
+        conn_id=data["conn_id"],
+    )
 
     # Store in game state
     game_state.chat_history.append(history_entry)
 
-    # Display to console
-    time_str = datetime.fromisoformat(timestamp).strftime("%H:%M:%S")
-    print(f"\n[CHAT {time_str}] {data['message']}")
-    print(
-        f"  Turn: {data['turn']} | Phase: {data['phase']} | "
-        f"Event: {data['event']} | Tile: {data['tile']} | Conn: {data['conn_id']}"
-    )
+    # Display to console (one record per message; nothing formatted when INFO is off)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "\n[CHAT %02d:%02d:%02d] %s\n  Turn: %s | Phase: %s | Event: %s | Tile: %s | Conn: %s",
+            now.hour,
+            now.minute,
+            now.second,
+            data["message"],
+            data["turn"],
+            data["phase"],
+            data["event"],
+            data["tile"],
+            data["conn_id"],
+        )
 
 
 __all__ = ["handle_chat_msg"]
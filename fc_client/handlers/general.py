@@ -1,32 +1,40 @@
+from __future__ import annotations
+
+import logging
 from typing import TYPE_CHECKING
 from fc_client.game_state import GameState
 
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
+logger = logging.getLogger(__name__)
+
 
-async def handle_processing_started(
+def handle_processing_started(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
     Handle PACKET_PROCESSING_STARTED.
 
     This packet indicates the server is starting to process something.
-    No payload to decode.
+    No payload to decode. These arrive in bursts around every server-side
+    action, so they are only logged at DEBUG level.
     """
-    print("Received PROCESSING_STARTED packet")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received PROCESSING_STARTED packet")
 
 
-async def handle_processing_finished(
+def handle_processing_finished(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
     Handle PACKET_PROCESSING_FINISHED.
 
     This packet indicates the server has finished processing.
-    No payload to decode.
+    No payload to decode. Logged at DEBUG level only, like PROCESSING_STARTED.
     """
-    print("Received PROCESSING_FINISHED packet")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received PROCESSING_FINISHED packet")
 
 
 __all__ = [
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import logging
 from typing import TYPE_CHECKING
 
 from fc_client import protocol
@@ -6,10 +9,14 @@ from fc_client.game_state import GameState
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
+logger = logging.getLogger(__name__)
+
+# Packet specs bound once at import instead of looked up per packet
+_SERVER_INFO_SPEC = protocol.PACKET_SPECS[protocol.PACKET_SERVER_INFO]
+_GAME_INFO_SPEC = protocol.PACKET_SPECS[protocol.PACKET_GAME_INFO]
+
 
-async def handle_server_info(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_server_info(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_SERVER_INFO.
 
@@ -17,15 +24,18 @@ async def handle_server_info(
     Updates game_state.server_info with server version information.
     """
     # Decode using delta protocol
-    packet_spec = protocol.PACKET_SPECS[protocol.PACKET_SERVER_INFO]
-    server_info = protocol.decode_delta_packet(payload, packet_spec, client._delta_cache)
-
-    game_state.server_info = server_info
-
-    print(
-        f"Server version: {server_info['version_label']} "
-        f"({server_info['major_version']}.{server_info['minor_version']}."
-        f"{server_info['patch_version']}-{server_info['emerg_version']})"
+    server_info = protocol.decode_delta_packet(payload, _SERVER_INFO_SPEC, client._delta_cache)
+
+    # Copy: the decoded dict is also the delta cache baseline for the next packet
+    game_state.server_info = dict(server_info)
+
+    logger.info(
+        "Server version: %s (%s.%s.%s-%s)",
+        server_info["version_label"],
+        server_info["major_version"],
+        server_info["minor_version"],
+        server_info["patch_version"],
+        server_info["emerg_version"],
     )
 
 
@@ -41,33 +51,38 @@ async def handle_game_info(client: "FreeCivClient", game_state: GameState, paylo
 
     Updates game_state.game_info with decoded packet data.
     """
-    from ..packet_specs import PACKET_SPECS
-
     # Decode using delta protocol (handles array-diff automatically)
-    spec = PACKET_SPECS[16]
-    data = protocol.decode_delta_packet(payload, spec, client._delta_cache)
+    data = protocol.decode_delta_packet(payload, _GAME_INFO_SPEC, client._delta_cache)
 
-    # Store in game state
-    game_state.game_info = data
+    # Store in game state (a copy: the decoded dict is also the delta cache
+    # baseline for the next GAME_INFO, so callers must be free to mutate it)
+    game_state.game_info = dict(data)
 
     # Display array-diff fields for verification
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     global_advances = data.get("global_advances", [])
     great_wonder_owners = data.get("great_wonder_owners", [])
     global_advance_count = data.get("global_advance_count", 0)
 
-    # Count discovered techs
-    discovered_count = sum(1 for advance in global_advances if advance) if global_advances else 0
-
-    # Count wonders owned
-    owned_wonders = (
-        sum(1 for owner in great_wonder_owners if owner >= 0) if great_wonder_owners else 0
-    )
-
-    print(f"\n[GAME_INFO] Packet received")
-    print(
-        f"  Global advances: {discovered_count}/{len(global_advances)} discovered (count field: {global_advance_count})"
+    # Count discovered techs (BOOL array: list.count runs in C)
+    discovered_count = global_advances.count(True)
+
+    # Count wonders owned (owner >= 0; negative values are "not owned"/"lost"
+    # sentinels). map() with a bound int comparison keeps the loop in C
+    owned_wonders = sum(map((0).__le__, great_wonder_owners))
+
+    logger.info(
+        "\n[GAME_INFO] Packet received\n"
+        "  Global advances: %d/%d discovered (count field: %s)\n"
+        "  Great wonders: %d/%d owned",
+        discovered_count,
+        len(global_advances),
+        global_advance_count,
+        owned_wonders,
+        len(great_wonder_owners),
     )
-    print(f"  Great wonders: {owned_wonders}/{len(great_wonder_owners)} owned")
 
 
 __all__ = [
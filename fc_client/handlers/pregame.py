@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import logging
 from typing import TYPE_CHECKING
 
 from fc_client import protocol
@@ -6,8 +9,10 @@ from fc_client.game_state import GameState
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
+logger = logging.getLogger(__name__)
+
 
-async def handle_server_join_reply(
+def handle_server_join_reply(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -20,7 +25,7 @@ async def handle_server_join_reply(
     data = protocol.decode_server_join_reply(payload)
 
     if data["you_can_join"]:
-        print(f"Join successful: {data['message']}")
+        logger.info("Join successful: %s", data["message"])
 
         # CRITICAL: Switch to 2-byte packet type format after successful join
         # The FreeCiv protocol switches from UINT8 to UINT16 packet types after JOIN_REPLY
@@ -29,7 +34,7 @@ async def handle_server_join_reply(
         # Signal that join was successful
         client._join_successful.set()
     else:
-        print(f"Join failed: {data['message']}")
+        logger.error("Join failed: %s", data["message"])
         # Trigger shutdown on join failure
         client._shutdown_event.set()
 
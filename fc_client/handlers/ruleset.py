@@ -1,15 +1,88 @@
+from __future__ import annotations
+
+import logging
+import sys
+from array import array
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from fc_client import protocol
-from fc_client.game_state import GameState, RulesetControl, TerrainControl
+from fc_client.game_state import (
+    AchievementType,
+    ActionAutoPerformer,
+    ActionEnabler,
+    ActionType,
+    BaseType,
+    Building,
+    CityStyle,
+    ClauseType,
+    DisasterType,
+    ExtraType,
+    GameState,
+    Goods,
+    Government,
+    GovernmentRulerTitle,
+    MusicStyle,
+    Nation,
+    Requirement,
+    Resource,
+    RoadType,
+    RulesetBundle,
+    RulesetControl,
+    RulesetEffect,
+    RulesetGame,
+    Specialist,
+    Style,
+    Tech,
+    Terrain,
+    TerrainControl,
+    TradeRouteType,
+    UnitBonus,
+    UnitClass,
+    UnitType,
+    store_by_id,
+)
 
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
-
-async def handle_ruleset_control(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+logger = logging.getLogger(__name__)
+
+# Defaults for PACKET_RULESET_NATION fields missing from the decoded dict
+# (immutable, so the merged dict never shares mutable state between nations)
+_NATION_DEFAULTS = {
+    "translation_domain": "",
+    "adjective": "",
+    "rule_name": "",
+    "noun_plural": "",
+    "graphic_str": "",
+    "graphic_alt": "",
+    "legend": b"",
+    "style": 0,
+    "leader_name": (),
+    "leader_is_male": (),
+    "is_playable": False,
+    "barbarian_type": 0,
+    "sets": (),
+    "groups": (),
+    "init_government_id": -1,
+    "init_techs": (),
+    "init_units": (),
+    "init_buildings": (),
+}
+
+# Packet spec bound once at import instead of looked up per packet
+_RULESET_CONTROL_SPEC = protocol.PACKET_SPECS[protocol.PACKET_RULESET_CONTROL]
+
+
+def _text_preview(raw: bytes, limit: int) -> str:
+    """Decode at most limit bytes of raw UTF-8 text for console output."""
+    if len(raw) <= limit:
+        return raw.decode("utf-8")
+    return raw[:limit].decode("utf-8", "ignore") + "..."
+
+
+def handle_ruleset_control(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_CONTROL.
 
@@ -17,61 +90,58 @@ async def handle_ruleset_control(
     (units, techs, nations, etc.) and metadata. Sent during initialization to inform
     the client what to expect from subsequent ruleset data packets.
 
-    Updates game_state.ruleset_control with complete ruleset configuration.
+    Replaces game_state.ruleset with a new bundle holding the ruleset configuration.
     """
     # Decode using delta protocol (returns dict)
-    packet_spec = protocol.PACKET_SPECS[protocol.PACKET_RULESET_CONTROL]
-    data = protocol.decode_delta_packet(payload, packet_spec, client._delta_cache)
+    data = protocol.decode_delta_packet(payload, _RULESET_CONTROL_SPEC, client._delta_cache)
 
     # Convert dict to typed dataclass
     ruleset = RulesetControl(**data)
 
-    # Store in game state
-    game_state.ruleset_control = ruleset
-
-    # Reset description accumulator for new ruleset
-    game_state.ruleset_description_parts = []
-    game_state.ruleset_description = None
-
-    # Display summary (using attribute access)
-    print(f"\n[RULESET] {ruleset.name} v{ruleset.version}")
-    print(f"  Units: {ruleset.num_unit_types} ({ruleset.num_unit_classes} classes)")
-    print(f"  Techs: {ruleset.num_tech_types} ({ruleset.num_tech_classes} classes)")
-    print(f"  Nations: {ruleset.nation_count} ({ruleset.num_nation_groups} groups)")
-    print(f"  Improvements: {ruleset.num_impr_types}")
-    print(f"  Terrain: {ruleset.terrain_count}")
-    print(f"  Governments: {ruleset.government_count}")
+    # Start a fresh ruleset bundle (states cloned for rollouts keep the old one)
+    game_state.ruleset = RulesetBundle.from_control(ruleset)
+
+    # Display summary (one formatted string, logged as a single record)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"\n[RULESET] {ruleset.name} v{ruleset.version}\n"
+            f"  Units: {ruleset.num_unit_types} ({ruleset.num_unit_classes} classes)\n"
+            f"  Techs: {ruleset.num_tech_types} ({ruleset.num_tech_classes} classes)\n"
+            f"  Nations: {ruleset.nation_count} ({ruleset.num_nation_groups} groups)\n"
+            f"  Improvements: {ruleset.num_impr_types}\n"
+            f"  Terrain: {ruleset.terrain_count}\n"
+            f"  Governments: {ruleset.government_count}"
+        )
 
 
-async def handle_ruleset_summary(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_summary(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_SUMMARY.
 
     This packet contains a summary text describing the ruleset.
     Sent during game initialization to provide overview information.
 
-    Updates game_state.ruleset_summary with the text content.
+    Updates game_state.ruleset.ruleset_summary with the text content.
     """
     # Decode packet (simple, non-delta)
     data = protocol.decode_ruleset_summary(payload)
 
     # Store in game state
-    game_state.ruleset_summary = data["text"]
+    game_state.ruleset.ruleset_summary = data["text"]
 
     # Display summary (truncate if very long)
-    text = data["text"]
-    if len(text) > 200:
-        preview = text[:200] + "..."
-    else:
-        preview = text
+    if logger.isEnabledFor(logging.INFO):
+        text = data["text"]
+        if len(text) > 200:
+            preview = text[:200] + "..."
+        else:
+            preview = text
 
-    print(f"\n[RULESET SUMMARY]")
-    print(preview)
+        logger.info(f"\n[RULESET SUMMARY]")
+        logger.info(preview)
 
 
-async def handle_ruleset_description_part(
+def handle_ruleset_description_part(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -82,55 +152,63 @@ async def handle_ruleset_description_part(
     until total bytes >= desc_length from ruleset_control.
 
     Multi-part assembly algorithm:
-    1. Decode the text chunk from payload
-    2. Append to game_state.ruleset_description_parts
-    3. Calculate total accumulated bytes (UTF-8 encoding)
-    4. If total >= expected desc_length:
-       - Join all parts into complete description
-       - Store in game_state.ruleset_description
+    1. Decode the raw UTF-8 chunk bytes from payload
+    2. Append to game_state.ruleset.ruleset_description_buf
+    3. If the buffer length >= expected desc_length:
+       - Decode the buffer once into the complete description
+       - Store in game_state.ruleset.ruleset_description
        - Clear accumulator for next ruleset load
 
-    Updates game_state.ruleset_description_parts (accumulator) and
-    game_state.ruleset_description (final assembled text).
+    Updates game_state.ruleset.ruleset_description_buf (accumulator) and
+    game_state.ruleset.ruleset_description (final assembled text).
     """
     # Decode packet (simple, non-delta)
     data = protocol.decode_ruleset_description_part(payload)
-    chunk_text = data["text"]
+    chunk_bytes = data["text"]
 
     # Append chunk to accumulator
-    game_state.ruleset_description_parts.append(chunk_text)
+    ruleset = game_state.ruleset
+    buf = ruleset.ruleset_description_buf
+    buf.extend(chunk_bytes)
 
-    # Calculate total bytes accumulated (UTF-8 encoding, not character count)
-    total_bytes = sum(len(part.encode("utf-8")) for part in game_state.ruleset_description_parts)
+    # Total bytes accumulated (desc_length counts UTF-8 bytes, not characters)
+    total_bytes = len(buf)
 
     # Check if we have expected desc_length from RULESET_CONTROL
-    if game_state.ruleset_control is None:
-        print(f"\n[WARNING] Received RULESET_DESCRIPTION_PART before RULESET_CONTROL")
-        print(
-            f"  Accumulated {len(game_state.ruleset_description_parts)} part(s), {total_bytes} bytes"
+    control = ruleset.ruleset_control
+    if control is None:
+        logger.warning(
+            "\n[WARNING] Received RULESET_DESCRIPTION_PART before RULESET_CONTROL\n"
+            "  Accumulated %d bytes",
+            total_bytes,
         )
         return
 
-    expected_length = game_state.ruleset_control.desc_length
+    expected_length = control.desc_length
 
-    # Print progress
+    # Log progress in steps of at least 5% (plus completion); small chunks
+    # would otherwise cost more in console output than in decoding
     progress_pct = min(100, int(100 * total_bytes / expected_length)) if expected_length > 0 else 0
-    print(
-        f"[RULESET DESC] Part {len(game_state.ruleset_description_parts)}: "
-        f"{len(chunk_text)} bytes (total: {total_bytes}/{expected_length} bytes, {progress_pct}%)"
-    )
+    if progress_pct - ruleset._description_progress_pct >= 5 or total_bytes >= expected_length:
+        ruleset._description_progress_pct = progress_pct
+        logger.info(
+            f"[RULESET DESC] Part: {len(chunk_bytes)} bytes "
+            f"(total: {total_bytes}/{expected_length} bytes, {progress_pct}%)"
+        )
 
     # Check if assembly is complete
     if total_bytes >= expected_length:
-        # Join all parts into complete description
-        complete_description = "".join(game_state.ruleset_description_parts)
-        game_state.ruleset_description = complete_description
+        # Decode all parts at once into the complete description
+        complete_description = buf.decode("utf-8")
+        ruleset.ruleset_description = complete_description
 
         # Clear accumulator
-        game_state.ruleset_description_parts = []
+        ruleset.ruleset_description_buf = bytearray()
 
         # Display completion message
-        print(f"\n[RULESET DESCRIPTION] Assembly complete: {len(complete_description)} characters")
+        logger.info(
+            f"\n[RULESET DESCRIPTION] Assembly complete: {len(complete_description)} characters"
+        )
 
         # Show preview (first 300 chars)
         if len(complete_description) > 300:
@@ -138,11 +216,11 @@ async def handle_ruleset_description_part(
         else:
             preview = complete_description
 
-        print(preview)
-        print()  # Blank line for readability
+        logger.info(preview)
+        logger.info("")  # Blank line for readability
 
 
-async def handle_ruleset_nation_sets(
+def handle_ruleset_nation_sets(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -151,41 +229,33 @@ async def handle_ruleset_nation_sets(
     This packet contains the list of available nation sets (collections of nations
     grouped by theme, era, or region). Sent during game initialization.
 
-    Updates game_state.nation_sets with list of NationSet objects.
+    Updates game_state.ruleset.nation_set_names, nation_set_rule_names and
+    nation_set_descriptions_raw (parallel arrays indexed by set ID).
     """
-    from ..game_state import NationSet
-
     # Decode packet
     data = protocol.decode_ruleset_nation_sets(payload)
 
-    # Transform parallel arrays into list of objects
-    nation_sets = []
-    for i in range(data["nsets"]):
-        nation_set = NationSet(
-            name=data["names"][i],
-            rule_name=data["rule_names"][i],
-            description=data["descriptions"][i],
-        )
-        nation_sets.append(nation_set)
-
-    # Store in game state (replaces previous data)
-    game_state.nation_sets = nation_sets
-
-    # Display summary
-    print(f"\n[NATION SETS] {len(nation_sets)} available")
-    for nation_set in nation_sets:
-        # Truncate long descriptions for console output
-        desc_preview = (
-            nation_set.description[:60] + "..."
-            if len(nation_set.description) > 60
-            else nation_set.description
-        )
-        print(f"  - {nation_set.name} ({nation_set.rule_name})")
-        if desc_preview:
-            print(f"    {desc_preview}")
-
-
-async def handle_ruleset_nation_groups(
+    # Store parallel arrays in game state (replaces previous data)
+    names = tuple(sys.intern(name) for name in data["names"])
+    rule_names = tuple(sys.intern(rule_name) for rule_name in data["rule_names"])
+    descriptions = tuple(data["descriptions"])
+    game_state.ruleset.nation_set_names = names
+    game_state.ruleset.nation_set_rule_names = rule_names
+    game_state.ruleset.nation_set_descriptions_raw = descriptions
+
+    # Display summary (collected and logged as a single record)
+    if logger.isEnabledFor(logging.INFO):
+        lines = [f"\n[NATION SETS] {len(names)} available"]
+        for name, rule_name, description_raw in zip(names, rule_names, descriptions):
+            # Truncate long descriptions for console output
+            desc_preview = _text_preview(description_raw, 60)
+            lines.append(f"  - {name} ({rule_name})")
+            if desc_preview:
+                lines.append(f"    {desc_preview}")
+        logger.info("\n".join(lines))
+
+
+def handle_ruleset_nation_groups(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -195,32 +265,30 @@ async def handle_ruleset_nation_groups(
     such as "Ancient", "Medieval", "African", "European", etc.). Groups can be
     hidden from player selection. Sent during game initialization.
 
-    Updates game_state.nation_groups with list of NationGroup objects.
+    Updates game_state.ruleset.nation_group_names and the nation_groups_hidden bitmask
+    (bit g set = group g hidden).
     """
-    from ..game_state import NationGroup
-
     # Decode packet
     data = protocol.decode_ruleset_nation_groups(payload)
 
-    # Transform parallel arrays into list of objects
-    nation_groups = []
-    for i in range(data["ngroups"]):
-        nation_group = NationGroup(name=data["groups"][i], hidden=data["hidden"][i])
-        nation_groups.append(nation_group)
-
-    # Store in game state (replaces previous data)
-    game_state.nation_groups = nation_groups
+    # Store names and fold the hidden flags into a bitmask (replaces previous data)
+    names = tuple(sys.intern(name) for name in data["groups"])
+    hidden_mask = 0
+    for i, hidden in enumerate(data["hidden"]):
+        if hidden:
+            hidden_mask |= 1 << i
+    game_state.ruleset.nation_group_names = names
+    game_state.ruleset.nation_groups_hidden = hidden_mask
 
     # Display summary
-    print(f"\n[NATION GROUPS] {len(nation_groups)} available")
-    for nation_group in nation_groups:
-        visibility = "hidden" if nation_group.hidden else "visible"
-        print(f"  - {nation_group.name} ({visibility})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[NATION GROUPS] {len(names)} available")
+        for i, name in enumerate(names):
+            visibility = "hidden" if game_state.ruleset.is_nation_group_hidden(i) else "visible"
+            logger.info(f"  - {name} ({visibility})")
 
 
-async def handle_ruleset_nation(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_nation(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_NATION (148) - nation/civilization data.
 
@@ -229,63 +297,67 @@ async def handle_ruleset_nation(
     membership in nation sets and groups. One packet is sent per nation during
     game initialization.
 
-    Updates game_state.nations dict with Nation objects keyed by nation ID.
+    Stores the Nation in the game_state.ruleset.nations list at its nation ID.
     """
-    from ..game_state import Nation
+    # Decode packet using manual decoder; one merge fills any absent fields
+    data = {**_NATION_DEFAULTS, **protocol.decode_ruleset_nation(payload)}
 
-    # Decode packet using manual decoder
-    data = protocol.decode_ruleset_nation(payload)
+    # Fold leader genders into a bitmask (bit i = leader i is male)
+    leader_is_male_mask = 0
+    for i, is_male in enumerate(data["leader_is_male"]):
+        if is_male:
+            leader_is_male_mask |= 1 << i
 
     # Create Nation object from decoded data
     nation = Nation(
         id=data["id"],
-        translation_domain=data.get("translation_domain", ""),
-        adjective=data.get("adjective", ""),
-        rule_name=data.get("rule_name", ""),
-        noun_plural=data.get("noun_plural", ""),
-        graphic_str=data.get("graphic_str", ""),
-        graphic_alt=data.get("graphic_alt", ""),
-        legend=data.get("legend", ""),
-        style=data.get("style", 0),
-        leader_count=data.get("leader_count", 0),
-        leader_name=data.get("leader_name", []),
-        leader_is_male=data.get("leader_is_male", []),
-        is_playable=data.get("is_playable", False),
-        barbarian_type=data.get("barbarian_type", 0),
-        nsets=data.get("nsets", 0),
-        sets=data.get("sets", []),
-        ngroups=data.get("ngroups", 0),
-        groups=data.get("groups", []),
-        init_government_id=data.get("init_government_id", -1),
-        init_techs_count=data.get("init_techs_count", 0),
-        init_techs=data.get("init_techs", []),
-        init_units_count=data.get("init_units_count", 0),
-        init_units=data.get("init_units", []),
-        init_buildings_count=data.get("init_buildings_count", 0),
-        init_buildings=data.get("init_buildings", []),
+        translation_domain=data["translation_domain"],
+        adjective=data["adjective"],
+        rule_name=data["rule_name"],
+        noun_plural=data["noun_plural"],
+        graphic_str=data["graphic_str"],
+        graphic_alt=data["graphic_alt"],
+        legend_raw=data["legend"],
+        style=data["style"],
+        leader_name=data["leader_name"] or [],
+        leader_is_male_mask=leader_is_male_mask,
+        is_playable=data["is_playable"],
+        barbarian_type=data["barbarian_type"],
+        sets=array("H", data["sets"]),
+        groups=array("H", data["groups"]),
+        init_government_id=data["init_government_id"],
+        init_techs=array("H", data["init_techs"]),
+        init_units=array("H", data["init_units"]),
+        init_buildings=array("H", data["init_buildings"]),
     )
 
     # Store in game state by nation ID
-    game_state.nations[nation.id] = nation
-
-    # Display summary
-    leaders_str = ", ".join(nation.leader_name[:3])
-    if len(nation.leader_name) > 3:
-        leaders_str += f", +{len(nation.leader_name) - 3} more"
-
-    playable = "playable" if nation.is_playable else "not playable"
-
-    print(f"\n[NATION {nation.id}] {nation.adjective} ({nation.rule_name})")
-    print(f"  Leaders: {leaders_str}")
-    print(f"  Status: {playable}")
-    print(f"  Sets: {len(nation.sets)}, Groups: {len(nation.groups)}")
-    print(
-        f"  Starting: {nation.init_techs_count} techs, "
-        f"{nation.init_units_count} units, {nation.init_buildings_count} buildings"
-    )
+    store_by_id(game_state.ruleset.nations, nation.id, nation)
+
+    # Per-nation summary is DEBUG only: one packet arrives per nation (hundreds
+    # in a typical ruleset), so nothing is formatted unless DEBUG is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        leaders_str = ", ".join(nation.leader_name[:3])
+        if len(nation.leader_name) > 3:
+            leaders_str += f", +{len(nation.leader_name) - 3} more"
+
+        logger.debug(
+            "\n[NATION %d] %s (%s)\n  Leaders: %s\n  Status: %s\n  Sets: %d, Groups: %d\n"
+            "  Starting: %d techs, %d units, %d buildings",
+            nation.id,
+            nation.adjective,
+            nation.rule_name,
+            leaders_str,
+            "playable" if nation.is_playable else "not playable",
+            len(nation.sets),
+            len(nation.groups),
+            nation.init_techs_count,
+            nation.init_units_count,
+            nation.init_buildings_count,
+        )
 
 
-async def handle_nation_availability(
+def handle_nation_availability(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -307,33 +379,38 @@ async def handle_nation_availability(
         "nationset_change": data["nationset_change"],
     }
 
-    # Display summary
-    available_count = sum(data["is_pickable"])
-    total_count = data["ncount"]
-
-    print(f"\n[NATION AVAILABILITY] {available_count}/{total_count} nations available")
-    if data["nationset_change"]:
-        print("  Nation set changed")
-
-    # Display detailed availability (limit to first 10 for brevity)
-    if game_state.nations:
-        print("  Available nations:")
-        shown = 0
-        for nation_id, is_available in enumerate(data["is_pickable"]):
-            if is_available and nation_id in game_state.nations:
-                nation = game_state.nations[nation_id]
-                print(f"    - {nation.adjective} ({nation.rule_name})")
-                shown += 1
-                if shown >= 10:
-                    remaining = available_count - shown
-                    if remaining > 0:
-                        print(f"    ... and {remaining} more")
-                    break
-
-
-async def handle_ruleset_game(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        # Collect pickable nation IDs in one pass; used for both the count and the listing
+        available_ids = [
+            nation_id for nation_id, pickable in enumerate(data["is_pickable"]) if pickable
+        ]
+        available_count = len(available_ids)
+        total_count = data["ncount"]
+
+        logger.info(f"\n[NATION AVAILABILITY] {available_count}/{total_count} nations available")
+        if data["nationset_change"]:
+            logger.info("  Nation set changed")
+
+        # Display detailed availability (limit to first 10 for brevity)
+        nations = game_state.ruleset.nations
+        if any(nations):
+            nation_count = len(nations)
+            known = (
+                nations[nation_id]
+                for nation_id in available_ids
+                if nation_id < nation_count and nations[nation_id] is not None
+            )
+            lines = ["  Available nations:"]
+            lines.extend(
+                f"    - {nation.adjective} ({nation.rule_name})" for nation in islice(known, 10)
+            )
+            shown = len(lines) - 1
+            if shown >= 10 and available_count > shown:
+                lines.append(f"    ... and {available_count - shown} more")
+            logger.info("\n".join(lines))
+
+
+def handle_ruleset_game(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_GAME (141) - core game configuration.
 
@@ -343,63 +420,59 @@ async def handle_ruleset_game(
     - Veteran system configuration (levels, names, bonuses, advancement chances)
     - Background color for UI rendering
 
-    Updates game_state.ruleset_game with the complete game configuration.
+    Updates game_state.ruleset.ruleset_game with the complete game configuration.
     """
-    from ..game_state import RulesetGame
-
     # Decode packet
     data = protocol.decode_ruleset_game(payload)
 
     # Create RulesetGame object
     ruleset_game = RulesetGame(
         default_specialist=data["default_specialist"],
-        global_init_techs_count=data["global_init_techs_count"],
-        global_init_techs=data["global_init_techs"],
-        global_init_buildings_count=data["global_init_buildings_count"],
-        global_init_buildings=data["global_init_buildings"],
-        veteran_levels=data["veteran_levels"],
+        global_init_techs=array("H", data["global_init_techs"]),
+        global_init_buildings=array("H", data["global_init_buildings"]),
         veteran_name=data["veteran_name"],
-        power_fact=data["power_fact"],
-        move_bonus=data["move_bonus"],
-        base_raise_chance=data["base_raise_chance"],
-        work_raise_chance=data["work_raise_chance"],
+        power_fact=array("H", data["power_fact"]),
+        move_bonus=array("I", data["move_bonus"]),
+        base_raise_chance=array("B", data["base_raise_chance"]),
+        work_raise_chance=array("B", data["work_raise_chance"]),
         background_red=data["background_red"],
         background_green=data["background_green"],
         background_blue=data["background_blue"],
     )
 
     # Store in game state
-    game_state.ruleset_game = ruleset_game
+    game_state.ruleset.ruleset_game = ruleset_game
 
     # Display summary
-    print(f"\n[RULESET GAME] Game Configuration")
-    print(f"  Default Specialist: {ruleset_game.default_specialist}")
-    print(
-        f"  Global Starting Techs: {ruleset_game.global_init_techs_count} "
-        f"(IDs: {ruleset_game.global_init_techs})"
-    )
-    print(
-        f"  Global Starting Buildings: {ruleset_game.global_init_buildings_count} "
-        f"(IDs: {ruleset_game.global_init_buildings})"
-    )
-    print(
-        f"  Background Color: RGB({ruleset_game.background_red}, "
-        f"{ruleset_game.background_green}, {ruleset_game.background_blue})"
-    )
-
-    # Display veteran system
-    print(f"\n  Veteran System: {ruleset_game.veteran_levels} levels")
-    for i in range(ruleset_game.veteran_levels):
-        print(
-            f"    {i}: {ruleset_game.veteran_name[i]} - "
-            f"Power: {ruleset_game.power_fact[i]}, "
-            f"Move: {ruleset_game.move_bonus[i]}, "
-            f"Base: {ruleset_game.base_raise_chance[i]}%, "
-            f"Work: {ruleset_game.work_raise_chance[i]}%"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[RULESET GAME] Game Configuration")
+        logger.info(f"  Default Specialist: {ruleset_game.default_specialist}")
+        logger.info(
+            f"  Global Starting Techs: {ruleset_game.global_init_techs_count} "
+            f"(IDs: {ruleset_game.global_init_techs.tolist()})"
+        )
+        logger.info(
+            f"  Global Starting Buildings: {ruleset_game.global_init_buildings_count} "
+            f"(IDs: {ruleset_game.global_init_buildings.tolist()})"
         )
+        logger.info(
+            f"  Background Color: RGB({ruleset_game.background_red}, "
+            f"{ruleset_game.background_green}, {ruleset_game.background_blue})"
+        )
+
+        # Display veteran system
+        logger.info(f"\n  Veteran System: {ruleset_game.veteran_levels} levels")
+        for i in range(ruleset_game.veteran_levels):
+            logger.info(
+                f"    {i}: {ruleset_game.veteran_name[i]} - "
+                f"Power: {ruleset_game.power_fact[i]}, "
+                f"Move: {ruleset_game.move_bonus[i]}, "
+                f"Base: {ruleset_game.base_raise_chance[i]}%, "
+                f"Work: {ruleset_game.work_raise_chance[i]}%"
+            )
 
 
-async def handle_ruleset_specialist(
+def handle_ruleset_specialist(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -413,15 +486,13 @@ async def handle_ruleset_specialist(
     Uses delta protocol with 9 conditional fields. Sent during ruleset
     initialization, one packet per specialist type.
 
-    Updates game_state.specialists dict, keyed by specialist ID.
+    Updates game_state.ruleset.specialists list, indexed by specialist ID.
     """
-    from ..game_state import Specialist, Requirement
-
     # Decode using manual decoder
     data = protocol.decode_ruleset_specialist(payload, client._delta_cache)
 
     # Convert requirements list
-    requirements = [Requirement(**req) for req in data.get("reqs", [])]
+    requirements = [Requirement.shared(**req) for req in data.get("reqs", [])]
 
     # Create typed dataclass
     specialist = Specialist(
@@ -431,36 +502,32 @@ async def handle_ruleset_specialist(
         short_name=data.get("short_name", ""),
         graphic_str=data.get("graphic_str", ""),
         graphic_alt=data.get("graphic_alt", ""),
-        reqs_count=data.get("reqs_count", 0),
         reqs=requirements,
-        helptext=data.get("helptext", ""),
+        helptext_raw=data.get("helptext", b""),
     )
 
     # Store in game state
-    game_state.specialists[specialist.id] = specialist
+    store_by_id(game_state.ruleset.specialists, specialist.id, specialist)
 
     # Display summary
-    print(f"\n[SPECIALIST {specialist.id}] {specialist.plural_name} ({specialist.rule_name})")
-    print(f"  Short Name: {specialist.short_name}")
-    print(f"  Graphics: {specialist.graphic_str}")
-    if specialist.graphic_alt and specialist.graphic_alt != "-":
-        print(f"    Alt: {specialist.graphic_alt}")
-    if specialist.reqs_count > 0:
-        print(f"  Requirements: {specialist.reqs_count}")
-
-    # Display help text (truncated)
-    if specialist.helptext:
-        help_preview = (
-            specialist.helptext[:100] + "..."
-            if len(specialist.helptext) > 100
-            else specialist.helptext
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"\n[SPECIALIST {specialist.id}] {specialist.plural_name} ({specialist.rule_name})"
         )
-        print(f"  Help: {help_preview}")
+        logger.info(f"  Short Name: {specialist.short_name}")
+        logger.info(f"  Graphics: {specialist.graphic_str}")
+        if specialist.graphic_alt and specialist.graphic_alt != "-":
+            logger.info(f"    Alt: {specialist.graphic_alt}")
+        if specialist.reqs_count > 0:
+            logger.info(f"  Requirements: {specialist.reqs_count}")
 
+        # Display help text (truncated)
+        if specialist.helptext_raw:
+            help_preview = _text_preview(specialist.helptext_raw, 100)
+            logger.info(f"  Help: {help_preview}")
 
-async def handle_ruleset_disaster(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+
+def handle_ruleset_disaster(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_DISASTER (224) - disaster type configuration.
 
@@ -468,16 +535,14 @@ async def handle_ruleset_disaster(
     in cities when requirements are met. One packet is sent per disaster type
     during game initialization.
 
-    Updates game_state.disasters dict with the disaster type configuration.
+    Stores the disaster type in the game_state.ruleset.disasters list at its ID.
     """
-    from ..game_state import DisasterType, Requirement
-
     # Decode packet
     data = protocol.decode_ruleset_disaster(payload)
 
     # Convert requirements to Requirement objects
     requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -493,14 +558,13 @@ async def handle_ruleset_disaster(
         id=data["id"],
         name=data["name"],
         rule_name=data["rule_name"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
         frequency=data["frequency"],
         effects=data["effects"],
     )
 
     # Store in game state
-    game_state.disasters[disaster.id] = disaster
+    store_by_id(game_state.ruleset.disasters, disaster.id, disaster)
 
     # Decode effects bitvector for display
     effect_names = []
@@ -521,13 +585,14 @@ async def handle_ruleset_disaster(
     effects_str = ", ".join(effect_names) if effect_names else "none"
 
     # Display summary
-    print(f"\n[DISASTER {disaster.id}] {disaster.name} ({disaster.rule_name})")
-    print(f"  Frequency: {disaster.frequency}")
-    print(f"  Requirements: {disaster.reqs_count}")
-    print(f"  Effects: {effects_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[DISASTER {disaster.id}] {disaster.name} ({disaster.rule_name})")
+        logger.info(f"  Frequency: {disaster.frequency}")
+        logger.info(f"  Requirements: {disaster.reqs_count}")
+        logger.info(f"  Effects: {effects_str}")
 
 
-async def handle_ruleset_achievement(
+def handle_ruleset_achievement(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -536,10 +601,8 @@ async def handle_ruleset_achievement(
     Achievements are special accomplishments players can earn during the game.
     One packet is sent per achievement type during game initialization.
 
-    Updates game_state.achievements dict with the achievement type configuration.
+    Stores the achievement type in the game_state.ruleset.achievements list at its ID.
     """
-    from ..game_state import AchievementType
-
     # Decode packet
     data = protocol.decode_ruleset_achievement(payload)
 
@@ -553,7 +616,7 @@ async def handle_ruleset_achievement(
     )
 
     # Store in game state
-    game_state.achievements[achievement.id] = achievement
+    store_by_id(game_state.ruleset.achievements, achievement.id, achievement)
 
     # Map achievement type enum to human-readable names
     type_names = {
@@ -573,17 +636,16 @@ async def handle_ruleset_achievement(
     unique_str = "unique" if achievement.unique else "repeatable"
 
     # Display summary
-    print(f"\n[ACHIEVEMENT {achievement.id}] {achievement.name} ({achievement.rule_name})")
-    print(f"  Type: {type_str}")
-    print(f"  Status: {unique_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"\n[ACHIEVEMENT {achievement.id}] {achievement.name} ({achievement.rule_name})"
+        )
+        logger.info(f"  Type: {type_str}")
+        logger.info(f"  Status: {unique_str}")
 
 
-async def handle_ruleset_trade(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_trade(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_TRADE (227) - trade route configuration."""
-    from ..game_state import TradeRouteType
-
     # Decode packet
     data = protocol.decode_ruleset_trade(payload)
 
@@ -596,7 +658,7 @@ async def handle_ruleset_trade(
     )
 
     # Store in game state
-    game_state.trade_routes[trade_route.id] = trade_route
+    store_by_id(game_state.ruleset.trade_routes, trade_route.id, trade_route)
 
     # Map enum values for display
     cancelling_names = {0: "Active", 1: "Inactive", 2: "Cancel"}
@@ -608,57 +670,51 @@ async def handle_ruleset_trade(
     bonus_str = bonus_type_names.get(trade_route.bonus_type, f"Unknown({trade_route.bonus_type})")
 
     # Display summary
-    print(f"\n[TRADE ROUTE {trade_route.id}]")
-    print(f"  Trade Percentage: {trade_route.trade_pct}%")
-    print(f"  Illegal Route Handling: {cancelling_str}")
-    print(f"  Bonus Type: {bonus_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[TRADE ROUTE {trade_route.id}]")
+        logger.info(f"  Trade Percentage: {trade_route.trade_pct}%")
+        logger.info(f"  Illegal Route Handling: {cancelling_str}")
+        logger.info(f"  Bonus Type: {bonus_str}")
 
 
-async def handle_ruleset_resource(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_resource(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_RESOURCE (177) - resource type configuration.
 
     Resources provide bonuses to tile outputs (e.g., Gold, Wheat, Horses).
     Each resource defines output bonuses for the 6 output types.
 
-    Updates game_state.resources dict with the resource configuration.
+    Updates game_state.ruleset.resources dict with the resource configuration.
     """
-    from ..game_state import Resource
-
     # Decode packet
     data = protocol.decode_ruleset_resource(payload)
 
     # Create Resource object
-    resource = Resource(id=data["id"], output=data["output"])
+    resource = Resource(id=data["id"], output=array("B", data["output"]))
 
     # Store in game state
-    game_state.resources[resource.id] = resource
+    game_state.ruleset.resources[resource.id] = resource
 
     # Format output bonuses for display (show only non-zero values)
-    output_names = ["Food", "Shield", "Trade", "Gold", "Luxury", "Science"]
-    bonuses = []
-    for i, value in enumerate(resource.output):
-        if value > 0:
-            bonuses.append(f"{output_names[i]}+{value}")
+    if logger.isEnabledFor(logging.INFO):
+        output_names = ["Food", "Shield", "Trade", "Gold", "Luxury", "Science"]
+        bonuses = []
+        for i, value in enumerate(resource.output):
+            if value > 0:
+                bonuses.append(f"{output_names[i]}+{value}")
 
-    bonus_str = ", ".join(bonuses) if bonuses else "No bonuses"
-    print(f"[RESOURCE] ID {resource.id}: {bonus_str}")
+        bonus_str = ", ".join(bonuses) if bonuses else "No bonuses"
+        logger.info(f"[RESOURCE] ID {resource.id}: {bonus_str}")
 
 
-async def handle_ruleset_action(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_action(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_ACTION (246) - action type configuration.
 
     Actions define what units can do in the game: establish embassies,
     create trade routes, spy missions, combat actions, etc. One packet
     is sent per action type during game initialization.
 
-    Updates game_state.actions dict with the action type configuration.
+    Stores the action type in the game_state.ruleset.actions list at its ID.
     """
-    from ..game_state import ActionType
-
     # Decode packet
     data = protocol.decode_ruleset_action(payload)
 
@@ -666,20 +722,22 @@ async def handle_ruleset_action(
     action = ActionType(
         id=data["id"],
         ui_name=data["ui_name"],
-        quiet=data["quiet"],
+        flags=ActionType.pack_flags(
+            data["quiet"],
+            data["actor_consuming_always"],
+            data["act_kind"],
+            data["tgt_kind"],
+            data["sub_tgt_kind"],
+        ),
         result=data["result"],
         sub_results=data["sub_results"],
-        actor_consuming_always=data["actor_consuming_always"],
-        act_kind=data["act_kind"],
-        tgt_kind=data["tgt_kind"],
-        sub_tgt_kind=data["sub_tgt_kind"],
         min_distance=data["min_distance"],
         max_distance=data["max_distance"],
         blocked_by=data["blocked_by"],
     )
 
     # Store in game state
-    game_state.actions[action.id] = action
+    store_by_id(game_state.ruleset.actions, action.id, action)
 
     # Map enum values for display
     actor_kind_names = {0: "Unit", 1: "Player", 2: "City", 3: "Tile"}
@@ -689,25 +747,26 @@ async def handle_ruleset_action(
     target_str = target_kind_names.get(action.tgt_kind, f"Unknown({action.tgt_kind})")
 
     # Display distance constraints
-    if action.max_distance == -1:
-        distance_str = f"min={action.min_distance}, unlimited"
-    else:
-        distance_str = f"{action.min_distance}-{action.max_distance}"
+    if logger.isEnabledFor(logging.INFO):
+        if action.max_distance == -1:
+            distance_str = f"min={action.min_distance}, unlimited"
+        else:
+            distance_str = f"{action.min_distance}-{action.max_distance}"
 
-    # Count blocking actions
-    blocking_count = bin(action.blocked_by).count("1")
+        # Count blocking actions
+        blocking_count = bin(action.blocked_by).count("1")
 
-    # Display summary
-    print(f"\n[ACTION {action.id}] {action.ui_name}")
-    print(f"  Actor: {actor_str}, Target: {target_str}")
-    print(f"  Distance: {distance_str}")
-    print(f"  Consumes actor: {action.actor_consuming_always}")
-    print(f"  Blocked by: {blocking_count} actions")
-    if action.quiet:
-        print(f"  (quiet mode)")
+        # Display summary
+        logger.info(f"\n[ACTION {action.id}] {action.ui_name}")
+        logger.info(f"  Actor: {actor_str}, Target: {target_str}")
+        logger.info(f"  Distance: {distance_str}")
+        logger.info(f"  Consumes actor: {action.actor_consuming_always}")
+        logger.info(f"  Blocked by: {blocking_count} actions")
+        if action.quiet:
+            logger.info(f"  (quiet mode)")
 
 
-async def handle_ruleset_action_enabler(
+def handle_ruleset_action_enabler(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -717,16 +776,14 @@ async def handle_ruleset_action_enabler(
     Each enabler specifies requirements for the actor (unit/city/player) and
     target (recipient of action). Multiple enablers can exist for the same action.
 
-    Updates game_state.action_enablers list by appending each new enabler.
+    Updates game_state.ruleset.action_enablers list by appending each new enabler.
     """
-    from ..game_state import ActionEnabler, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_action_enabler(payload, client._delta_cache)
 
     # Convert actor requirements to Requirement objects
     actor_requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -739,7 +796,7 @@ async def handle_ruleset_action_enabler(
 
     # Convert target requirements to Requirement objects
     target_requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -753,38 +810,40 @@ async def handle_ruleset_action_enabler(
     # Create ActionEnabler object
     enabler = ActionEnabler(
         enabled_action=data["enabled_action"],
-        actor_reqs_count=data["actor_reqs_count"],
         actor_reqs=actor_requirements,
-        target_reqs_count=data["target_reqs_count"],
         target_reqs=target_requirements,
     )
 
     # Append to game state (multiple enablers can exist for same action)
-    game_state.action_enablers.append(enabler)
+    game_state.ruleset.action_enablers.append(enabler)
 
     # Look up action name (if action has been received already)
     action_name = "Unknown"
-    if enabler.enabled_action in game_state.actions:
-        action_name = game_state.actions[enabler.enabled_action].ui_name
+    actions = game_state.ruleset.actions
+    if enabler.enabled_action < len(actions) and actions[enabler.enabled_action] is not None:
+        action_name = actions[enabler.enabled_action].ui_name
 
     # Display summary
-    print(f"\n[ACTION ENABLER] Action {enabler.enabled_action} ({action_name})")
-    print(f"  Actor requirements: {enabler.actor_reqs_count}")
-    print(f"  Target requirements: {enabler.target_reqs_count}")
-
-    # If requirement count is small (<=3), show detailed view
-    if enabler.actor_reqs_count <= 3 and enabler.actor_reqs_count > 0:
-        for i, req in enumerate(actor_requirements):
-            present_str = "present" if req.present else "absent"
-            print(f"    Actor req {i}: type={req.type}, value={req.value}, {present_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[ACTION ENABLER] Action {enabler.enabled_action} ({action_name})")
+        logger.info(f"  Actor requirements: {enabler.actor_reqs_count}")
+        logger.info(f"  Target requirements: {enabler.target_reqs_count}")
+
+        # If requirement count is small (<=3), show detailed view
+        if enabler.actor_reqs_count <= 3 and enabler.actor_reqs_count > 0:
+            for i, req in enumerate(actor_requirements):
+                present_str = "present" if req.present else "absent"
+                logger.info(f"    Actor req {i}: type={req.type}, value={req.value}, {present_str}")
 
-    if enabler.target_reqs_count <= 3 and enabler.target_reqs_count > 0:
-        for i, req in enumerate(target_requirements):
-            present_str = "present" if req.present else "absent"
-            print(f"    Target req {i}: type={req.type}, value={req.value}, {present_str}")
+        if enabler.target_reqs_count <= 3 and enabler.target_reqs_count > 0:
+            for i, req in enumerate(target_requirements):
+                present_str = "present" if req.present else "absent"
+                logger.info(
+                    f"    Target req {i}: type={req.type}, value={req.value}, {present_str}"
+                )
 
 
-async def handle_ruleset_action_auto(
+def handle_ruleset_action_auto(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -794,16 +853,14 @@ async def handle_ruleset_action_auto(
     without player input (e.g., disbanding unit on upkeep failure, auto-attack when
     moving adjacent to enemy).
 
-    Updates game_state.action_auto_performers list by appending each new configuration.
+    Updates game_state.ruleset.action_auto_performers list by appending each new configuration.
     """
-    from ..game_state import ActionAutoPerformer, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_action_auto(payload, client._delta_cache)
 
     # Convert requirements to Requirement objects
     requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -818,14 +875,12 @@ async def handle_ruleset_action_auto(
     auto_performer = ActionAutoPerformer(
         id=data["id"],
         cause=data["cause"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
-        alternatives_count=data["alternatives_count"],
         alternatives=data["alternatives"],
     )
 
     # Append to game state (multiple auto performers can exist)
-    game_state.action_auto_performers.append(auto_performer)
+    game_state.ruleset.action_auto_performers.append(auto_performer)
 
     # Cause enum names for display
     cause_names = {
@@ -838,20 +893,21 @@ async def handle_ruleset_action_auto(
     cause_name = cause_names.get(auto_performer.cause, f"UNKNOWN({auto_performer.cause})")
 
     # Display summary
-    print(f"\n[ACTION AUTO] ID {auto_performer.id}, Cause: {cause_name}")
-    print(f"  Requirements: {auto_performer.reqs_count}")
-    print(
-        f"  Alternative actions: {auto_performer.alternatives_count} - {auto_performer.alternatives}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[ACTION AUTO] ID {auto_performer.id}, Cause: {cause_name}")
+        logger.info(f"  Requirements: {auto_performer.reqs_count}")
+        logger.info(
+            f"  Alternative actions: {auto_performer.alternatives_count} - {auto_performer.alternatives}"
+        )
 
-    # If requirement count is small (<=3), show detailed view
-    if auto_performer.reqs_count <= 3 and auto_performer.reqs_count > 0:
-        for i, req in enumerate(requirements):
-            present_str = "present" if req.present else "absent"
-            print(f"    Req {i}: type={req.type}, value={req.value}, {present_str}")
+        # If requirement count is small (<=3), show detailed view
+        if auto_performer.reqs_count <= 3 and auto_performer.reqs_count > 0:
+            for i, req in enumerate(requirements):
+                present_str = "present" if req.present else "absent"
+                logger.info(f"    Req {i}: type={req.type}, value={req.value}, {present_str}")
 
 
-async def handle_ruleset_tech_flag(
+def handle_ruleset_tech_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -860,30 +916,24 @@ async def handle_ruleset_tech_flag(
     Technology flags are properties that can be assigned to technologies
     in the ruleset to define game mechanics and requirements.
 
-    Updates game_state.tech_flags dictionary with the technology flag.
+    Updates game_state.ruleset.tech_flags table with the technology flag.
     """
-    from ..game_state import TechFlag
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_tech_flag(payload, client._delta_cache)
 
-    # Create TechFlag object
-    tech_flag = TechFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state (keyed by ID)
-    game_state.tech_flags[tech_flag.id] = tech_flag
+    game_state.ruleset.tech_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[TECH FLAG {tech_flag.id}] {tech_flag.name}")
-    if tech_flag.helptxt:
-        # Truncate long help text for console display
-        help_preview = (
-            tech_flag.helptxt[:100] + "..." if len(tech_flag.helptxt) > 100 else tech_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[TECH FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            # Truncate long help text for console display
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_extra_flag(
+def handle_ruleset_extra_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -892,32 +942,24 @@ async def handle_ruleset_extra_flag(
     Extra flags are properties that can be assigned to extras (terrain features
     like forests, rivers, bases) in the ruleset to define game mechanics.
 
-    Updates game_state.extra_flags dictionary with the extra flag.
+    Updates game_state.ruleset.extra_flags table with the extra flag.
     """
-    from ..game_state import ExtraFlag
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_extra_flag(payload, client._delta_cache)
 
-    # Create ExtraFlag object
-    extra_flag = ExtraFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state (keyed by ID)
-    game_state.extra_flags[extra_flag.id] = extra_flag
+    game_state.ruleset.extra_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[EXTRA FLAG {extra_flag.id}] {extra_flag.name}")
-    if extra_flag.helptxt:
-        # Truncate long help text for console display
-        help_preview = (
-            extra_flag.helptxt[:100] + "..."
-            if len(extra_flag.helptxt) > 100
-            else extra_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[EXTRA FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            # Truncate long help text for console display
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_terrain_flag(
+def handle_ruleset_terrain_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -926,32 +968,24 @@ async def handle_ruleset_terrain_flag(
     Terrain flags are properties that can be assigned to terrain types
     in the ruleset to define game mechanics and requirements.
 
-    Updates game_state.terrain_flags dictionary with the terrain flag.
+    Updates game_state.ruleset.terrain_flags table with the terrain flag.
     """
-    from ..game_state import TerrainFlag
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_terrain_flag(payload, client._delta_cache)
 
-    # Create TerrainFlag object
-    terrain_flag = TerrainFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state (keyed by ID)
-    game_state.terrain_flags[terrain_flag.id] = terrain_flag
+    game_state.ruleset.terrain_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[TERRAIN FLAG {terrain_flag.id}] {terrain_flag.name}")
-    if terrain_flag.helptxt:
-        # Truncate long help text for console display
-        help_preview = (
-            terrain_flag.helptxt[:100] + "..."
-            if len(terrain_flag.helptxt) > 100
-            else terrain_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[TERRAIN FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            # Truncate long help text for console display
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_impr_flag(
+def handle_ruleset_impr_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -960,40 +994,30 @@ async def handle_ruleset_impr_flag(
     Improvement flags are properties that can be assigned to improvements
     (buildings/city improvements) in the ruleset to define game mechanics.
 
-    Updates game_state.improvement_flags dictionary with the improvement flag.
+    Updates game_state.ruleset.improvement_flags table with the improvement flag.
     """
-    from ..game_state import ImprFlag
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_impr_flag(payload, client._delta_cache)
 
-    # Create ImprFlag object
-    impr_flag = ImprFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state (keyed by ID)
-    game_state.improvement_flags[impr_flag.id] = impr_flag
+    game_state.ruleset.improvement_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[IMPR FLAG {impr_flag.id}] {impr_flag.name}")
-    if impr_flag.helptxt:
-        # Truncate long help text for console display
-        help_preview = (
-            impr_flag.helptxt[:100] + "..." if len(impr_flag.helptxt) > 100 else impr_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[IMPR FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            # Truncate long help text for console display
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_style(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_style(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_STYLE (239).
 
     Styles define thematic variations for nations, cities, and music.
-    Updates game_state.styles dictionary.
+    Updates game_state.ruleset.styles list, indexed by style ID.
     """
-    from ..game_state import Style
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_style(payload, client._delta_cache)
 
@@ -1001,61 +1025,54 @@ async def handle_ruleset_style(
     style = Style(id=data["id"], name=data["name"], rule_name=data["rule_name"])
 
     # Store in game state (keyed by ID)
-    game_state.styles[style.id] = style
+    store_by_id(game_state.ruleset.styles, style.id, style)
 
     # Display summary
-    print(f"\n[STYLE {style.id}] {style.name}")
-    print(f"  Rule Name: {style.rule_name}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[STYLE {style.id}] {style.name}")
+        logger.info(f"  Rule Name: {style.rule_name}")
 
 
-async def handle_ruleset_music(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_music(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_MUSIC (240).
 
     Music styles define soundtrack variations for nations/cities based on
-    cultural themes. Updates game_state.music_styles dictionary.
+    cultural themes. Updates game_state.ruleset.music_styles list, indexed by style ID.
     """
-    from ..game_state import MusicStyle, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_music(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    requirements = [Requirement(**req) for req in data.get("reqs", [])]
+    requirements = [Requirement.shared(**req) for req in data.get("reqs", [])]
 
     # Create MusicStyle object
     music_style = MusicStyle(
         id=data["id"],
         music_peaceful=data["music_peaceful"],
         music_combat=data["music_combat"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
     )
 
     # Store in game state
-    game_state.music_styles[music_style.id] = music_style
+    store_by_id(game_state.ruleset.music_styles, music_style.id, music_style)
 
     # Display summary
-    print(f"\n[MUSIC STYLE {music_style.id}]")
-    print(f"  Peaceful: {music_style.music_peaceful}")
-    print(f"  Combat: {music_style.music_combat}")
-    if music_style.reqs_count > 0:
-        print(f"  Requirements: {music_style.reqs_count}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[MUSIC STYLE {music_style.id}]")
+        logger.info(f"  Peaceful: {music_style.music_peaceful}")
+        logger.info(f"  Combat: {music_style.music_combat}")
+        if music_style.reqs_count > 0:
+            logger.info(f"  Requirements: {music_style.reqs_count}")
 
 
-async def handle_ruleset_effect(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_effect(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_EFFECT (175) - effect definition."""
-    from ..game_state import RulesetEffect, Requirement
-
     # Decode with delta cache
     data = protocol.decode_ruleset_effect(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    requirements = [Requirement(**req) for req in data["reqs"]]
+    requirements = [Requirement.shared(**req) for req in data["reqs"]]
 
     # Create RulesetEffect object
     effect = RulesetEffect(
@@ -1063,77 +1080,77 @@ async def handle_ruleset_effect(
         effect_value=data["effect_value"],
         has_multiplier=data["has_multiplier"],
         multiplier=data["multiplier"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
     )
 
     # Append to game state
-    game_state.effects.append(effect)
+    game_state.ruleset.effects.append(effect)
 
     # Display summary with effect name mapping
-    effect_names = {
-        0: "TechParasite",
-        1: "Airlift",
-        2: "AnyGovernment",
-        3: "Capital_City",
-        4: "Enable_Nuke",
-        5: "Enable_Space",
-        6: "Specialist_Output",
-        7: "Output_Bonus",
-        8: "Output_Bonus_2",
-        9: "Output_Add_Tile",
-        10: "Output_Inc_Tile",
-        11: "Output_Per_Tile",
-        12: "Output_Waste",
-        13: "Output_Waste_By_Distance",
-        14: "Output_Waste_Pct",
-        15: "Upkeep_Free",
-        16: "Pollu_Pop_Pct",
-        17: "Pollu_Pop_Pct_2",
-        18: "Pollu_Prod_Pct",
-        19: "Health_Pct",
-        20: "SS_Structural",
-        21: "SS_Component",
-        22: "SS_Module",
-        23: "Spy_Resistant",
-        24: "Move_Bonus",
-        25: "Unit_No_Lose_Pop",
-        26: "Unit_Recover",
-        27: "Upgrade_Unit",
-        28: "Enemy_Citizen_Unhappy_Pct",
-        29: "Make_Content_Mil_Per",
-        30: "Make_Content_Mil",
-        31: "Make_Content",
-        32: "Force_Content",
-        33: "Give_Imm_Tech",
-        34: "Growth_Food",
-        35: "Have_Embassies",
-        36: "Make_Happy",
-        37: "Unit_Bribe_Cost_Pct",
-        38: "No_Incite",
-        39: "Gain_AI_Love",
-        40: "Slow_Down_Timeline",
-        41: "Civil_War_Chance",
-        42: "Empire_Size_Mod",
-        43: "Empire_Size_Step",
-        44: "Max_Rates",
-        45: "Martial_Law_Each",
-        46: "Martial_Law_Max",
-        47: "Rapture_Grow",
-        48: "Revolution_Unhappiness",
-        49: "Has_Senate",
-        50: "Inspire_Partisans",
-    }
-    effect_name = effect_names.get(effect.effect_type, f"Unknown({effect.effect_type})")
-    multiplier_str = f", multiplier={effect.multiplier}" if effect.has_multiplier else ""
-
-    print(f"\n[EFFECT] {effect_name} (type {effect.effect_type})")
-    print(f"  Value: {effect.effect_value:+d}{multiplier_str}")
-    if effect.reqs_count > 0:
-        print(f"  Requirements: {effect.reqs_count}")
-
-
-async def handle_ruleset_unit_class(
+    if logger.isEnabledFor(logging.INFO):
+        effect_names = {
+            0: "TechParasite",
+            1: "Airlift",
+            2: "AnyGovernment",
+            3: "Capital_City",
+            4: "Enable_Nuke",
+            5: "Enable_Space",
+            6: "Specialist_Output",
+            7: "Output_Bonus",
+            8: "Output_Bonus_2",
+            9: "Output_Add_Tile",
+            10: "Output_Inc_Tile",
+            11: "Output_Per_Tile",
+            12: "Output_Waste",
+            13: "Output_Waste_By_Distance",
+            14: "Output_Waste_Pct",
+            15: "Upkeep_Free",
+            16: "Pollu_Pop_Pct",
+            17: "Pollu_Pop_Pct_2",
+            18: "Pollu_Prod_Pct",
+            19: "Health_Pct",
+            20: "SS_Structural",
+            21: "SS_Component",
+            22: "SS_Module",
+            23: "Spy_Resistant",
+            24: "Move_Bonus",
+            25: "Unit_No_Lose_Pop",
+            26: "Unit_Recover",
+            27: "Upgrade_Unit",
+            28: "Enemy_Citizen_Unhappy_Pct",
+            29: "Make_Content_Mil_Per",
+            30: "Make_Content_Mil",
+            31: "Make_Content",
+            32: "Force_Content",
+            33: "Give_Imm_Tech",
+            34: "Growth_Food",
+            35: "Have_Embassies",
+            36: "Make_Happy",
+            37: "Unit_Bribe_Cost_Pct",
+            38: "No_Incite",
+            39: "Gain_AI_Love",
+            40: "Slow_Down_Timeline",
+            41: "Civil_War_Chance",
+            42: "Empire_Size_Mod",
+            43: "Empire_Size_Step",
+            44: "Max_Rates",
+            45: "Martial_Law_Each",
+            46: "Martial_Law_Max",
+            47: "Rapture_Grow",
+            48: "Revolution_Unhappiness",
+            49: "Has_Senate",
+            50: "Inspire_Partisans",
+        }
+        effect_name = effect_names.get(effect.effect_type, f"Unknown({effect.effect_type})")
+        multiplier_str = f", multiplier={effect.multiplier}" if effect.has_multiplier else ""
+
+        logger.info(f"\n[EFFECT] {effect_name} (type {effect.effect_type})")
+        logger.info(f"  Value: {effect.effect_value:+d}{multiplier_str}")
+        if effect.reqs_count > 0:
+            logger.info(f"  Requirements: {effect.reqs_count}")
+
+
+def handle_ruleset_unit_class(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -1143,10 +1160,8 @@ async def handle_ruleset_unit_class(
     with shared movement and combat properties. Multiple packets sent during
     ruleset initialization (one per unit class).
 
-    Updates game_state.unit_classes dictionary with the unit class configuration.
+    Updates game_state.ruleset.unit_classes list with the unit class configuration.
     """
-    from ..game_state import UnitClass
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_unit_class(payload, client._delta_cache)
 
@@ -1159,35 +1174,28 @@ async def handle_ruleset_unit_class(
         hp_loss_pct=data["hp_loss_pct"],
         non_native_def_pct=data["non_native_def_pct"],
         flags=data["flags"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state (keyed by ID)
-    game_state.unit_classes[unit_class.id] = unit_class
+    store_by_id(game_state.ruleset.unit_classes, unit_class.id, unit_class)
 
     # Display summary
-    print(f"\n[UNIT CLASS {unit_class.id}] {unit_class.name} ({unit_class.rule_name})")
-    print(f"  Min Speed: {unit_class.min_speed}")
-    print(f"  HP Loss: {unit_class.hp_loss_pct}%")
-    print(f"  Non-native Defense: {unit_class.non_native_def_pct}%")
-    print(f"  Flags: 0x{unit_class.flags:08x}")
-
-    if unit_class.helptext:
-        # Truncate long help text for console display
-        help_preview = (
-            unit_class.helptext[:100] + "..."
-            if len(unit_class.helptext) > 100
-            else unit_class.helptext
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[UNIT CLASS {unit_class.id}] {unit_class.name} ({unit_class.rule_name})")
+        logger.info(f"  Min Speed: {unit_class.min_speed}")
+        logger.info(f"  HP Loss: {unit_class.hp_loss_pct}%")
+        logger.info(f"  Non-native Defense: {unit_class.non_native_def_pct}%")
+        logger.info(f"  Flags: 0x{unit_class.flags:08x}")
 
+        if unit_class.helptext_raw:
+            # Truncate long help text for console display
+            help_preview = _text_preview(unit_class.helptext_raw, 100)
+            logger.info(f"  Help: {help_preview}")
 
-async def handle_ruleset_base(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
-    """Handle PACKET_RULESET_BASE (153) - base type definition."""
-    from ..game_state import BaseType
 
+def handle_ruleset_base(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
+    """Handle PACKET_RULESET_BASE (153) - base type definition."""
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_base(payload, client._delta_cache)
 
@@ -1202,162 +1210,157 @@ async def handle_ruleset_base(
     )
 
     # Store in game state
-    game_state.base_types[base_type.id] = base_type
+    game_state.ruleset.base_types[base_type.id] = base_type
 
     # Display summary
-    gui_type_names = {0: "Fortress", 1: "Airbase", 2: "Other"}
-    gui_name = gui_type_names.get(base_type.gui_type, f"Unknown({base_type.gui_type})")
+    if logger.isEnabledFor(logging.INFO):
+        gui_type_names = {0: "Fortress", 1: "Airbase", 2: "Other"}
+        gui_name = gui_type_names.get(base_type.gui_type, f"Unknown({base_type.gui_type})")
 
-    print(f"\n[BASE TYPE {base_type.id}] {gui_name}")
-    print(f"  Border Expansion: {base_type.border_sq if base_type.border_sq >= 0 else 'None'}")
-    print(
-        f"  Vision (Main): {base_type.vision_main_sq if base_type.vision_main_sq >= 0 else 'None'}"
-    )
-    print(
-        f"  Vision (Invisible): {base_type.vision_invis_sq if base_type.vision_invis_sq >= 0 else 'None'}"
-    )
-    print(
-        f"  Vision (Submarines): {base_type.vision_subs_sq if base_type.vision_subs_sq >= 0 else 'None'}"
-    )
+        logger.info(f"\n[BASE TYPE {base_type.id}] {gui_name}")
+        logger.info(
+            f"  Border Expansion: {base_type.border_sq if base_type.border_sq >= 0 else 'None'}"
+        )
+        logger.info(
+            f"  Vision (Main): {base_type.vision_main_sq if base_type.vision_main_sq >= 0 else 'None'}"
+        )
+        logger.info(
+            f"  Vision (Invisible): {base_type.vision_invis_sq if base_type.vision_invis_sq >= 0 else 'None'}"
+        )
+        logger.info(
+            f"  Vision (Submarines): {base_type.vision_subs_sq if base_type.vision_subs_sq >= 0 else 'None'}"
+        )
 
 
-async def handle_ruleset_road(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_road(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_ROAD (220) - road type definition."""
-    from ..game_state import RoadType, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_road(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    first_reqs = [Requirement(**req) for req in data["first_reqs"]]
+    first_reqs = [Requirement.shared(**req) for req in data["first_reqs"]]
 
     # Create RoadType object
     road_type = RoadType(
         id=data["id"],
         gui_type=data["gui_type"],
-        first_reqs_count=data["first_reqs_count"],
         first_reqs=first_reqs,
         move_cost=data["move_cost"],
         move_mode=data["move_mode"],
-        tile_incr_const=data["tile_incr_const"],
-        tile_incr=data["tile_incr"],
-        tile_bonus=data["tile_bonus"],
+        tile_incr_const=array("H", data["tile_incr_const"]),
+        tile_incr=array("H", data["tile_incr"]),
+        tile_bonus=array("H", data["tile_bonus"]),
         compat=data["compat"],
         integrates=data["integrates"],
         flags=data["flags"],
     )
 
     # Store in game state
-    game_state.road_types[road_type.id] = road_type
+    game_state.ruleset.road_types[road_type.id] = road_type
 
     # Display summary
-    gui_type_names = {0: "Road", 1: "Railroad", 2: "Maglev", 3: "Other"}
-    move_mode_names = {0: "Cardinal", 1: "Relaxed", 2: "FastAlways"}
-    compat_names = {0: "Road", 1: "Railroad", 2: "River", 3: "None"}
-    output_names = ["Food", "Shield", "Trade", "Gold", "Luxury", "Science"]
-    flag_names = {0: "River", 1: "UnrestrictedInfra", 2: "JumpFrom", 3: "JumpTo"}
-
-    gui_name = gui_type_names.get(road_type.gui_type, f"Unknown({road_type.gui_type})")
-    mode_name = move_mode_names.get(road_type.move_mode, f"Unknown({road_type.move_mode})")
-    compat_name = compat_names.get(road_type.compat, f"Unknown({road_type.compat})")
-
-    print(f"\n[ROAD TYPE {road_type.id}] {gui_name}")
-    print(f"  Movement: cost={road_type.move_cost}, mode={mode_name}")
-    print(f"  Compatibility: {compat_name}")
-
-    # Display tile bonuses (only non-zero values)
-    bonuses = []
-    for i, (const_val, incr_val, bonus_val) in enumerate(
-        zip(road_type.tile_incr_const, road_type.tile_incr, road_type.tile_bonus)
-    ):
-        if const_val != 0 or incr_val != 0 or bonus_val != 0:
-            parts = []
-            if const_val != 0:
-                parts.append(f"+{const_val}")
-            if incr_val != 0:
-                parts.append(f"+{incr_val}%")
-            if bonus_val != 0:
-                parts.append(f"bonus={bonus_val}")
-            bonuses.append(f"{output_names[i]}({', '.join(parts)})")
-
-    if bonuses:
-        print(f"  Tile bonuses: {', '.join(bonuses)}")
-
-    # Display flags (if any active)
-    active_flags = []
-    for bit, name in flag_names.items():
-        if road_type.flags & (1 << bit):
-            active_flags.append(name)
-    if active_flags:
-        print(f"  Flags: {', '.join(active_flags)}")
-
-    # Display requirements count
-    if road_type.first_reqs_count > 0:
-        print(f"  Requirements: {road_type.first_reqs_count}")
-
-    # Display integrates count (if non-zero)
-    if road_type.integrates != 0:
-        # Count set bits
-        integrates_count = bin(road_type.integrates).count("1")
-        print(f"  Integrates with: {integrates_count} extras")
-
-
-async def handle_ruleset_goods(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        gui_type_names = {0: "Road", 1: "Railroad", 2: "Maglev", 3: "Other"}
+        move_mode_names = {0: "Cardinal", 1: "Relaxed", 2: "FastAlways"}
+        compat_names = {0: "Road", 1: "Railroad", 2: "River", 3: "None"}
+        output_names = ["Food", "Shield", "Trade", "Gold", "Luxury", "Science"]
+        flag_names = {0: "River", 1: "UnrestrictedInfra", 2: "JumpFrom", 3: "JumpTo"}
+
+        gui_name = gui_type_names.get(road_type.gui_type, f"Unknown({road_type.gui_type})")
+        mode_name = move_mode_names.get(road_type.move_mode, f"Unknown({road_type.move_mode})")
+        compat_name = compat_names.get(road_type.compat, f"Unknown({road_type.compat})")
+
+        logger.info(f"\n[ROAD TYPE {road_type.id}] {gui_name}")
+        logger.info(f"  Movement: cost={road_type.move_cost}, mode={mode_name}")
+        logger.info(f"  Compatibility: {compat_name}")
+
+        # Display tile bonuses (only non-zero values)
+        bonuses = []
+        for i, (const_val, incr_val, bonus_val) in enumerate(
+            zip(road_type.tile_incr_const, road_type.tile_incr, road_type.tile_bonus)
+        ):
+            if const_val != 0 or incr_val != 0 or bonus_val != 0:
+                parts = []
+                if const_val != 0:
+                    parts.append(f"+{const_val}")
+                if incr_val != 0:
+                    parts.append(f"+{incr_val}%")
+                if bonus_val != 0:
+                    parts.append(f"bonus={bonus_val}")
+                bonuses.append(f"{output_names[i]}({', '.join(parts)})")
+
+        if bonuses:
+            logger.info(f"  Tile bonuses: {', '.join(bonuses)}")
+
+        # Display flags (if any active)
+        active_flags = []
+        for bit, name in flag_names.items():
+            if road_type.flags & (1 << bit):
+                active_flags.append(name)
+        if active_flags:
+            logger.info(f"  Flags: {', '.join(active_flags)}")
+
+        # Display requirements count
+        if road_type.first_reqs_count > 0:
+            logger.info(f"  Requirements: {road_type.first_reqs_count}")
+
+        # Display integrates count (if non-zero)
+        if road_type.integrates != 0:
+            # Count set bits
+            integrates_count = bin(road_type.integrates).count("1")
+            logger.info(f"  Integrates with: {integrates_count} extras")
+
+
+def handle_ruleset_goods(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_GOODS (248) - trade goods configuration."""
-    from ..game_state import Goods, Requirement
-
     # Decode packet using delta cache
     data = protocol.decode_ruleset_goods(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    requirements = [Requirement(**req) for req in data.get("reqs", [])]
+    requirements = [Requirement.shared(**req) for req in data.get("reqs", [])]
 
     # Create Goods object
     goods = Goods(
         id=data["id"],
         name=data["name"],
         rule_name=data["rule_name"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
         from_pct=data["from_pct"],
         to_pct=data["to_pct"],
         onetime_pct=data["onetime_pct"],
         flags=data["flags"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state
-    game_state.goods[goods.id] = goods
+    store_by_id(game_state.ruleset.goods, goods.id, goods)
 
     # Display formatted summary
-    print(f"\n[GOODS {goods.id}] {goods.name} ({goods.rule_name})")
-    print(
-        f"  Trade Percentages: from={goods.from_pct}%, to={goods.to_pct}%, onetime={goods.onetime_pct}%"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[GOODS {goods.id}] {goods.name} ({goods.rule_name})")
+        logger.info(
+            f"  Trade Percentages: from={goods.from_pct}%, to={goods.to_pct}%, onetime={goods.onetime_pct}%"
+        )
 
-    if goods.reqs_count > 0:
-        print(f"  Requirements: {goods.reqs_count}")
+        if goods.reqs_count > 0:
+            logger.info(f"  Requirements: {goods.reqs_count}")
 
-    if goods.flags != 0:
-        flag_names = []
-        if goods.flags & 0x01:
-            flag_names.append("Bidirectional")
-        if goods.flags & 0x02:
-            flag_names.append("Depletes")
-        if goods.flags & 0x04:
-            flag_names.append("Self-Provided")
-        print(f"  Flags: {', '.join(flag_names)}")
+        if goods.flags != 0:
+            flag_names = []
+            if goods.flags & 0x01:
+                flag_names.append("Bidirectional")
+            if goods.flags & 0x02:
+                flag_names.append("Depletes")
+            if goods.flags & 0x04:
+                flag_names.append("Self-Provided")
+            logger.info(f"  Flags: {', '.join(flag_names)}")
 
-    if goods.helptext:
-        help_preview = goods.helptext[:100] + "..." if len(goods.helptext) > 100 else goods.helptext
-        print(f"  Help: {help_preview}")
+        if goods.helptext_raw:
+            help_preview = _text_preview(goods.helptext_raw, 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_unit_class_flag(
+def handle_ruleset_unit_class_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -1366,32 +1369,24 @@ async def handle_ruleset_unit_class_flag(
     Unit class flags are properties that can be assigned to unit classes
     in the ruleset to define game mechanics and requirements.
 
-    Updates game_state.unit_class_flags dictionary with the unit class flag.
+    Updates game_state.ruleset.unit_class_flags table with the unit class flag.
     """
-    from ..game_state import UnitClassFlag
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_unit_class_flag(payload, client._delta_cache)
 
-    # Create UnitClassFlag object
-    unit_class_flag = UnitClassFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state (keyed by ID)
-    game_state.unit_class_flags[unit_class_flag.id] = unit_class_flag
+    game_state.ruleset.unit_class_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[UNIT CLASS FLAG {unit_class_flag.id}] {unit_class_flag.name}")
-    if unit_class_flag.helptxt:
-        # Truncate long help text for console display
-        help_preview = (
-            unit_class_flag.helptxt[:100] + "..."
-            if len(unit_class_flag.helptxt) > 100
-            else unit_class_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[UNIT CLASS FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            # Truncate long help text for console display
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_unit_flag(
+def handle_ruleset_unit_flag(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -1400,27 +1395,21 @@ async def handle_ruleset_unit_flag(
     Unit flags are properties that can be assigned to units
     in the ruleset to define game mechanics and requirements.
     """
-    from ..game_state import UnitFlag
-
     # Decode packet
     data = protocol.decode_ruleset_unit_flag(payload, client._delta_cache)
 
-    # Create UnitFlag object
-    unit_flag = UnitFlag(id=data["id"], name=data["name"], helptxt=data["helptxt"])
-
     # Store in game state
-    game_state.unit_flags[unit_flag.id] = unit_flag
+    game_state.ruleset.unit_flags.store(data["id"], data["name"], data["helptxt"])
 
     # Display summary
-    print(f"\n[UNIT FLAG {unit_flag.id}] {unit_flag.name}")
-    if unit_flag.helptxt:
-        help_preview = (
-            unit_flag.helptxt[:100] + "..." if len(unit_flag.helptxt) > 100 else unit_flag.helptxt
-        )
-        print(f"  Help: {help_preview}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[UNIT FLAG {data['id']}] {data['name']}")
+        if data["helptxt"]:
+            help_preview = _text_preview(data["helptxt"], 100)
+            logger.info(f"  Help: {help_preview}")
 
 
-async def handle_ruleset_unit_bonus(
+def handle_ruleset_unit_bonus(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
@@ -1429,10 +1418,8 @@ async def handle_ruleset_unit_bonus(
     Defines conditional bonuses that units receive when fighting against enemies
     with specific flags (e.g., Pikemen get +50% defense vs Mounted units).
 
-    Updates game_state.unit_bonuses list by appending each new bonus.
+    Updates game_state.ruleset.unit_bonuses list by appending each new bonus.
     """
-    from ..game_state import UnitBonus
-
     # Decode packet with delta cache
     data = protocol.decode_ruleset_unit_bonus(payload, client._delta_cache)
 
@@ -1446,7 +1433,7 @@ async def handle_ruleset_unit_bonus(
     )
 
     # Append to game state (multiple bonuses can exist)
-    game_state.unit_bonuses.append(bonus)
+    game_state.ruleset.unit_bonuses.append(bonus)
 
     # Map enum values for display
     bonus_type_names = {
@@ -1461,36 +1448,34 @@ async def handle_ruleset_unit_bonus(
 
     # Look up unit name if available
     unit_name = f"Unit {bonus.unit}"
-    if bonus.unit in game_state.unit_types:
-        unit_name = game_state.unit_types[bonus.unit].name
+    unit_types = game_state.ruleset.unit_types
+    if bonus.unit < len(unit_types) and unit_types[bonus.unit] is not None:
+        unit_name = unit_types[bonus.unit].name
 
     # Look up flag name if available
     flag_name = f"Flag {bonus.flag}"
-    if bonus.flag in game_state.unit_flags:
-        flag_name = game_state.unit_flags[bonus.flag].name
+    if bonus.flag in game_state.ruleset.unit_flags:
+        flag_name = game_state.ruleset.unit_flags.name(bonus.flag)
 
     # Display summary
-    print(f"\n[UNIT BONUS] {unit_name} vs {flag_name}")
-    print(f"  Type: {type_str}, Value: {bonus.value}{quiet_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[UNIT BONUS] {unit_name} vs {flag_name}")
+        logger.info(f"  Type: {type_str}, Value: {bonus.value}{quiet_str}")
 
 
-async def handle_ruleset_tech(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_tech(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_TECH (144) - technology definition.
 
     Technologies represent scientific advances that players can research.
-    Updates game_state.techs dict with technology configuration.
+    Stores the Tech in the game_state.ruleset.techs list at its ID.
     """
-    from ..game_state import Tech, Requirement
-
     # Decode packet with delta cache
     data = protocol.decode_ruleset_tech(payload, client._delta_cache)
 
     # Convert research requirements to Requirement objects
     research_requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -1505,7 +1490,6 @@ async def handle_ruleset_tech(
     tech = Tech(
         id=data["id"],
         root_req=data["root_req"],
-        research_reqs_count=data["research_reqs_count"],
         research_reqs=research_requirements,
         tclass=data["tclass"],
         removed=data["removed"],
@@ -1514,50 +1498,49 @@ async def handle_ruleset_tech(
         num_reqs=data["num_reqs"],
         name=data["name"],
         rule_name=data["rule_name"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
         graphic_str=data["graphic_str"],
         graphic_alt=data["graphic_alt"],
     )
 
     # Store in game state
-    game_state.techs[tech.id] = tech
+    store_by_id(game_state.ruleset.techs, tech.id, tech)
 
     # Display summary
-    status = "REMOVED" if tech.removed else "active"
-    print(f"\n[TECH {tech.id}] {tech.name} ({tech.rule_name}) - {status}")
-    print(f"  Cost: {tech.cost} beakers")
-    print(f"  Class: {tech.tclass}")
-
-    if tech.root_req != 0:
-        print(f"  Root requirement: Tech {tech.root_req}")
-
-    if tech.research_reqs_count > 0:
-        print(f"  Research requirements: {tech.research_reqs_count}")
-        if tech.research_reqs_count <= 3:
-            for i, req in enumerate(research_requirements):
-                present_str = "present" if req.present else "absent"
-                print(f"    Req {i}: type={req.type}, value={req.value}, {present_str}")
+    if logger.isEnabledFor(logging.INFO):
+        status = "REMOVED" if tech.removed else "active"
+        logger.info(f"\n[TECH {tech.id}] {tech.name} ({tech.rule_name}) - {status}")
+        logger.info(f"  Cost: {tech.cost} beakers")
+        logger.info(f"  Class: {tech.tclass}")
+
+        if tech.root_req != 0:
+            logger.info(f"  Root requirement: Tech {tech.root_req}")
 
-    if tech.flags != 0:
-        flag_count = bin(tech.flags).count("1")
-        print(f"  Flags: {flag_count} active (0x{tech.flags:x})")
+        if tech.research_reqs_count > 0:
+            logger.info(f"  Research requirements: {tech.research_reqs_count}")
+            if tech.research_reqs_count <= 3:
+                for i, req in enumerate(research_requirements):
+                    present_str = "present" if req.present else "absent"
+                    logger.info(f"    Req {i}: type={req.type}, value={req.value}, {present_str}")
 
-    if tech.helptext:
-        help_preview = tech.helptext[:80] + "..." if len(tech.helptext) > 80 else tech.helptext
-        print(f"  Help: {help_preview}")
+        if tech.flags != 0:
+            flag_count = bin(tech.flags).count("1")
+            logger.info(f"  Flags: {flag_count} active (0x{tech.flags:x})")
 
+        if tech.helptext_raw:
+            help_preview = _text_preview(tech.helptext_raw, 80)
+            logger.info(f"  Help: {help_preview}")
 
-async def handle_ruleset_government_ruler_title(
+
+def handle_ruleset_government_ruler_title(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
     Handle PACKET_RULESET_GOVERNMENT_RULER_TITLE (143) - ruler title definition.
 
-    Updates game_state.government_ruler_titles list with ruler titles for
+    Updates game_state.ruleset.government_ruler_titles list with ruler titles for
     government/nation combinations.
     """
-    from ..game_state import GovernmentRulerTitle
-
     # Decode packet with delta cache
     data = protocol.decode_ruleset_government_ruler_title(payload, client._delta_cache)
 
@@ -1570,31 +1553,30 @@ async def handle_ruleset_government_ruler_title(
     )
 
     # Store in game state
-    game_state.government_ruler_titles.append(ruler_title)
+    game_state.ruleset.government_ruler_titles.append(ruler_title)
 
     # Display summary
-    print(
-        f"[RULER TITLE] Gov {ruler_title.gov}, Nation {ruler_title.nation}: "
-        f"{ruler_title.male_title}/{ruler_title.female_title}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"[RULER TITLE] Gov {ruler_title.gov}, Nation {ruler_title.nation}: "
+            f"{ruler_title.male_title}/{ruler_title.female_title}"
+        )
 
 
-async def handle_ruleset_government(
+def handle_ruleset_government(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """
     Handle PACKET_RULESET_GOVERNMENT (145) - government type definition.
 
-    Updates game_state.governments dict with government configuration.
+    Stores the Government in the game_state.ruleset.governments list at its ID.
     """
-    from ..game_state import Government, Requirement
-
     # Decode packet with delta cache
     data = protocol.decode_ruleset_government(payload, client._delta_cache)
 
     # Convert requirements to Requirement objects
     requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -1608,7 +1590,6 @@ async def handle_ruleset_government(
     # Create Government object
     government = Government(
         id=data["id"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
         name=data["name"],
         rule_name=data["rule_name"],
@@ -1617,37 +1598,34 @@ async def handle_ruleset_government(
         sound_str=data["sound_str"],
         sound_alt=data["sound_alt"],
         sound_alt2=data["sound_alt2"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state
-    game_state.governments[government.id] = government
+    store_by_id(game_state.ruleset.governments, government.id, government)
 
     # Display summary
-    print(f"\n[GOVERNMENT {government.id}] {government.name} ({government.rule_name})")
-    print(f"  Graphics: {government.graphic_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[GOVERNMENT {government.id}] {government.name} ({government.rule_name})")
+        logger.info(f"  Graphics: {government.graphic_str}")
 
-    if government.reqs_count > 0:
-        print(f"  Requirements: {government.reqs_count}")
+        if government.reqs_count > 0:
+            logger.info(f"  Requirements: {government.reqs_count}")
 
 
-async def handle_ruleset_unit(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_unit(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_UNIT (140) - unit type definition.
 
     Defines characteristics of military/civilian units (Warrior, Settler, etc.).
     One packet sent per unit type during ruleset initialization.
     """
-    from ..game_state import UnitType, Requirement
-
     # Decode with delta cache
     data = protocol.decode_ruleset_unit(payload, client._delta_cache)
 
     # Convert requirements dicts to Requirement objects
     requirements = [
-        Requirement(
+        Requirement.shared(
             type=req["type"],
             value=req["value"],
             range=req["range"],
@@ -1674,14 +1652,13 @@ async def handle_ruleset_unit(
         build_cost=data["build_cost"],
         pop_cost=data["pop_cost"],
         happy_cost=data["happy_cost"],
-        upkeep=data["upkeep"],
+        upkeep=array("B", data["upkeep"]),
         attack_strength=data["attack_strength"],
         defense_strength=data["defense_strength"],
         firepower=data["firepower"],
         hp=data["hp"],
         move_rate=data["move_rate"],
         fuel=data["fuel"],
-        build_reqs_count=data["build_reqs_count"],
         build_reqs=requirements,
         vision_radius_sq=data["vision_radius_sq"],
         transport_capacity=data["transport_capacity"],
@@ -1698,65 +1675,63 @@ async def handle_ruleset_unit(
         tp_defense=data["tp_defense"],
         targets=data["targets"],
         vlayer=data["vlayer"],
-        veteran_levels=data["veteran_levels"],
         veteran_name=data["veteran_name"],
-        power_fact=data["power_fact"],
-        move_bonus=data["move_bonus"],
-        base_raise_chance=data["base_raise_chance"],
-        work_raise_chance=data["work_raise_chance"],
+        power_fact=array("H", data["power_fact"]),
+        move_bonus=array("I", data["move_bonus"]),
+        base_raise_chance=array("B", data["base_raise_chance"]),
+        work_raise_chance=array("B", data["work_raise_chance"]),
         flags=data["flags"],
         roles=data["roles"],
         worker=data["worker"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state
-    game_state.unit_types[unit_type.id] = unit_type
+    store_by_id(game_state.ruleset.unit_types, unit_type.id, unit_type)
+    game_state.ruleset._unit_by_rule_name[unit_type.rule_name] = unit_type.id
 
     # Display summary
-    print(f"\n[UNIT {unit_type.id}] {unit_type.name} ({unit_type.rule_name})")
-    print(f"  Cost: {unit_type.build_cost} shields", end="")
-    if unit_type.pop_cost > 0:
-        print(f", {unit_type.pop_cost} pop", end="")
-    print()
-
-    print(
-        f"  Combat: {unit_type.attack_strength}/{unit_type.defense_strength}/{unit_type.hp} HP",
-        end="",
-    )
-    if unit_type.firepower > 1:
-        print(f", firepower {unit_type.firepower}", end="")
-    print()
-
-    print(f"  Movement: {unit_type.move_rate}", end="")
-    if unit_type.fuel > 0:
-        print(f", fuel {unit_type.fuel}", end="")
-    print()
-
-    # Display special abilities
-    abilities = []
-    if unit_type.worker:
-        abilities.append("worker")
-    if unit_type.transport_capacity > 0:
-        abilities.append(f"transport({unit_type.transport_capacity})")
-    if unit_type.bombard_rate > 0:
-        abilities.append(f"bombard({unit_type.bombard_rate})")
-    if unit_type.paratroopers_range > 0:
-        abilities.append(f"paradrop({unit_type.paratroopers_range})")
-    if unit_type.city_size > 0:
-        abilities.append(f"found_city({unit_type.city_size})")
-
-    if abilities:
-        print(f"  Abilities: {', '.join(abilities)}")
-
-    # Display veteran system if present
-    if unit_type.veteran_levels > 0:
-        print(f"  Veteran levels: {unit_type.veteran_levels}")
-
-
-async def handle_ruleset_extra(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[UNIT {unit_type.id}] {unit_type.name} ({unit_type.rule_name})")
+        cost_str = f"  Cost: {unit_type.build_cost} shields"
+        if unit_type.pop_cost > 0:
+            cost_str += f", {unit_type.pop_cost} pop"
+        logger.info(cost_str)
+
+        combat_str = (
+            f"  Combat: {unit_type.attack_strength}/{unit_type.defense_strength}/{unit_type.hp} HP"
+        )
+        if unit_type.firepower > 1:
+            combat_str += f", firepower {unit_type.firepower}"
+        logger.info(combat_str)
+
+        movement_str = f"  Movement: {unit_type.move_rate}"
+        if unit_type.fuel > 0:
+            movement_str += f", fuel {unit_type.fuel}"
+        logger.info(movement_str)
+
+        # Display special abilities
+        abilities = []
+        if unit_type.worker:
+            abilities.append("worker")
+        if unit_type.transport_capacity > 0:
+            abilities.append(f"transport({unit_type.transport_capacity})")
+        if unit_type.bombard_rate > 0:
+            abilities.append(f"bombard({unit_type.bombard_rate})")
+        if unit_type.paratroopers_range > 0:
+            abilities.append(f"paradrop({unit_type.paratroopers_range})")
+        if unit_type.city_size > 0:
+            abilities.append(f"found_city({unit_type.city_size})")
+
+        if abilities:
+            logger.info(f"  Abilities: {', '.join(abilities)}")
+
+        # Display veteran system if present
+        if unit_type.veteran_levels > 0:
+            logger.info(f"  Veteran levels: {unit_type.veteran_levels}")
+
+
+def handle_ruleset_extra(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESET_EXTRA (232) - extra type definition.
 
@@ -1764,18 +1739,16 @@ async def handle_ruleset_extra(
     map improvements. This packet defines the properties and behavior of each
     extra type in the ruleset.
 
-    Updates game_state.extras dict with ExtraType objects keyed by extra ID.
+    Updates game_state.ruleset.extras list with ExtraType objects indexed by extra ID.
     """
-    from ..game_state import ExtraType, Requirement
-
     # Decode packet
     data = protocol.decode_ruleset_extra(payload, client._delta_cache)
 
     # Convert requirement arrays to Requirement objects
-    reqs = [Requirement(**req) for req in data.get("reqs", [])]
-    rmreqs = [Requirement(**req) for req in data.get("rmreqs", [])]
-    appearance_reqs = [Requirement(**req) for req in data.get("appearance_reqs", [])]
-    disappearance_reqs = [Requirement(**req) for req in data.get("disappearance_reqs", [])]
+    reqs = [Requirement.shared(**req) for req in data.get("reqs", [])]
+    rmreqs = [Requirement.shared(**req) for req in data.get("rmreqs", [])]
+    appearance_reqs = [Requirement.shared(**req) for req in data.get("appearance_reqs", [])]
+    disappearance_reqs = [Requirement.shared(**req) for req in data.get("disappearance_reqs", [])]
 
     # Create ExtraType object with all 41 fields
     extra = ExtraType(
@@ -1793,15 +1766,11 @@ async def handle_ruleset_extra(
         rmact_gfx_alt2=data.get("rmact_gfx_alt2", ""),
         graphic_str=data.get("graphic_str", ""),
         graphic_alt=data.get("graphic_alt", ""),
-        reqs_count=data.get("reqs_count", 0),
         reqs=reqs,
-        rmreqs_count=data.get("rmreqs_count", 0),
         rmreqs=rmreqs,
         appearance_chance=data.get("appearance_chance", 0),
-        appearance_reqs_count=data.get("appearance_reqs_count", 0),
         appearance_reqs=appearance_reqs,
         disappearance_chance=data.get("disappearance_chance", 0),
-        disappearance_reqs_count=data.get("disappearance_reqs_count", 0),
         disappearance_reqs=disappearance_reqs,
         visibility_req=data.get("visibility_req", 0),
         buildable=data.get("buildable", False),
@@ -1819,45 +1788,47 @@ async def handle_ruleset_extra(
         bridged_over=data.get("bridged_over", 0),
         conflicts=data.get("conflicts", 0),
         no_aggr_near_city=data.get("no_aggr_near_city", 0),
-        helptext=data.get("helptext", ""),
+        helptext_raw=data.get("helptext", b""),
     )
 
     # Store in game state
-    game_state.extras[extra.id] = extra
+    store_by_id(game_state.ruleset.extras, extra.id, extra)
+    game_state.ruleset._extra_by_rule_name[extra.rule_name] = extra.id
 
     # Display summary
-    print(f"\n[EXTRA {extra.id}] {extra.name} ({extra.rule_name})")
-    print(f"  Category: {extra.category}")
-
-    # Display build info
-    if extra.buildable:
-        build_info = f"buildable"
-        if extra.build_time > 0:
-            build_info += f", {extra.build_time} turns"
-        print(f"  Build: {build_info}")
-
-    # Display removal info
-    if extra.removal_time > 0:
-        print(f"  Removal: {extra.removal_time} turns")
-
-    # Display special properties
-    properties = []
-    if extra.generated:
-        properties.append("auto-generated")
-    if extra.defense_bonus > 0:
-        properties.append(f"+{extra.defense_bonus}% defense")
-    if extra.infracost > 0:
-        properties.append(f"infracost {extra.infracost}")
-
-    if properties:
-        print(f"  Properties: {', '.join(properties)}")
-
-    # Display requirements if present
-    if extra.reqs_count > 0:
-        print(f"  Build requirements: {extra.reqs_count}")
-
-
-async def handle_ruleset_terrain_control(
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[EXTRA {extra.id}] {extra.name} ({extra.rule_name})")
+        logger.info(f"  Category: {extra.category}")
+
+        # Display build info
+        if extra.buildable:
+            build_info = f"buildable"
+            if extra.build_time > 0:
+                build_info += f", {extra.build_time} turns"
+            logger.info(f"  Build: {build_info}")
+
+        # Display removal info
+        if extra.removal_time > 0:
+            logger.info(f"  Removal: {extra.removal_time} turns")
+
+        # Display special properties
+        properties = []
+        if extra.generated:
+            properties.append("auto-generated")
+        if extra.defense_bonus > 0:
+            properties.append(f"+{extra.defense_bonus}% defense")
+        if extra.infracost > 0:
+            properties.append(f"infracost {extra.infracost}")
+
+        if properties:
+            logger.info(f"  Properties: {', '.join(properties)}")
+
+        # Display requirements if present
+        if extra.reqs_count > 0:
+            logger.info(f"  Build requirements: {extra.reqs_count}")
+
+
+def handle_ruleset_terrain_control(
     client: "FreeCivClient", game_state: GameState, payload: bytes
 ) -> None:
     """Handle PACKET_RULESET_TERRAIN_CONTROL (146) - terrain control settings.
@@ -1865,7 +1836,7 @@ async def handle_ruleset_terrain_control(
     Contains global terrain mechanics configuration including movement rules,
     channel/reclaim requirements, lake size limits, and GUI type mappings.
 
-    Updates game_state.terrain_control with the configuration.
+    Updates game_state.ruleset.terrain_control with the configuration.
     """
     # Decode packet
     data = protocol.decode_ruleset_terrain_control(payload, client._delta_cache)
@@ -1887,58 +1858,63 @@ async def handle_ruleset_terrain_control(
     )
 
     # Store in game state
-    game_state.terrain_control = terrain_control
+    game_state.ruleset.terrain_control = terrain_control
 
     # Display formatted summary
-    print("\n[TERRAIN CONTROL]")
-    print(f"  Movement: {terrain_control.move_fragments} fragments per move")
-    print(f"  Ignore Terrain Cost: {terrain_control.igter_cost}")
-    print(f"  Pythagorean Diagonal: {'Yes' if terrain_control.pythagorean_diagonal else 'No'}")
-    print(f"  Infrastructure Points: {'Enabled' if terrain_control.infrapoints else 'Disabled'}")
-    print(f"  Lake Max Size: {terrain_control.lake_max_size}")
-    print(f"  Min Start Native Area: {terrain_control.min_start_native_area}")
-
-    # Display transformation percentages if non-zero
-    transformations = []
-    if terrain_control.ocean_reclaim_requirement_pct > 0:
-        transformations.append(f"Ocean reclaim: {terrain_control.ocean_reclaim_requirement_pct}%")
-    if terrain_control.land_channel_requirement_pct > 0:
-        transformations.append(f"Land channel: {terrain_control.land_channel_requirement_pct}%")
-    if terrain_control.terrain_thaw_requirement_pct > 0:
-        transformations.append(f"Terrain thaw: {terrain_control.terrain_thaw_requirement_pct}%")
-    if terrain_control.terrain_freeze_requirement_pct > 0:
-        transformations.append(f"Terrain freeze: {terrain_control.terrain_freeze_requirement_pct}%")
-
-    if transformations:
-        print("  Transformation requirements:")
-        for transform in transformations:
-            print(f"    - {transform}")
-
-    # Display GUI type bases if set
-    gui_types = []
-    if terrain_control.gui_type_base0:
-        gui_types.append(f"Base 0: {terrain_control.gui_type_base0}")
-    if terrain_control.gui_type_base1:
-        gui_types.append(f"Base 1: {terrain_control.gui_type_base1}")
-
-    if gui_types:
-        print("  GUI Types:")
-        for gui_type in gui_types:
-            print(f"    - {gui_type}")
-
-
-async def handle_ruleset_building(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n[TERRAIN CONTROL]")
+        logger.info(f"  Movement: {terrain_control.move_fragments} fragments per move")
+        logger.info(f"  Ignore Terrain Cost: {terrain_control.igter_cost}")
+        logger.info(
+            f"  Pythagorean Diagonal: {'Yes' if terrain_control.pythagorean_diagonal else 'No'}"
+        )
+        logger.info(
+            f"  Infrastructure Points: {'Enabled' if terrain_control.infrapoints else 'Disabled'}"
+        )
+        logger.info(f"  Lake Max Size: {terrain_control.lake_max_size}")
+        logger.info(f"  Min Start Native Area: {terrain_control.min_start_native_area}")
+
+        # Display transformation percentages if non-zero
+        transformations = []
+        if terrain_control.ocean_reclaim_requirement_pct > 0:
+            transformations.append(
+                f"Ocean reclaim: {terrain_control.ocean_reclaim_requirement_pct}%"
+            )
+        if terrain_control.land_channel_requirement_pct > 0:
+            transformations.append(f"Land channel: {terrain_control.land_channel_requirement_pct}%")
+        if terrain_control.terrain_thaw_requirement_pct > 0:
+            transformations.append(f"Terrain thaw: {terrain_control.terrain_thaw_requirement_pct}%")
+        if terrain_control.terrain_freeze_requirement_pct > 0:
+            transformations.append(
+                f"Terrain freeze: {terrain_control.terrain_freeze_requirement_pct}%"
+            )
+
+        if transformations:
+            logger.info("  Transformation requirements:")
+            for transform in transformations:
+                logger.info(f"    - {transform}")
+
+        # Display GUI type bases if set
+        gui_types = []
+        if terrain_control.gui_type_base0:
+            gui_types.append(f"Base 0: {terrain_control.gui_type_base0}")
+        if terrain_control.gui_type_base1:
+            gui_types.append(f"Base 1: {terrain_control.gui_type_base1}")
+
+        if gui_types:
+            logger.info("  GUI Types:")
+            for gui_type in gui_types:
+                logger.info(f"    - {gui_type}")
+
+
+def handle_ruleset_building(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_BUILDING (150) - building/improvement type definition."""
-    from fc_client.game_state import Building, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_building(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    reqs = [Requirement(**req) for req in data["reqs"]]
-    obs_reqs = [Requirement(**req) for req in data["obs_reqs"]]
+    reqs = [Requirement.shared(**req) for req in data["reqs"]]
+    obs_reqs = [Requirement.shared(**req) for req in data["obs_reqs"]]
 
     # Create Building object
     building = Building(
@@ -1949,9 +1925,7 @@ async def handle_ruleset_building(
         graphic_str=data["graphic_str"],
         graphic_alt=data["graphic_alt"],
         graphic_alt2=data["graphic_alt2"],
-        reqs_count=data["reqs_count"],
         reqs=reqs,
-        obs_count=data["obs_count"],
         obs_reqs=obs_reqs,
         build_cost=data["build_cost"],
         upkeep=data["upkeep"],
@@ -1960,43 +1934,39 @@ async def handle_ruleset_building(
         soundtag=data["soundtag"],
         soundtag_alt=data["soundtag_alt"],
         soundtag_alt2=data["soundtag_alt2"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state
-    game_state.buildings[building.id] = building
+    store_by_id(game_state.ruleset.buildings, building.id, building)
+    game_state.ruleset._building_by_rule_name[building.rule_name] = building.id
 
     # Display summary
-    genus_names = {0: "GreatWonder", 1: "SmallWonder", 2: "Improvement"}
-    genus_name = genus_names.get(building.genus, f"Unknown({building.genus})")
-
-    print(f"\n[BUILDING {building.id}] {building.name} ({building.rule_name})")
-    print(f"  Type: {genus_name}")
-    print(f"  Build Cost: {building.build_cost}")
-    print(f"  Upkeep: {building.upkeep}")
-    print(f"  Sabotage: {building.sabotage}")
-    print(f"  Flags: 0x{building.flags:08x}")
-    print(f"  Requirements: {building.reqs_count}")
-    print(f"  Obsolete Reqs: {building.obs_count}")
-
-    if building.helptext:
-        # Truncate long help text for console display
-        help_preview = (
-            building.helptext[:100] + "..." if len(building.helptext) > 100 else building.helptext
-        )
-        print(f"  Help: {help_preview}")
-
-
-async def handle_ruleset_city(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+    if logger.isEnabledFor(logging.INFO):
+        genus_names = {0: "GreatWonder", 1: "SmallWonder", 2: "Improvement"}
+        genus_name = genus_names.get(building.genus, f"Unknown({building.genus})")
+
+        logger.info(f"\n[BUILDING {building.id}] {building.name} ({building.rule_name})")
+        logger.info(f"  Type: {genus_name}")
+        logger.info(f"  Build Cost: {building.build_cost}")
+        logger.info(f"  Upkeep: {building.upkeep}")
+        logger.info(f"  Sabotage: {building.sabotage}")
+        logger.info(f"  Flags: 0x{building.flags:08x}")
+        logger.info(f"  Requirements: {building.reqs_count}")
+        logger.info(f"  Obsolete Reqs: {building.obs_count}")
+
+        if building.helptext_raw:
+            # Truncate long help text for console display
+            help_preview = _text_preview(building.helptext_raw, 100)
+            logger.info(f"  Help: {help_preview}")
+
+
+def handle_ruleset_city(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_CITY (149) - city style definitions.
 
     Defines city graphical styles with cultural themes (European, Classical, etc.)
     including graphics, citizen graphics, and build requirements.
     """
-    from ..game_state import CityStyle, Requirement
-    from .. import protocol
 
     # Decode packet
     data = protocol.decode_ruleset_city(payload, client._delta_cache)
@@ -2004,7 +1974,7 @@ async def handle_ruleset_city(
     # Convert requirement dicts to Requirement objects
     requirements = []
     for req_dict in data.get("reqs", []):
-        req = Requirement(
+        req = Requirement.shared(
             type=req_dict["type"],
             value=req_dict["value"],
             range=req_dict["range"],
@@ -2020,30 +1990,28 @@ async def handle_ruleset_city(
         name=data["name"],
         rule_name=data["rule_name"],
         citizens_graphic=data["citizens_graphic"],
-        reqs_count=data["reqs_count"],
         reqs=requirements,
         graphic=data["graphic"],
         graphic_alt=data["graphic_alt"],
     )
 
     # Store in game state
-    client.game_state.city_styles[city_style.style_id] = city_style
+    store_by_id(client.game_state.ruleset.city_styles, city_style.style_id, city_style)
 
     # Display summary
-    print(f"[CITY STYLE {city_style.style_id}] {city_style.name} ({city_style.rule_name})")
-    print(f"  Citizens Graphic: {city_style.citizens_graphic}")
-    print(f"  Graphic: {city_style.graphic}")
-    if city_style.graphic_alt:
-        print(f"  Alt Graphic: {city_style.graphic_alt}")
-    print(f"  Requirements: {city_style.reqs_count}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"[CITY STYLE {city_style.style_id}] {city_style.name} ({city_style.rule_name})"
+        )
+        logger.info(f"  Citizens Graphic: {city_style.citizens_graphic}")
+        logger.info(f"  Graphic: {city_style.graphic}")
+        if city_style.graphic_alt:
+            logger.info(f"  Alt Graphic: {city_style.graphic_alt}")
+        logger.info(f"  Requirements: {city_style.reqs_count}")
 
 
-async def handle_ruleset_terrain(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_terrain(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_TERRAIN (151) - terrain type definition."""
-    from fc_client.game_state import Terrain
-
     # Decode packet
     data = protocol.decode_ruleset_terrain(payload, client._delta_cache)
 
@@ -2060,11 +2028,10 @@ async def handle_ruleset_terrain(
         graphic_alt2=data["graphic_alt2"],
         movement_cost=data["movement_cost"],
         defense_bonus=data["defense_bonus"],
-        output=data["output"],
-        num_resources=data["num_resources"],
+        output=array("B", data["output"]),
         resources=data["resources"],
         resource_freq=data["resource_freq"],
-        road_output_incr_pct=data["road_output_incr_pct"],
+        road_output_incr_pct=array("H", data["road_output_incr_pct"]),
         base_time=data["base_time"],
         road_time=data["road_time"],
         cultivate_result=data["cultivate_result"],
@@ -2080,52 +2047,47 @@ async def handle_ruleset_terrain(
         transform_time=data["transform_time"],
         placing_time=data["placing_time"],
         pillage_time=data["pillage_time"],
-        extra_count=data["extra_count"],
         extra_removal_times=data["extra_removal_times"],
         color_red=data["color_red"],
         color_green=data["color_green"],
         color_blue=data["color_blue"],
-        helptext=data["helptext"],
+        helptext_raw=data["helptext"],
     )
 
     # Store in game state
-    game_state.terrains[terrain.id] = terrain
+    store_by_id(game_state.ruleset.terrains, terrain.id, terrain)
+    game_state.ruleset._terrain_by_rule_name[terrain.rule_name] = terrain.id
 
     # Display summary
-    if len(terrain.output) >= 3:
-        output_str = f"F:{terrain.output[0]} S:{terrain.output[1]} T:{terrain.output[2]}"
-    else:
-        output_str = "N/A"
-    print(f"[TERRAIN {terrain.id}] {terrain.name} ({terrain.rule_name})")
-    print(f"  Movement: {terrain.movement_cost}, Defense: {terrain.defense_bonus:+d}%")
-    print(f"  Output: {output_str}")
+    if logger.isEnabledFor(logging.INFO):
+        if len(terrain.output) >= 3:
+            output_str = f"F:{terrain.output[0]} S:{terrain.output[1]} T:{terrain.output[2]}"
+        else:
+            output_str = "N/A"
+        logger.info(f"[TERRAIN {terrain.id}] {terrain.name} ({terrain.rule_name})")
+        logger.info(f"  Movement: {terrain.movement_cost}, Defense: {terrain.defense_bonus:+d}%")
+        logger.info(f"  Output: {output_str}")
 
 
-async def handle_ruleset_clause(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_ruleset_clause(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """Handle PACKET_RULESET_CLAUSE (512) - diplomatic clause type definition."""
-    from fc_client.game_state import ClauseType, Requirement
-
     # Decode packet with delta cache support
     data = protocol.decode_ruleset_clause(payload, client._delta_cache)
 
     # Convert requirement dicts to Requirement objects
-    giver_reqs = [Requirement(**req) for req in data["giver_reqs"]]
-    receiver_reqs = [Requirement(**req) for req in data["receiver_reqs"]]
+    giver_reqs = [Requirement.shared(**req) for req in data["giver_reqs"]]
+    receiver_reqs = [Requirement.shared(**req) for req in data["receiver_reqs"]]
 
     # Create ClauseType object
     clause = ClauseType(
         type=data["type"],
         enabled=data["enabled"],
-        giver_reqs_count=data["giver_reqs_count"],
         giver_reqs=giver_reqs,
-        receiver_reqs_count=data["receiver_reqs_count"],
         receiver_reqs=receiver_reqs,
     )
 
     # Store in game state
-    game_state.clause_types[clause.type] = clause
+    game_state.ruleset.clause_types[clause.type] = clause
 
     # Clause type names for display
     clause_names = {
@@ -2146,18 +2108,17 @@ async def handle_ruleset_clause(
     status = "ENABLED" if clause.enabled else "DISABLED"
 
     # Display summary
-    print(f"\n[CLAUSE {clause.type}] {clause_name} - {status}")
-    print(f"  Giver Requirements: {clause.giver_reqs_count}")
-    if clause.giver_reqs_count > 0:
-        print(f"    Giver must meet: {clause.giver_reqs_count} requirement(s)")
-    print(f"  Receiver Requirements: {clause.receiver_reqs_count}")
-    if clause.receiver_reqs_count > 0:
-        print(f"    Receiver must meet: {clause.receiver_reqs_count} requirement(s)")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n[CLAUSE {clause.type}] {clause_name} - {status}")
+        logger.info(f"  Giver Requirements: {clause.giver_reqs_count}")
+        if clause.giver_reqs_count > 0:
+            logger.info(f"    Giver must meet: {clause.giver_reqs_count} requirement(s)")
+        logger.info(f"  Receiver Requirements: {clause.receiver_reqs_count}")
+        if clause.receiver_reqs_count > 0:
+            logger.info(f"    Receiver must meet: {clause.receiver_reqs_count} requirement(s)")
 
 
-async def handle_rulesets_ready(
-    client: "FreeCivClient", game_state: GameState, payload: bytes
-) -> None:
+def handle_rulesets_ready(client: "FreeCivClient", game_state: GameState, payload: bytes) -> None:
     """
     Handle PACKET_RULESETS_READY (225) - signal that all ruleset data has been sent.
 
@@ -2172,12 +2133,17 @@ async def handle_rulesets_ready(
     # Update game state to mark rulesets as ready
     game_state.rulesets_ready = True
 
+    # Drop anything derived from the partially loaded ruleset; queries are
+    # memoized only from here on
+    game_state.ruleset._mark_loaded()
+
     # Display status message
-    print("\n" + "=" * 60)
-    print("[RULESETS READY]")
-    print("Server has finished transmitting ruleset data.")
-    print("Ruleset loading complete - ready for gameplay initialization.")
-    print("=" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n" + "=" * 60)
+        logger.info("[RULESETS READY]")
+        logger.info("Server has finished transmitting ruleset data.")
+        logger.info("Ruleset loading complete - ready for gameplay initialization.")
+        logger.info("=" * 60)
 
 
 __all__ = [
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+import logging
+import sys
 from typing import TYPE_CHECKING
 
 from fc_client.game_state import GameState
@@ -5,6 +9,16 @@ from fc_client.game_state import GameState
 if TYPE_CHECKING:
     from fc_client.client import FreeCivClient
 
+logger = logging.getLogger(__name__)
+
+
+def _hex_dump(data: bytes) -> str:
+    """Return data as space-separated hex byte pairs (e.g. "01 ab ff")."""
+    if sys.version_info >= (3, 8):
+        return data.hex(" ")  # Formatted in C
+    hex_str = data.hex()
+    return " ".join(hex_str[i : i + 2] for i in range(0, len(hex_str), 2))
+
 
 async def handle_unknown_packet(
     client: "FreeCivClient", game_state: GameState, packet_type: int, payload: bytes
@@ -15,17 +29,21 @@ async def handle_unknown_packet(
     This handler logs detailed information about the packet and triggers
     shutdown to force incremental implementation of packet handlers.
     """
-    print(f"\n!!! UNKNOWN PACKET RECEIVED !!!")
-    print(f"Packet Type: {packet_type}")
-    print(f"Payload Length: {len(payload)} bytes")
-
-    # Hex dump first 64 bytes
-    dump_size = min(64, len(payload))
-    hex_dump = " ".join(f"{b:02x}" for b in payload[:dump_size])
-    print(f"First {dump_size} bytes: {hex_dump}")
-
-    print(f"\n>>> Need to implement handler for packet type {packet_type}")
-    print(">>> Stopping application...\n")
+    logger.error(
+        "\n!!! UNKNOWN PACKET RECEIVED !!!\nPacket Type: %d\nPayload Length: %d bytes",
+        packet_type,
+        len(payload),
+    )
+
+    # Hex dump first 64 bytes (skipped entirely when INFO is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        head = payload[:64]
+        logger.info("First %d bytes: %s", len(head), _hex_dump(head))
+
+    logger.error(
+        "\n>>> Need to implement handler for packet type %d\n>>> Stopping application...\n",
+        packet_type,
+    )
 
     # Trigger shutdown
     client._shutdown_event.set()
@@ -2,8 +2,11 @@
 Packet debugging utility for capturing FreeCiv network packets.
 """
 
+from __future__ import annotations
+
 import os
 import shutil
+from typing import Iterable, Tuple
 
 
 class PacketDebugger:
@@ -66,6 +69,22 @@ class PacketDebugger:
                 f"expected {expected_size} bytes, wrote {actual_size} bytes"
             )
 
+    def write_inbound_batch(self, packets: Iterable[Tuple[bytes, int]]) -> None:
+        """
+        Write a batch of inbound packets to disk, in order.
+
+        Blocking; intended to be run in an executor so disk I/O stays off the
+        event loop.
+
+        Args:
+            packets: Iterable of (raw_packet, packet_type) tuples
+
+        Raises:
+            RuntimeError: If file write verification fails
+        """
+        for raw_packet, packet_type in packets:
+            self.write_inbound_packet(raw_packet, packet_type)
+
     def write_outbound_packet(self, raw_packet: bytes, packet_type: int) -> None:
         """
         Write an outbound packet (to server) to disk.
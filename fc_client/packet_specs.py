@@ -5,8 +5,21 @@ similar to the packets.def file in the FreeCiv source code. These specifications
 are used by the delta protocol decoder to properly handle packets.
 """
 
+from __future__ import annotations
+
+import struct
 from dataclasses import dataclass
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
+
+# struct format codes for fixed-width integer wire types (big-endian)
+_INT_FORMATS = {
+    "UINT8": "B",
+    "UINT16": "H",
+    "UINT32": "I",
+    "SINT8": "b",
+    "SINT16": "h",
+    "SINT32": "i",
+}
 
 
 @dataclass
@@ -70,6 +83,27 @@ class PacketSpec:
     has_delta: bool
     fields: List[FieldSpec]
 
+    def __post_init__(self):
+        """Precompute the fixed-width integer prefix of the non-key fields.
+
+        When a delta packet transmits every field of a leading run of plain
+        integer fields (e.g. the 22 UINT16 counts of PACKET_RULESET_CONTROL),
+        the decoder reads the whole run with one struct call.
+        """
+        prefix = []
+        for field in self.non_key_fields:
+            if field.is_array or field.type_name not in _INT_FORMATS:
+                break
+            prefix.append(field)
+
+        self.prefix_names: List[str] = [f.name for f in prefix]
+        self.prefix_mask: int = (1 << len(prefix)) - 1
+        self.prefix_struct: Optional[struct.Struct] = (
+            struct.Struct(">" + "".join(_INT_FORMATS[f.type_name] for f in prefix))
+            if len(prefix) > 1
+            else None
+        )
+
     @property
     def key_fields(self) -> List[FieldSpec]:
         """Return only the key fields (always transmitted)."""
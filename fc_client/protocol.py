@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import struct
 import zlib
@@ -80,6 +82,19 @@ JUMBO_BORDER = 49150  # 64*1024 - COMPRESSION_BORDER - 1
 PACKET_FREEZE_CLIENT = 130  # Start compression grouping
 PACKET_THAW_CLIENT = 131  # End compression grouping
 
+# Precompiled big-endian integer formats. Decoders read with unpack_from() at
+# an offset, so no intermediate bytes slice is allocated per field.
+_SINT8 = struct.Struct("b")
+_UINT16 = struct.Struct(">H")
+_SINT16 = struct.Struct(">h")
+_UINT32 = struct.Struct(">I")
+_SINT32 = struct.Struct(">i")
+
+# Whole-packet layouts for small fixed-size ruleset packets, used when every
+# bitvector bit is set (the common case for first-time ruleset transfers).
+_TRADE_FIELDS = struct.Struct(">BHBB")  # id, trade_pct, cancelling, bonus_type
+_RESOURCE_FIELDS = struct.Struct(f">{1 + O_LAST}B")  # id, output[O_LAST]
+
 
 async def _recv_exact(reader: asyncio.StreamReader, num_bytes: int) -> bytes:
     """Read exactly num_bytes from stream, handling partial reads."""
@@ -141,17 +156,17 @@ async def _parse_packet_buffer(buffer: bytes, use_two_byte_type: bool) -> list:
             )
 
         # Read length (big-endian)
-        packet_length = struct.unpack(">H", buffer[offset : offset + 2])[0]
+        packet_length = _UINT16.unpack_from(buffer, offset)[0]
 
         # Read type field (1 or 2 bytes)
         if use_two_byte_type:
             header_size = 4
             if len(buffer) - offset < header_size:
                 raise ValueError(f"Incomplete 2-byte type header at offset {offset}")
-            packet_type = struct.unpack(">H", buffer[offset + 2 : offset + 4])[0]
+            packet_type = _UINT16.unpack_from(buffer, offset + 2)[0]
         else:
             header_size = 3
-            packet_type = struct.unpack("B", buffer[offset + 2 : offset + 3])[0]
+            packet_type = buffer[offset + 2]
 
         # Validate length
         if packet_length < header_size:
@@ -226,6 +241,22 @@ def decode_string(data: bytes, offset: int) -> Tuple[str, int]:
     return string, end + 1
 
 
+def decode_string_bytes(data: bytes, offset: int) -> Tuple[bytes, int]:
+    """
+    Decode a null-terminated STRING as raw (undecoded) UTF-8 bytes.
+
+    Used for long free text (helptext, legends, descriptions) that ruleset
+    records only decode when it is actually read.
+
+    Returns:
+        Tuple of (bytes_value, new_offset)
+    """
+    end = data.find(b"\x00", offset)
+    if end == -1:
+        raise ValueError("Null terminator not found in string")
+    return data[offset:end], end + 1
+
+
 def decode_fixed_string(data: bytes, offset: int, size: int) -> Tuple[str, int]:
     """
     Decode a fixed-size STRING from bytes.
@@ -283,7 +314,7 @@ def decode_sint8(data: bytes, offset: int) -> Tuple[int, int]:
     Returns:
         Tuple of (int_value, new_offset)
     """
-    value = struct.unpack("b", bytes([data[offset]]))[0]
+    value = _SINT8.unpack_from(data, offset)[0]
     return value, offset + 1
 
 
@@ -294,7 +325,7 @@ def decode_uint32(data: bytes, offset: int) -> Tuple[int, int]:
     Returns:
         Tuple of (int_value, new_offset)
     """
-    value = struct.unpack(">I", data[offset : offset + 4])[0]
+    value = _UINT32.unpack_from(data, offset)[0]
     return value, offset + 4
 
 
@@ -305,7 +336,7 @@ def decode_sint16(data: bytes, offset: int) -> Tuple[int, int]:
     Returns:
         Tuple of (int_value, new_offset)
     """
-    value = struct.unpack(">h", data[offset : offset + 2])[0]
+    value = _SINT16.unpack_from(data, offset)[0]
     return value, offset + 2
 
 
@@ -316,7 +347,7 @@ def decode_uint16(data: bytes, offset: int) -> Tuple[int, int]:
     Returns:
         Tuple of (int_value, new_offset)
     """
-    value = struct.unpack(">H", data[offset : offset + 2])[0]
+    value = _UINT16.unpack_from(data, offset)[0]
     return value, offset + 2
 
 
@@ -327,7 +358,7 @@ def decode_sint32(data: bytes, offset: int) -> Tuple[int, int]:
     Returns:
         Tuple of (int_value, new_offset)
     """
-    value = struct.unpack(">i", data[offset : offset + 4])[0]
+    value = _SINT32.unpack_from(data, offset)[0]
     return value, offset + 4
 
 
@@ -403,7 +434,7 @@ async def read_packet(
     """
     # Read 2-byte length field (big-endian)
     length_bytes = await _recv_exact(reader, 2)
-    packet_length = struct.unpack(">H", length_bytes)[0]
+    packet_length = _UINT16.unpack(length_bytes)[0]
 
     if validate:
         print(f"[VALIDATE] Length header: {packet_length} bytes")
@@ -416,7 +447,7 @@ async def read_packet(
     if packet_length == JUMBO_SIZE:
         # Read 4-byte actual length (big-endian)
         jumbo_length_bytes = await _recv_exact(reader, 4)
-        actual_length = struct.unpack(">I", jumbo_length_bytes)[0]
+        actual_length = _UINT32.unpack(jumbo_length_bytes)[0]
 
         if validate:
             print(f"[VALIDATE] JUMBO compressed: {actual_length} bytes")
@@ -480,11 +511,11 @@ async def read_packet(
     # Read packet type (1 or 2 bytes depending on connection state)
     if use_two_byte_type:
         type_bytes = await _recv_exact(reader, 2)
-        packet_type = struct.unpack(">H", type_bytes)[0]
+        packet_type = _UINT16.unpack(type_bytes)[0]
         header_size = 4  # 2 bytes length + 2 bytes type
     else:
         type_bytes = await _recv_exact(reader, 1)
-        packet_type = struct.unpack("B", type_bytes)[0]
+        packet_type = type_bytes[0]
         header_size = 3  # 2 bytes length + 1 byte type
 
     if validate:
@@ -652,10 +683,14 @@ def decode_ruleset_description_part(payload: bytes) -> dict:
     The client must accumulate all parts until the total size matches
     or exceeds the desc_length field from RULESET_CONTROL.
 
-    Returns dictionary with key: text
+    The text is returned as raw UTF-8 bytes: the server splits the description
+    on byte boundaries, so a part may end inside a multi-byte character and
+    only the assembled description can be decoded.
+
+    Returns dictionary with key: text (bytes)
     """
     offset = 0
-    text, offset = decode_string(payload, offset)
+    text, offset = decode_string_bytes(payload, offset)
 
     return {"text": text}
 
@@ -723,7 +758,7 @@ def decode_ruleset_nation_sets(payload: bytes) -> dict:
     descriptions = []
     if has_descriptions:
         for i in range(nsets):
-            description, offset = decode_string(payload, offset)
+            description, offset = decode_string_bytes(payload, offset)
             descriptions.append(description)
 
     return {"nsets": nsets, "names": names, "rule_names": rule_names, "descriptions": descriptions}
@@ -847,7 +882,7 @@ def decode_ruleset_nation(payload: bytes) -> dict:
             "noun_plural": "",
             "graphic_str": "",
             "graphic_alt": "",
-            "legend": "",
+            "legend": b"",
             "style": 0,
             "leader_count": 0,
             "leader_name": [],
@@ -889,7 +924,7 @@ def decode_ruleset_nation(payload: bytes) -> dict:
         result["graphic_alt"], offset = decode_string(payload, offset)
 
     if has_field(6):  # legend
-        result["legend"], offset = decode_string(payload, offset)
+        result["legend"], offset = decode_string_bytes(payload, offset)
 
     if has_field(7):  # style
         result["style"], offset = decode_uint8(payload, offset)
@@ -1179,7 +1214,7 @@ def decode_ruleset_specialist(payload: bytes, delta_cache: "DeltaCache") -> dict
         graphic_alt = cached.get("graphic_alt", "")
         reqs_count = cached.get("reqs_count", 0)
         reqs = cached.get("reqs", []).copy()
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         specialist_id = 0
         plural_name = ""
@@ -1189,7 +1224,7 @@ def decode_ruleset_specialist(payload: bytes, delta_cache: "DeltaCache") -> dict
         graphic_alt = ""
         reqs_count = 0
         reqs = []
-        helptext = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
     # Bit 0: id (UINT8)
@@ -1229,7 +1264,7 @@ def decode_ruleset_specialist(payload: bytes, delta_cache: "DeltaCache") -> dict
 
     # Bit 8: helptext (STRING)
     if is_bit_set(bitvector, 8):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {
@@ -1469,6 +1504,15 @@ def decode_ruleset_trade(payload: bytes) -> dict:
     def has_field(bit_index):
         return bool(bitvector & (1 << bit_index))
 
+    if bitvector & 0x0F == 0x0F:
+        trade_id, trade_pct, cancelling, bonus_type = _TRADE_FIELDS.unpack_from(payload, offset)
+        return {
+            "id": trade_id,
+            "trade_pct": trade_pct,
+            "cancelling": cancelling,
+            "bonus_type": bonus_type,
+        }
+
     # Initialize with defaults (cache starts at zero for packets with no key fields)
     trade_id = 0
     trade_pct = 0
@@ -1528,6 +1572,10 @@ def decode_ruleset_resource(payload: bytes) -> dict:
     def has_field(bit_index):
         return bool(bitvector & (1 << bit_index))
 
+    if bitvector & 0x03 == 0x03:
+        resource_id, *output = _RESOURCE_FIELDS.unpack_from(payload, offset)
+        return {"id": resource_id, "output": output}
+
     # Initialize with defaults (cache starts at zero for packets with no key fields)
     resource_id = 0
     output = [0] * O_LAST  # O_LAST=6
@@ -2002,11 +2050,11 @@ def decode_ruleset_tech_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
     if cached:
         tech_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         tech_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if has_field(0):
@@ -2018,7 +2066,7 @@ def decode_ruleset_tech_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 2: helptxt
     if has_field(2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {"id": tech_id, "name": name, "helptxt": helptxt}
@@ -2067,11 +2115,11 @@ def decode_ruleset_extra_flag(payload: bytes, delta_cache: "DeltaCache") -> dict
     if cached:
         extra_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         extra_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if has_field(0):
@@ -2083,7 +2131,7 @@ def decode_ruleset_extra_flag(payload: bytes, delta_cache: "DeltaCache") -> dict
 
     # Bit 2: helptxt
     if has_field(2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {"id": extra_id, "name": name, "helptxt": helptxt}
@@ -2118,11 +2166,11 @@ def decode_ruleset_terrain_flag(payload: bytes, delta_cache: "DeltaCache") -> di
     if cached:
         terrain_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         terrain_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if is_bit_set(bitvector, 0):
@@ -2134,7 +2182,7 @@ def decode_ruleset_terrain_flag(payload: bytes, delta_cache: "DeltaCache") -> di
 
     # Bit 2: helptxt
     if is_bit_set(bitvector, 2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {"id": terrain_id, "name": name, "helptxt": helptxt}
@@ -2169,11 +2217,11 @@ def decode_ruleset_impr_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
     if cached:
         impr_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         impr_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if is_bit_set(bitvector, 0):
@@ -2185,7 +2233,7 @@ def decode_ruleset_impr_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 2: helptxt
     if is_bit_set(bitvector, 2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {"id": impr_id, "name": name, "helptxt": helptxt}
@@ -2461,7 +2509,7 @@ def decode_ruleset_unit_class(payload: bytes, delta_cache: "DeltaCache") -> dict
         hp_loss_pct = cached.get("hp_loss_pct", 0)
         non_native_def_pct = cached.get("non_native_def_pct", 0)
         flags = cached.get("flags", 0)
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         unit_class_id = 0
         name = ""
@@ -2470,7 +2518,7 @@ def decode_ruleset_unit_class(payload: bytes, delta_cache: "DeltaCache") -> dict
         hp_loss_pct = 0
         non_native_def_pct = 0
         flags = 0
-        helptext = ""
+        helptext = b""
 
     # Bit 0: id
     if has_field(0):
@@ -2502,7 +2550,7 @@ def decode_ruleset_unit_class(payload: bytes, delta_cache: "DeltaCache") -> dict
 
     # Bit 7: helptext
     if has_field(7):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {
@@ -2735,7 +2783,7 @@ def decode_ruleset_goods(payload: bytes, delta_cache: "DeltaCache") -> dict:
         to_pct = cached.get("to_pct", 0)
         onetime_pct = cached.get("onetime_pct", 0)
         flags = cached.get("flags", 0)
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         goods_id = 0
         name = ""
@@ -2746,7 +2794,7 @@ def decode_ruleset_goods(payload: bytes, delta_cache: "DeltaCache") -> dict:
         to_pct = 0
         onetime_pct = 0
         flags = 0
-        helptext = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
     # Bit 0: id
@@ -2790,7 +2838,7 @@ def decode_ruleset_goods(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 9: helptext
     if is_bit_set(bitvector, 9):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result dictionary
     result = {
@@ -2842,11 +2890,11 @@ def decode_ruleset_unit_class_flag(payload: bytes, delta_cache: "DeltaCache") ->
     if cached:
         flag_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         flag_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if has_field(0):
@@ -2858,7 +2906,7 @@ def decode_ruleset_unit_class_flag(payload: bytes, delta_cache: "DeltaCache") ->
 
     # Bit 2: helptxt
     if has_field(2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {"id": flag_id, "name": name, "helptxt": helptxt}
@@ -2892,11 +2940,11 @@ def decode_ruleset_unit_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
     if cached:
         flag_id = cached.get("id", 0)
         name = cached.get("name", "")
-        helptxt = cached.get("helptxt", "")
+        helptxt = cached.get("helptxt", b"")
     else:
         flag_id = 0
         name = ""
-        helptxt = ""
+        helptxt = b""
 
     # Bit 0: id
     if is_bit_set(bitvector, 0):
@@ -2908,7 +2956,7 @@ def decode_ruleset_unit_flag(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 2: helptxt
     if is_bit_set(bitvector, 2):
-        helptxt, offset = decode_string(payload, offset)
+        helptxt, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {
@@ -3031,7 +3079,7 @@ def decode_ruleset_tech(payload: bytes, delta_cache: "DeltaCache") -> dict:
         num_reqs = cached.get("num_reqs", 0)
         name = cached.get("name", "")
         rule_name = cached.get("rule_name", "")
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
         graphic_str = cached.get("graphic_str", "")
         graphic_alt = cached.get("graphic_alt", "")
     else:
@@ -3046,7 +3094,7 @@ def decode_ruleset_tech(payload: bytes, delta_cache: "DeltaCache") -> dict:
         num_reqs = 0
         name = ""
         rule_name = ""
-        helptext = ""
+        helptext = b""
         graphic_str = ""
         graphic_alt = ""
 
@@ -3098,7 +3146,7 @@ def decode_ruleset_tech(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 11: helptext (STRING)
     if has_field(11):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Bit 12: graphic_str (STRING)
     if has_field(12):
@@ -3219,13 +3267,14 @@ def decode_ruleset_government(payload: bytes, delta_cache: "DeltaCache") -> dict
         sound_str = cached.get("sound_str", "")
         sound_alt = cached.get("sound_alt", "")
         sound_alt2 = cached.get("sound_alt2", "")
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         gov_id = 0
         reqs_count = 0
         reqs = []
         name = rule_name = graphic_str = graphic_alt = ""
-        sound_str = sound_alt = sound_alt2 = helptext = ""
+        sound_str = sound_alt = sound_alt2 = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
     if is_bit_set(bitvector, 0):
@@ -3262,7 +3311,7 @@ def decode_ruleset_government(payload: bytes, delta_cache: "DeltaCache") -> dict
         sound_alt2, offset = decode_string(payload, offset)
 
     if is_bit_set(bitvector, 10):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {
@@ -3350,7 +3399,7 @@ def decode_ruleset_unit(payload: bytes, delta_cache: "DeltaCache") -> dict:
         embarks = cached.get("embarks", 0)
         disembarks = cached.get("disembarks", 0)
         vlayer = cached.get("vlayer", 0)
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
         flags = cached.get("flags", 0)
         roles = cached.get("roles", 0)
         worker = cached.get("worker", False)
@@ -3374,7 +3423,7 @@ def decode_ruleset_unit(payload: bytes, delta_cache: "DeltaCache") -> dict:
         bombard_rate = city_size = city_slots = tp_defense = 0
         cargo = targets = embarks = disembarks = 0
         vlayer = 0
-        helptext = ""
+        helptext = b""
         flags = roles = 0
         worker = False
 
@@ -3578,7 +3627,7 @@ def decode_ruleset_unit(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 44: helptext (STRING)
     if is_bit_set(bitvector, 44):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Bit 45: flags (BV_UTYPE_FLAGS bitvector - estimated 128 bits = 16 bytes)
     # TODO: Verify size with captured packets
@@ -3715,7 +3764,7 @@ def decode_ruleset_extra(payload: bytes, delta_cache: "DeltaCache") -> dict:
         bridged_over = cached.get("bridged_over", 0)
         conflicts = cached.get("conflicts", 0)
         no_aggr_near_city = cached.get("no_aggr_near_city", 0)
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         extra_id = 0
         name = rule_name = ""
@@ -3742,7 +3791,7 @@ def decode_ruleset_extra(payload: bytes, delta_cache: "DeltaCache") -> dict:
         native_to = flags = 0
         hidden_by = bridged_over = conflicts = 0
         no_aggr_near_city = 0
-        helptext = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
     # Bit 0: id (UINT8)
@@ -3917,7 +3966,7 @@ def decode_ruleset_extra(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 40: helptext (STRING)
     if is_bit_set(bitvector, 40):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result dict with all 41 fields
     result = {
@@ -4130,7 +4179,7 @@ def decode_ruleset_building(payload: bytes, delta_cache: "DeltaCache") -> dict:
         soundtag = cached.get("soundtag", "")
         soundtag_alt = cached.get("soundtag_alt", "")
         soundtag_alt2 = cached.get("soundtag_alt2", "")
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         building_id = 0
         genus = 0
@@ -4150,7 +4199,7 @@ def decode_ruleset_building(payload: bytes, delta_cache: "DeltaCache") -> dict:
         soundtag = ""
         soundtag_alt = ""
         soundtag_alt2 = ""
-        helptext = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
     # Bit 0: id (UINT8) - key field
@@ -4233,7 +4282,7 @@ def decode_ruleset_building(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 18: helptext (STRING)
     if is_bit_set(bitvector, 18):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result
     result = {
@@ -4415,7 +4464,7 @@ def decode_ruleset_terrain(payload: bytes, delta_cache: "DeltaCache") -> dict:
         color_red = cached.get("color_red", 0)
         color_green = cached.get("color_green", 0)
         color_blue = cached.get("color_blue", 0)
-        helptext = cached.get("helptext", "")
+        helptext = cached.get("helptext", b"")
     else:
         terrain_id = 0
         tclass = 0
@@ -4453,7 +4502,7 @@ def decode_ruleset_terrain(payload: bytes, delta_cache: "DeltaCache") -> dict:
         color_red = 0
         color_green = 0
         color_blue = 0
-        helptext = ""
+        helptext = b""
 
     # Decode conditional fields based on bitvector
 
@@ -4618,7 +4667,7 @@ def decode_ruleset_terrain(payload: bytes, delta_cache: "DeltaCache") -> dict:
 
     # Bit 36: helptext (STRING)
     if is_bit_set(bitvector, 36):
-        helptext, offset = decode_string(payload, offset)
+        helptext, offset = decode_string_bytes(payload, offset)
 
     # Build result dict with all fields
     result = {
@@ -4877,7 +4926,18 @@ def decode_delta_packet(payload: bytes, packet_spec: PacketSpec, delta_cache: "D
         cached = {field.name: field.default_value for field in packet_spec.non_key_fields}
 
     # Step 4: Read non-key fields based on bitvector
-    for bit_index, field_spec in enumerate(packet_spec.non_key_fields):
+    non_key_fields = packet_spec.non_key_fields
+    start = 0
+
+    # Fast path: leading run of integer fields all present - one struct call
+    prefix_struct = packet_spec.prefix_struct
+    if prefix_struct is not None and bitvector & packet_spec.prefix_mask == packet_spec.prefix_mask:
+        fields.update(zip(packet_spec.prefix_names, prefix_struct.unpack_from(payload, offset)))
+        offset += prefix_struct.size
+        start = len(packet_spec.prefix_names)
+
+    for bit_index in range(start, len(non_key_fields)):
+        field_spec = non_key_fields[bit_index]
         if field_spec.is_bool:
             # Boolean header-folding optimization: the bit value IS the field value
             # No separate byte is transmitted for boolean fields
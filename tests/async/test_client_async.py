@@ -5,12 +5,13 @@ Tests async operations like connect, disconnect, packet reading, and event handl
 """
 
 import asyncio
+import sys
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import pytest
 import tempfile
 import os
 
-from fc_client.client import FreeCivClient
+from fc_client.client import FreeCivClient, FreeCivProtocol
 from fc_client.game_state import GameState
 from fc_client import protocol, handlers
 
@@ -54,12 +55,12 @@ async def test_client_registers_default_handlers():
     """Client should register default packet handlers on init."""
     client = FreeCivClient()
 
-    # Check that default handlers are registered
-    assert protocol.PACKET_PROCESSING_STARTED in client._packet_handlers
-    assert protocol.PACKET_PROCESSING_FINISHED in client._packet_handlers
-    assert protocol.PACKET_SERVER_JOIN_REPLY in client._packet_handlers
-    assert protocol.PACKET_SERVER_INFO in client._packet_handlers
-    assert protocol.PACKET_CHAT_MSG in client._packet_handlers
+    # Check that default handlers are registered (async or sync)
+    assert client._sync_handlers[protocol.PACKET_PROCESSING_STARTED] is not None
+    assert client._sync_handlers[protocol.PACKET_PROCESSING_FINISHED] is not None
+    assert client._sync_handlers[protocol.PACKET_SERVER_JOIN_REPLY] is not None
+    assert client._sync_handlers[protocol.PACKET_SERVER_INFO] is not None
+    assert client._packet_handlers[protocol.PACKET_CHAT_MSG] is not None
 
 
 # ============================================================================
@@ -68,7 +69,7 @@ async def test_client_registers_default_handlers():
 
 
 @pytest.mark.async_test
-async def test_register_handler_adds_to_dict():
+async def test_register_handler_adds_to_table():
     """register_handler should add handler to _packet_handlers."""
     client = FreeCivClient()
 
@@ -77,7 +78,7 @@ async def test_register_handler_adds_to_dict():
 
     client.register_handler(999, custom_handler)
 
-    assert 999 in client._packet_handlers
+    assert len(client._packet_handlers) > 999
     assert client._packet_handlers[999] is custom_handler
 
 
@@ -107,31 +108,50 @@ async def test_register_handler_overwrites_existing():
 @pytest.mark.async_test
 async def test_connect_success(monkeypatch):
     """connect should establish connection and create game_state."""
-    mock_reader = AsyncMock()
-    mock_writer = AsyncMock()
+    mock_transport = MagicMock()
+    mock_stream = AsyncMock()
 
-    async def mock_open_connection(host, port):
-        return mock_reader, mock_writer
+    async def mock_create_connection(protocol_factory, host, port):
+        return mock_transport, mock_stream
 
-    monkeypatch.setattr(asyncio, "open_connection", mock_open_connection)
+    monkeypatch.setattr(asyncio.get_running_loop(), "create_connection", mock_create_connection)
 
     client = FreeCivClient()
     result = await client.connect("localhost", 6556)
 
     assert result is True
-    assert client.reader is mock_reader
-    assert client.writer is mock_writer
+    assert client.reader is mock_stream
+    assert client.writer is mock_stream
     assert isinstance(client.game_state, GameState)
 
 
+@pytest.mark.async_test
+async def test_connect_uses_aiofastnet_when_available(monkeypatch):
+    """connect should use aiofastnet.create_connection when it is importable."""
+    mock_stream = AsyncMock()
+    mock_aiofastnet = MagicMock()
+    mock_aiofastnet.create_connection = AsyncMock(return_value=(MagicMock(), mock_stream))
+
+    monkeypatch.setattr("fc_client.client.aiofastnet", mock_aiofastnet)
+
+    client = FreeCivClient()
+    await client.connect("localhost", 6556)
+
+    mock_aiofastnet.create_connection.assert_called_once_with(
+        asyncio.get_running_loop(), FreeCivProtocol, host="localhost", port=6556
+    )
+    assert client.reader is mock_stream
+    assert client.writer is mock_stream
+
+
 @pytest.mark.async_test
 async def test_connect_failure(monkeypatch):
     """connect should raise exception on connection failure."""
 
-    async def mock_open_connection(host, port):
+    async def mock_create_connection(protocol_factory, host, port):
         raise ConnectionRefusedError("Connection refused")
 
-    monkeypatch.setattr(asyncio, "open_connection", mock_open_connection)
+    monkeypatch.setattr(asyncio.get_running_loop(), "create_connection", mock_create_connection)
 
     client = FreeCivClient()
 
@@ -161,15 +181,71 @@ async def test_send_join_request_success(mock_stream_pair):
 
     await client.send_join_request("test-user")
 
-    # Should have called write and drain
+    # Should have written the packet; drain is batched until flushed
     assert mock_writer.write.called
-    assert mock_writer.drain.called
+    assert client._pending_writes == 1
+
+    # Empty transport buffer: flushing resets the count without draining
+    await client._flush()
+    assert not mock_writer.drain.called
+    assert client._pending_writes == 0
 
     # Check that packet was encoded correctly
     written_data = mock_writer.write.call_args[0][0]
     assert len(written_data) > 0  # Should have written something
 
 
+@pytest.mark.async_test
+async def test_send_drains_after_threshold(mock_stream_pair):
+    """_send should drain once the pending write count reaches the threshold."""
+    mock_reader, mock_writer = mock_stream_pair
+
+    mock_writer.transport.get_write_buffer_size.return_value = 100
+
+    client = FreeCivClient()
+    client.reader = mock_reader
+    client.writer = mock_writer
+
+    for _ in range(client._drain_threshold - 1):
+        await client._send(b"\x00\x03\x00")
+    assert not mock_writer.drain.called
+
+    await client._send(b"\x00\x03\x00")
+    mock_writer.drain.assert_called_once()
+    assert client._pending_writes == 0
+
+
+@pytest.mark.async_test
+async def test_send_skips_drain_when_write_buffer_empty(mock_stream_pair):
+    """_send should not drain at the threshold if the transport buffer is empty."""
+    mock_reader, mock_writer = mock_stream_pair
+
+    client = FreeCivClient()
+    client.reader = mock_reader
+    client.writer = mock_writer
+
+    for _ in range(client._drain_threshold):
+        await client._send(b"\x00\x03\x00")
+
+    assert not mock_writer.drain.called
+    assert client._pending_writes == 0
+
+
+@pytest.mark.async_test
+async def test_send_drains_when_write_buffer_large(mock_stream_pair):
+    """_send should drain immediately when the transport write buffer is large."""
+    mock_reader, mock_writer = mock_stream_pair
+    mock_writer.transport.get_write_buffer_size.return_value = 1024 * 1024
+
+    client = FreeCivClient()
+    client.reader = mock_reader
+    client.writer = mock_writer
+
+    await client._send(b"\x00\x03\x00")
+
+    mock_writer.drain.assert_called_once()
+
+
 @pytest.mark.async_test
 async def test_send_join_request_not_connected():
     """send_join_request should handle case when not connected."""
@@ -215,7 +291,7 @@ async def test_start_packet_reader_creates_task():
     shutdown_event = asyncio.Event()
 
     # Mock the reading loop to prevent it from running
-    with patch.object(client, "_packet_reading_loop", new_callable=AsyncMock):
+    with patch.object(FreeCivClient, "_packet_reading_loop", new_callable=AsyncMock):
         await client.start_packet_reader(shutdown_event)
 
         assert client._shutdown_event is shutdown_event
@@ -230,6 +306,27 @@ async def test_start_packet_reader_creates_task():
             pass
 
 
+@pytest.mark.async_test
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.TaskGroup requires Python 3.11+")
+async def test_start_packet_reader_uses_task_group():
+    """start_packet_reader should spawn the reader in the given TaskGroup."""
+    client = FreeCivClient()
+    shutdown_event = asyncio.Event()
+    started = asyncio.Event()
+
+    async def fake_reading_loop(self):
+        started.set()
+        await asyncio.sleep(3600)
+
+    with patch.object(FreeCivClient, "_packet_reading_loop", fake_reading_loop):
+        async with asyncio.TaskGroup() as task_group:
+            await client.start_packet_reader(shutdown_event, task_group)
+            await started.wait()
+            await client.stop_and_disconnect()
+
+    assert client._packet_reader_task.cancelled()
+
+
 # ============================================================================
 # _packet_reading_loop Tests
 # ============================================================================
@@ -347,6 +444,50 @@ async def test_dispatch_packet_calls_registered_handler():
     assert handler_called is True
 
 
+@pytest.mark.async_test
+async def test_dispatch_packet_calls_sync_handler():
+    """_dispatch_packet should call a registered sync handler directly."""
+    client = FreeCivClient()
+    client.game_state = GameState()
+    client._shutdown_event = asyncio.Event()
+
+    calls = []
+
+    def sync_handler(client_arg, game_state_arg, payload_arg):
+        calls.append(payload_arg)
+
+    client.register_sync_handler(999, sync_handler)
+
+    await client._dispatch_packet(999, b"test")
+
+    assert calls == [b"test"]
+
+
+@pytest.mark.async_test
+async def test_register_handler_replaces_sync_handler():
+    """Registering an async handler should replace a sync handler for the same type."""
+    client = FreeCivClient()
+    client.game_state = GameState()
+    client._shutdown_event = asyncio.Event()
+
+    sync_calls = []
+    async_calls = []
+
+    def sync_handler(client_arg, game_state_arg, payload_arg):
+        sync_calls.append(payload_arg)
+
+    async def async_handler(client_arg, game_state_arg, payload_arg):
+        async_calls.append(payload_arg)
+
+    client.register_sync_handler(999, sync_handler)
+    client.register_handler(999, async_handler)
+
+    await client._dispatch_packet(999, b"test")
+
+    assert sync_calls == []
+    assert async_calls == [b"test"]
+
+
 @pytest.mark.async_test
 async def test_dispatch_packet_calls_unknown_handler():
     """_dispatch_packet should call handle_unknown_packet for unregistered types."""
@@ -382,6 +523,24 @@ async def test_dispatch_packet_handles_handler_exception():
     assert client._shutdown_event.is_set()
 
 
+@pytest.mark.async_test
+async def test_dispatch_packet_logs_handler_exception(caplog):
+    """_dispatch_packet should log handler exceptions through the client logger."""
+    client = FreeCivClient()
+    client.game_state = GameState()
+    client._shutdown_event = asyncio.Event()
+
+    async def failing_handler(client_arg, game_state_arg, payload_arg):
+        raise ValueError("Handler error")
+
+    client.register_handler(999, failing_handler)
+
+    with caplog.at_level("ERROR", logger="fc_client.client"):
+        await client._dispatch_packet(999, b"test")
+
+    assert "Error in packet handler for type 999: Handler error" in caplog.text
+
+
 # ============================================================================
 # wait_for_join Tests
 # ============================================================================
@@ -447,6 +606,112 @@ async def test_stop_and_disconnect_cancels_reader_task(mock_stream_pair):
     assert client._packet_reader_task.done()
 
 
+@pytest.mark.async_test
+async def test_debug_packets_written_by_background_task(mock_stream_pair):
+    """Inbound packets should be queued and written by the debug writer task."""
+    mock_reader, mock_writer = mock_stream_pair
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        debug_dir = os.path.join(tmpdir, "debug")
+
+        client = FreeCivClient(debug_packets_dir=debug_dir)
+        client.reader = mock_reader
+        client.writer = mock_writer
+        client.game_state = GameState()
+
+        packets = [(0, b"", b"\x00\x03\x00"), (1, b"", b"\x00\x03\x01")]
+
+        async def mock_read_packet(reader, use_two_byte_type, validate=False):
+            if packets:
+                return packets.pop(0)
+            client._shutdown_event.set()
+            raise ConnectionError("done")
+
+        with patch("fc_client.client.protocol.read_packet", side_effect=mock_read_packet):
+            await client.start_packet_reader(asyncio.Event())
+            await client._packet_reader_task
+            await client.stop_and_disconnect()
+
+        assert client._debug_writer_task is None
+        with open(os.path.join(debug_dir, "inbound_0001_type000.packet"), "rb") as f:
+            assert f.read() == b"\x00\x03\x00"
+        with open(os.path.join(debug_dir, "inbound_0002_type001.packet"), "rb") as f:
+            assert f.read() == b"\x00\x03\x01"
+
+
+@pytest.mark.async_test
+async def test_debug_queue_full_applies_backpressure(mock_stream_pair):
+    """A full debug queue should make the reader wait rather than drop packets."""
+    mock_reader, mock_writer = mock_stream_pair
+
+    with tempfile.TemporaryDirectory() as tmpdir, patch("fc_client.client.DEBUG_QUEUE_SIZE", 1):
+        client = FreeCivClient(debug_packets_dir=os.path.join(tmpdir, "debug"))
+        client.reader = mock_reader
+        client.writer = mock_writer
+        client.game_state = GameState()
+
+        packets = [(0, b"", b"\x00\x03\x00") for _ in range(5)]
+
+        async def mock_read_packet(reader, use_two_byte_type, validate=False):
+            if packets:
+                return packets.pop(0)
+            client._shutdown_event.set()
+            raise ConnectionError("done")
+
+        with patch("fc_client.client.protocol.read_packet", side_effect=mock_read_packet):
+            await client.start_packet_reader(asyncio.Event())
+            await client._packet_reader_task
+            await client.stop_and_disconnect()
+
+        assert len(os.listdir(os.path.join(tmpdir, "debug"))) == 5
+
+
+@pytest.mark.async_test
+async def test_debug_writer_survives_write_failure():
+    """A write verification error should be logged, not stop the writer task."""
+    client = FreeCivClient()
+    client._debug_queue = asyncio.Queue()
+    written = []
+
+    def write_batch(batch):
+        if not written:
+            written.append(None)
+            raise RuntimeError("verification failed")
+        written.extend(batch)
+
+    client._packet_debugger = MagicMock(write_inbound_batch=write_batch)
+    task = asyncio.create_task(client._debug_writer_loop())
+
+    client._debug_queue.put_nowait((b"\x01", 1))
+    await client._debug_queue.join()
+    client._debug_queue.put_nowait((b"\x02", 2))
+    await client._debug_queue.join()
+
+    assert not task.done()
+    assert written[1:] == [(b"\x02", 2)]
+    task.cancel()
+
+
+@pytest.mark.async_test
+async def test_stop_and_disconnect_flushes_pending_writes(mock_stream_pair):
+    """stop_and_disconnect should drain batched writes before closing."""
+    mock_reader, mock_writer = mock_stream_pair
+    mock_writer.transport.get_write_buffer_size.return_value = 100
+
+    client = FreeCivClient()
+    client.reader = mock_reader
+    client.writer = mock_writer
+    client.game_state = GameState()
+
+    await client._send(b"\x00\x03\x00")
+    assert not mock_writer.drain.called
+
+    await client.stop_and_disconnect()
+
+    mock_writer.drain.assert_called_once()
+    mock_writer.close.assert_called_once()
+
+
 # ============================================================================
 # disconnect Tests
 # ============================================================================
@@ -502,13 +767,11 @@ async def test_disconnect_when_not_connected():
 @pytest.mark.async_test
 async def test_client_can_connect_multiple_times(monkeypatch):
     """Client should be able to connect, disconnect, and reconnect."""
-    mock_reader = AsyncMock()
-    mock_writer = AsyncMock()
 
-    async def mock_open_connection(host, port):
-        return AsyncMock(), AsyncMock()
+    async def mock_create_connection(protocol_factory, host, port):
+        return MagicMock(), AsyncMock()
 
-    monkeypatch.setattr(asyncio, "open_connection", mock_open_connection)
+    monkeypatch.setattr(asyncio.get_running_loop(), "create_connection", mock_create_connection)
 
     client = FreeCivClient()
 
@@ -548,3 +811,123 @@ async def test_packet_reading_loop_uses_two_byte_type():
         await client._packet_reading_loop()
 
         assert call_count >= 1
+
+
+# ============================================================================
+# FreeCivProtocol Tests
+# ============================================================================
+
+
+def _feed(stream, data):
+    """Simulate the transport receiving data into the protocol's buffer."""
+    buf = stream.get_buffer(len(data))
+    buf[: len(data)] = data
+    del buf
+    stream.buffer_updated(len(data))
+
+
+@pytest.mark.async_test
+async def test_protocol_readexactly_buffered_data():
+    """readexactly should return data already received into the buffer."""
+    stream = FreeCivProtocol()
+    stream.connection_made(MagicMock())
+
+    _feed(stream, b"\x00\x05\x19ab")
+
+    assert await stream.readexactly(2) == b"\x00\x05"
+    assert await stream.readexactly(3) == b"\x19ab"
+
+
+@pytest.mark.async_test
+async def test_protocol_readexactly_waits_for_more_data():
+    """readexactly should wait until enough data has arrived."""
+    stream = FreeCivProtocol()
+    stream.connection_made(MagicMock())
+
+    _feed(stream, b"abc")
+    read_task = asyncio.create_task(stream.readexactly(6))
+    await asyncio.sleep(0)
+    assert not read_task.done()
+
+    _feed(stream, b"def")
+    assert await read_task == b"abcdef"
+
+
+@pytest.mark.async_test
+async def test_protocol_readexactly_eof_raises_incomplete_read():
+    """readexactly should raise IncompleteReadError when EOF arrives early."""
+    stream = FreeCivProtocol()
+    stream.connection_made(MagicMock())
+
+    _feed(stream, b"ab")
+    stream.eof_received()
+
+    with pytest.raises(asyncio.IncompleteReadError) as exc_info:
+        await stream.readexactly(4)
+    assert exc_info.value.partial == b"ab"
+
+
+@pytest.mark.async_test
+async def test_protocol_buffer_grows_for_large_packets():
+    """Buffer should grow to hold payloads larger than the initial size."""
+    stream = FreeCivProtocol()
+    stream.connection_made(MagicMock())
+
+    data = bytes(range(256)) * ((FreeCivProtocol.BUFFER_SIZE // 256) + 10)
+    _feed(stream, data)
+
+    assert await stream.readexactly(len(data)) == data
+
+
+@pytest.mark.async_test
+async def test_protocol_readexactly_larger_than_high_water_resumes_reading():
+    """A read needing more than HIGH_WATER bytes must resume a paused transport."""
+    transport = MagicMock()
+    stream = FreeCivProtocol()
+    stream.connection_made(transport)
+
+    size = FreeCivProtocol.HIGH_WATER * 2 + 1024
+    data = bytes(range(256)) * (size // 256)
+    first = FreeCivProtocol.HIGH_WATER + 4096
+    _feed(stream, data[:first])
+    transport.pause_reading.assert_called_once()
+
+    read_task = asyncio.create_task(stream.readexactly(len(data)))
+    await asyncio.sleep(0)
+    assert not read_task.done()
+    transport.resume_reading.assert_called_once()
+
+    _feed(stream, data[first:])
+    assert await asyncio.wait_for(read_task, timeout=1.0) == data
+
+
+@pytest.mark.async_test
+async def test_protocol_read_packet_integration():
+    """protocol.read_packet should work directly on FreeCivProtocol."""
+    stream = FreeCivProtocol()
+    stream.connection_made(MagicMock())
+
+    _feed(stream, b"\x00\x05\x05hi")
+
+    packet_type, payload, raw_packet = await protocol.read_packet(stream)
+
+    assert packet_type == 5
+    assert payload == b"hi"
+    assert raw_packet == b"\x00\x05\x05hi"
+
+
+@pytest.mark.async_test
+async def test_protocol_write_and_close():
+    """write/close should delegate to the transport; wait_closed returns after loss."""
+    transport = MagicMock()
+    stream = FreeCivProtocol()
+    stream.connection_made(transport)
+
+    stream.write(b"data")
+    await stream.drain()
+    transport.write.assert_called_once_with(b"data")
+
+    stream.close()
+    transport.close.assert_called_once()
+    stream.connection_lost(None)
+    await stream.wait_closed()
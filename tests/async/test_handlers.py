@@ -6,7 +6,9 @@ and event signaling.
 """
 
 import asyncio
+import logging
 import struct
+from array import array
 from unittest.mock import Mock, patch, AsyncMock
 import pytest
 
@@ -41,7 +43,7 @@ async def test_handle_processing_started_no_errors(mock_client, game_state):
     payload = b""
 
     # Should not raise
-    await handlers.handle_processing_started(mock_client, game_state, payload)
+    handlers.handle_processing_started(mock_client, game_state, payload)
 
     # No events should be set
     assert not mock_client._join_successful.is_set()
@@ -59,7 +61,7 @@ async def test_handle_processing_finished_no_errors(mock_client, game_state):
     payload = b""
 
     # Should not raise
-    await handlers.handle_processing_finished(mock_client, game_state, payload)
+    handlers.handle_processing_finished(mock_client, game_state, payload)
 
     # No events should be set
     assert not mock_client._join_successful.is_set()
@@ -86,7 +88,7 @@ async def test_handle_server_join_reply_success(mock_client, game_state):
             "conn_id": 1,
         }
 
-        await handlers.handle_server_join_reply(mock_client, game_state, payload)
+        handlers.handle_server_join_reply(mock_client, game_state, payload)
 
     # Should switch to 2-byte packet type
     assert mock_client._use_two_byte_type is True
@@ -113,7 +115,7 @@ async def test_handle_server_join_reply_failure(mock_client, game_state):
             "conn_id": 0,
         }
 
-        await handlers.handle_server_join_reply(mock_client, game_state, payload)
+        handlers.handle_server_join_reply(mock_client, game_state, payload)
 
     # Should NOT switch to 2-byte packet type
     assert mock_client._use_two_byte_type is False
@@ -139,7 +141,7 @@ async def test_handle_server_join_reply_calls_decode(mock_client, game_state):
             "conn_id": 1,
         }
 
-        await handlers.handle_server_join_reply(mock_client, game_state, payload)
+        handlers.handle_server_join_reply(mock_client, game_state, payload)
 
         # Verify decode was called with exact payload
         mock_decode.assert_called_once_with(payload)
@@ -166,7 +168,7 @@ async def test_handle_server_info_updates_game_state(mock_client, game_state):
     with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
         mock_decode.return_value = server_info_data
 
-        await handlers.handle_server_info(mock_client, game_state, payload)
+        handlers.handle_server_info(mock_client, game_state, payload)
 
     # game_state.server_info should be updated
     assert game_state.server_info == server_info_data
@@ -186,7 +188,7 @@ async def test_handle_server_info_calls_decode(mock_client, game_state):
             "emerg_version": 0,
         }
 
-        await handlers.handle_server_info(mock_client, game_state, payload)
+        handlers.handle_server_info(mock_client, game_state, payload)
 
         # Verify decode_delta_packet was called with correct arguments
         mock_decode.assert_called_once()
@@ -196,6 +198,27 @@ async def test_handle_server_info_calls_decode(mock_client, game_state):
         assert call_args[2] is mock_client._delta_cache  # delta_cache
 
 
+@pytest.mark.async_test
+async def test_handle_game_info_counts_advances_and_wonders(mock_client, game_state, caplog):
+    """handle_game_info counts discovered advances and owned wonders in its summary."""
+    decoded = {
+        "global_advances": [True, False, True, False],
+        "great_wonder_owners": [-1, 0, 3, -2],
+        "global_advance_count": 2,
+    }
+
+    with patch("fc_client.handlers.protocol.decode_delta_packet", return_value=decoded):
+        with caplog.at_level(logging.INFO, logger="fc_client.handlers"):
+            await handlers.handle_game_info(mock_client, game_state, b"")
+
+    out = caplog.text
+    # Stored as a copy so the delta cache baseline cannot be mutated through game_state
+    assert game_state.game_info == decoded
+    assert game_state.game_info is not decoded
+    assert "Global advances: 2/4 discovered (count field: 2)" in out
+    assert "Great wonders: 2/4 owned" in out
+
+
 # ============================================================================
 # handle_chat_msg Tests
 # ============================================================================
@@ -251,13 +274,32 @@ async def test_handle_chat_msg_appends_to_history(mock_client, game_state):
     assert len(game_state.chat_history) == 1
 
     entry = game_state.chat_history[0]
-    assert entry["message"] == "Test message"
-    assert entry["tile"] == 100
-    assert entry["event"] == 5
-    assert entry["turn"] == 42
-    assert entry["phase"] == 1
-    assert entry["conn_id"] == 10
-    assert "timestamp" in entry  # Should add timestamp
+    assert entry.message == "Test message"
+    assert entry.tile == 100
+    assert entry.event == 5
+    assert entry.turn == 42
+    assert entry.phase == 1
+    assert entry.conn_id == 10
+    assert entry.timestamp  # Should add timestamp
+
+
+@pytest.mark.async_test
+async def test_handle_chat_msg_logs_message_and_details(mock_client, game_state, caplog):
+    """handle_chat_msg logs the message line and the detail line as one record."""
+    chat_data = {"message": "Hello", "tile": 7, "event": 3, "turn": 2, "phase": 0, "conn_id": 1}
+
+    with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
+        mock_decode.return_value = chat_data
+
+        with caplog.at_level(logging.INFO, logger="fc_client.handlers"):
+            await handlers.handle_chat_msg(mock_client, game_state, b"")
+
+    assert len(caplog.records) == 1
+    assert (
+        caplog.records[0]
+        .getMessage()
+        .endswith("] Hello\n  Turn: 2 | Phase: 0 | Event: 3 | Tile: 7 | Conn: 1")
+    )
 
 
 @pytest.mark.async_test
@@ -278,9 +320,9 @@ async def test_handle_chat_msg_multiple_messages(mock_client, game_state):
 
     # Should have all three messages
     assert len(game_state.chat_history) == 3
-    assert game_state.chat_history[0]["message"] == "msg1"
-    assert game_state.chat_history[1]["message"] == "msg2"
-    assert game_state.chat_history[2]["message"] == "msg3"
+    assert game_state.chat_history[0].message == "msg1"
+    assert game_state.chat_history[1].message == "msg2"
+    assert game_state.chat_history[2].message == "msg3"
 
 
 @pytest.mark.async_test
@@ -309,11 +351,8 @@ async def test_handle_chat_msg_adds_timestamp(mock_client, game_state):
 
     entry = game_state.chat_history[0]
 
-    # Should have timestamp field
-    assert "timestamp" in entry
-
     # Timestamp should be ISO format and parseable
-    ts = datetime.fromisoformat(entry["timestamp"])
+    ts = datetime.fromisoformat(entry.timestamp)
 
     # Timestamp should be between before and after
     assert before <= ts <= after
@@ -336,6 +375,17 @@ async def test_handle_unknown_packet_sets_shutdown(mock_client, game_state):
     assert mock_client._shutdown_event.is_set()
 
 
+@pytest.mark.async_test
+async def test_handle_unknown_packet_dumps_hex_bytes(mock_client, game_state, caplog):
+    """handle_unknown_packet logs the first bytes as space-separated hex pairs."""
+    payload = b"\x01\xab\xff"
+
+    with caplog.at_level(logging.INFO, logger="fc_client.handlers.unknown"):
+        await handlers.handle_unknown_packet(mock_client, game_state, 999, payload)
+
+    assert "First 3 bytes: 01 ab ff" in caplog.text
+
+
 @pytest.mark.async_test
 async def test_handle_unknown_packet_handles_empty_payload(mock_client, game_state):
     """handle_unknown_packet should handle empty payload without error."""
@@ -382,7 +432,7 @@ async def test_handlers_dont_modify_payload(mock_client, game_state):
             "conn_id": 1,
         }
 
-        await handlers.handle_server_join_reply(mock_client, game_state, payload)
+        handlers.handle_server_join_reply(mock_client, game_state, payload)
 
     # Payload should be unchanged
     assert bytes(payload) == original_payload
@@ -423,7 +473,7 @@ async def test_handle_chat_msg_with_delta_cache(mock_client, game_state):
 
     # Should append new message
     assert len(game_state.chat_history) == 1
-    assert game_state.chat_history[0]["message"] == "new message"
+    assert game_state.chat_history[0].message == "new message"
 
 
 @pytest.mark.async_test
@@ -445,7 +495,7 @@ async def test_server_info_replaces_previous_state(mock_client, game_state):
     with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
         mock_decode.return_value = new_server_info
 
-        await handlers.handle_server_info(mock_client, game_state, payload)
+        handlers.handle_server_info(mock_client, game_state, payload)
 
     # Should completely replace, not merge
     assert game_state.server_info == new_server_info
@@ -498,13 +548,20 @@ async def test_handle_ruleset_control_stores_dataclass(mock_client, game_state):
 
     with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
         mock_decode.return_value = ruleset_data
-        await handlers.handle_ruleset_control(mock_client, game_state, payload)
+        handlers.handle_ruleset_control(mock_client, game_state, payload)
 
     # Verify dataclass stored
-    assert game_state.ruleset_control is not None
-    assert isinstance(game_state.ruleset_control, RulesetControl)
-    assert game_state.ruleset_control.name == "TestRuleset"
-    assert game_state.ruleset_control.num_unit_types == 50
+    assert game_state.ruleset.ruleset_control is not None
+    assert isinstance(game_state.ruleset.ruleset_control, RulesetControl)
+    assert game_state.ruleset.ruleset_control.name == "TestRuleset"
+    assert game_state.ruleset.ruleset_control.num_unit_types == 50
+
+    # Dense ID tables are pre-sized from the announced counts
+    assert game_state.ruleset.nations == [None] * 200
+    assert len(game_state.ruleset.techs) == 88
+    assert len(game_state.ruleset.governments) == 8
+    assert len(game_state.ruleset.disasters) == 7
+    assert len(game_state.ruleset.achievements) == 12
 
 
 @pytest.mark.async_test
@@ -544,7 +601,7 @@ async def test_handle_ruleset_control_replaces_previous(mock_client, game_state)
         "desc_length": 512,
         "num_counters": 2,
     }
-    game_state.ruleset_control = RulesetControl(**old_data)
+    game_state.ruleset.ruleset_control = RulesetControl(**old_data)
 
     # Receive new
     payload = b"\x00" * 200
@@ -584,11 +641,11 @@ async def test_handle_ruleset_control_replaces_previous(mock_client, game_state)
 
     with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
         mock_decode.return_value = new_data
-        await handlers.handle_ruleset_control(mock_client, game_state, payload)
+        handlers.handle_ruleset_control(mock_client, game_state, payload)
 
     # Verify complete replacement
-    assert game_state.ruleset_control.name == "New"
-    assert game_state.ruleset_control.num_unit_types == 50
+    assert game_state.ruleset.ruleset_control.name == "New"
+    assert game_state.ruleset.ruleset_control.num_unit_types == 50
 
 
 # ============================================================================
@@ -598,7 +655,7 @@ async def test_handle_ruleset_control_replaces_previous(mock_client, game_state)
 
 @pytest.mark.async_test
 async def test_handle_ruleset_summary_stores_text(mock_client, game_state):
-    """Handler should decode and store text in game_state.ruleset_summary."""
+    """Handler should decode and store text in game_state.ruleset.ruleset_summary."""
     payload = b"Test ruleset summary text\x00"
 
     summary_text = "Test ruleset summary text"
@@ -606,17 +663,17 @@ async def test_handle_ruleset_summary_stores_text(mock_client, game_state):
     with patch("fc_client.handlers.protocol.decode_ruleset_summary") as mock_decode:
         mock_decode.return_value = {"text": summary_text}
 
-        await handlers.handle_ruleset_summary(mock_client, game_state, payload)
+        handlers.handle_ruleset_summary(mock_client, game_state, payload)
 
     # Verify stored in game_state
-    assert game_state.ruleset_summary == summary_text
+    assert game_state.ruleset.ruleset_summary == summary_text
 
 
 @pytest.mark.async_test
 async def test_handle_ruleset_summary_replaces_previous(mock_client, game_state):
     """Handler should replace previous summary, not append."""
     # Set initial summary
-    game_state.ruleset_summary = "Old summary text"
+    game_state.ruleset.ruleset_summary = "Old summary text"
 
     payload = b"New summary text\x00"
     new_text = "New summary text"
@@ -624,11 +681,11 @@ async def test_handle_ruleset_summary_replaces_previous(mock_client, game_state)
     with patch("fc_client.handlers.protocol.decode_ruleset_summary") as mock_decode:
         mock_decode.return_value = {"text": new_text}
 
-        await handlers.handle_ruleset_summary(mock_client, game_state, payload)
+        handlers.handle_ruleset_summary(mock_client, game_state, payload)
 
     # Should replace, not append
-    assert game_state.ruleset_summary == new_text
-    assert "Old summary" not in game_state.ruleset_summary
+    assert game_state.ruleset.ruleset_summary == new_text
+    assert "Old summary" not in game_state.ruleset.ruleset_summary
 
 
 @pytest.mark.async_test
@@ -639,10 +696,10 @@ async def test_handle_ruleset_summary_empty(mock_client, game_state):
     with patch("fc_client.handlers.protocol.decode_ruleset_summary") as mock_decode:
         mock_decode.return_value = {"text": ""}
 
-        await handlers.handle_ruleset_summary(mock_client, game_state, payload)
+        handlers.handle_ruleset_summary(mock_client, game_state, payload)
 
     # Should store empty string (not None)
-    assert game_state.ruleset_summary == ""
+    assert game_state.ruleset.ruleset_summary == ""
 
 
 @pytest.mark.async_test
@@ -654,12 +711,12 @@ async def test_handle_ruleset_summary_multiline(mock_client, game_state):
     with patch("fc_client.handlers.protocol.decode_ruleset_summary") as mock_decode:
         mock_decode.return_value = {"text": multiline_text}
 
-        await handlers.handle_ruleset_summary(mock_client, game_state, payload)
+        handlers.handle_ruleset_summary(mock_client, game_state, payload)
 
     # Should preserve newlines
-    assert game_state.ruleset_summary == multiline_text
-    assert "\n" in game_state.ruleset_summary
-    assert game_state.ruleset_summary.count("\n") == 2
+    assert game_state.ruleset.ruleset_summary == multiline_text
+    assert "\n" in game_state.ruleset.ruleset_summary
+    assert game_state.ruleset.ruleset_summary.count("\n") == 2
 
 
 # ============================================================================
@@ -676,7 +733,7 @@ async def test_handle_ruleset_description_part_single_part(mock_client, game_sta
     # Setup ruleset_control with expected length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -711,13 +768,13 @@ async def test_handle_ruleset_description_part_single_part(mock_client, game_sta
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
+        mock_decode.return_value = {"text": text.encode("utf-8")}
 
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble complete description
-    assert game_state.ruleset_description == text
-    assert game_state.ruleset_description_parts == []  # Accumulator cleared
+    assert game_state.ruleset.ruleset_description == text
+    assert game_state.ruleset.ruleset_description_buf == b""  # Accumulator cleared
 
 
 @pytest.mark.async_test
@@ -732,7 +789,7 @@ async def test_handle_ruleset_description_part_multiple_parts(mock_client, game_
     # Setup ruleset_control with expected total length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -768,24 +825,24 @@ async def test_handle_ruleset_description_part_multiple_parts(mock_client, game_
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
         # Send part 1
-        mock_decode.return_value = {"text": part1}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
-        assert game_state.ruleset_description is None  # Not complete yet
-        assert len(game_state.ruleset_description_parts) == 1
+        mock_decode.return_value = {"text": part1.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        assert game_state.ruleset.ruleset_description is None  # Not complete yet
+        assert game_state.ruleset.ruleset_description_buf == part1.encode("utf-8")
 
         # Send part 2
-        mock_decode.return_value = {"text": part2}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
-        assert game_state.ruleset_description is None  # Still not complete
-        assert len(game_state.ruleset_description_parts) == 2
+        mock_decode.return_value = {"text": part2.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        assert game_state.ruleset.ruleset_description is None  # Still not complete
+        assert game_state.ruleset.ruleset_description_buf == (part1 + part2).encode("utf-8")
 
         # Send part 3 (completes assembly)
-        mock_decode.return_value = {"text": part3}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": part3.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble all parts
-    assert game_state.ruleset_description == expected_total
-    assert game_state.ruleset_description_parts == []  # Accumulator cleared
+    assert game_state.ruleset.ruleset_description == expected_total
+    assert game_state.ruleset.ruleset_description_buf == b""  # Accumulator cleared
 
 
 @pytest.mark.async_test
@@ -799,7 +856,7 @@ async def test_handle_ruleset_description_part_incremental_accumulation(mock_cli
     # Setup ruleset_control with large expected length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -835,20 +892,41 @@ async def test_handle_ruleset_description_part_incremental_accumulation(mock_cli
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
         # Send part 1
-        mock_decode.return_value = {"text": part1}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": part1.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
         # Should accumulate but not assemble
-        assert game_state.ruleset_description is None
-        assert game_state.ruleset_description_parts == [part1]
+        assert game_state.ruleset.ruleset_description is None
+        assert game_state.ruleset.ruleset_description_buf == part1.encode("utf-8")
 
         # Send part 2
-        mock_decode.return_value = {"text": part2}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": part2.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
         # Should accumulate but still not assemble
-        assert game_state.ruleset_description is None
-        assert game_state.ruleset_description_parts == [part1, part2]
+        assert game_state.ruleset.ruleset_description is None
+        assert game_state.ruleset.ruleset_description_buf == (part1 + part2).encode("utf-8")
+
+
+@pytest.mark.async_test
+async def test_handle_ruleset_description_part_rate_limits_progress(
+    mock_client, game_state, caplog
+):
+    """Progress is logged for the first part, every 5% after that, and on completion."""
+    game_state.ruleset.ruleset_control = Mock(desc_length=100)
+
+    with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
+        mock_decode.return_value = {"text": b"x"}
+        with caplog.at_level(logging.INFO, logger="fc_client.handlers"):
+            for _ in range(100):
+                handlers.handle_ruleset_description_part(mock_client, game_state, b"dummy")
+
+    messages = [record.getMessage() for record in caplog.records]
+    progress_lines = [message for message in messages if message.startswith("[RULESET DESC]")]
+    assert len(progress_lines) == 21  # 1%, 6%, ..., 96%, then 100%
+    assert progress_lines[0].endswith("(total: 1/100 bytes, 1%)")
+    assert progress_lines[-1].endswith("(total: 100/100 bytes, 100%)")
+    assert game_state.ruleset.ruleset_description == "x" * 100
 
 
 @pytest.mark.async_test
@@ -861,7 +939,7 @@ async def test_handle_ruleset_description_part_exact_threshold(mock_client, game
     # Setup with exact expected length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -896,12 +974,12 @@ async def test_handle_ruleset_description_part_exact_threshold(mock_client, game
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": text.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should trigger assembly at exact threshold
-    assert game_state.ruleset_description == text
-    assert game_state.ruleset_description_parts == []
+    assert game_state.ruleset.ruleset_description == text
+    assert game_state.ruleset.ruleset_description_buf == b""
 
 
 @pytest.mark.async_test
@@ -911,18 +989,18 @@ async def test_handle_ruleset_description_part_missing_ruleset_control(mock_clie
     payload = b"dummy"
 
     # No ruleset_control set (None)
-    assert game_state.ruleset_control is None
+    assert game_state.ruleset.ruleset_control is None
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
+        mock_decode.return_value = {"text": text.encode("utf-8")}
 
         # Should not crash, just warn and accumulate
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should still accumulate part
-    assert game_state.ruleset_description_parts == [text]
+    assert game_state.ruleset.ruleset_description_buf == text.encode("utf-8")
     # Should not assemble (no expected length)
-    assert game_state.ruleset_description is None
+    assert game_state.ruleset.ruleset_description is None
 
 
 @pytest.mark.async_test
@@ -934,7 +1012,7 @@ async def test_handle_ruleset_description_part_empty_string(mock_client, game_st
     # Setup with zero expected length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -969,12 +1047,12 @@ async def test_handle_ruleset_description_part_empty_string(mock_client, game_st
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": text.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble immediately (0 >= 0)
-    assert game_state.ruleset_description == ""
-    assert game_state.ruleset_description_parts == []
+    assert game_state.ruleset.ruleset_description == ""
+    assert game_state.ruleset.ruleset_description_buf == b""
 
 
 @pytest.mark.async_test
@@ -986,7 +1064,7 @@ async def test_handle_ruleset_description_part_unicode_text(mock_client, game_st
     # Setup with UTF-8 byte length (not character count!)
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1021,12 +1099,47 @@ async def test_handle_ruleset_description_part_unicode_text(mock_client, game_st
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": text.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble correctly with Unicode
-    assert game_state.ruleset_description == text
-    assert game_state.ruleset_description_parts == []
+    assert game_state.ruleset.ruleset_description == text
+    assert game_state.ruleset.ruleset_description_buf == b""
+
+
+@pytest.mark.async_test
+async def test_handle_ruleset_description_part_split_multibyte_char(mock_client, game_state):
+    """Handler should assemble a multi-byte character split across two parts."""
+    text = "Hello 世界"
+    raw = text.encode("utf-8")
+    split = raw.index("世".encode("utf-8")) + 1  # Split inside the character
+    payload = b"dummy"
+
+    from fc_client.game_state import RulesetControl
+
+    counts = dict.fromkeys(RulesetControl.__dataclass_fields__, 0)
+    counts.update(
+        preferred_tileset="",
+        preferred_soundset="",
+        preferred_musicset="",
+        popup_tech_help=False,
+        name="test",
+        version="1.0",
+        alt_dir="",
+        desc_length=len(raw),
+    )
+    game_state.ruleset.ruleset_control = RulesetControl(**counts)
+
+    with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
+        mock_decode.return_value = {"text": raw[:split]}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        assert game_state.ruleset.ruleset_description is None
+
+        mock_decode.return_value = {"text": raw[split:]}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+
+    assert game_state.ruleset.ruleset_description == text
+    assert game_state.ruleset.ruleset_description_buf == b""
 
 
 @pytest.mark.async_test
@@ -1038,7 +1151,7 @@ async def test_handle_ruleset_description_part_multiline_text(mock_client, game_
     # Setup with expected length
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1073,13 +1186,13 @@ async def test_handle_ruleset_description_part_multiline_text(mock_client, game_
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": text.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should preserve newlines
-    assert game_state.ruleset_description == text
-    assert "\n" in game_state.ruleset_description
-    assert game_state.ruleset_description.count("\n") == 2
+    assert game_state.ruleset.ruleset_description == text
+    assert "\n" in game_state.ruleset.ruleset_description
+    assert game_state.ruleset.ruleset_description.count("\n") == 2
 
 
 @pytest.mark.async_test
@@ -1095,7 +1208,7 @@ async def test_handle_ruleset_description_part_exceeds_expected_length(mock_clie
     # Setup ruleset_control
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1131,17 +1244,17 @@ async def test_handle_ruleset_description_part_exceeds_expected_length(mock_clie
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
         # Send part 1
-        mock_decode.return_value = {"text": part1}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
-        assert game_state.ruleset_description is None  # Not yet
+        mock_decode.return_value = {"text": part1.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        assert game_state.ruleset.ruleset_description is None  # Not yet
 
         # Send part 2 (exceeds expected length)
-        mock_decode.return_value = {"text": part2}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": part2.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble when threshold is exceeded (using >=)
-    assert game_state.ruleset_description == expected_total
-    assert game_state.ruleset_description_parts == []
+    assert game_state.ruleset.ruleset_description == expected_total
+    assert game_state.ruleset.ruleset_description_buf == b""
 
 
 @pytest.mark.async_test
@@ -1152,12 +1265,12 @@ async def test_handle_ruleset_description_part_replaces_previous(mock_client, ga
     payload = b"dummy"
 
     # Set old description
-    game_state.ruleset_description = old_desc
+    game_state.ruleset.ruleset_description = old_desc
 
     # Setup ruleset_control for new description
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1192,12 +1305,12 @@ async def test_handle_ruleset_description_part_replaces_previous(mock_client, ga
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": new_desc}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": new_desc.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should replace old with new
-    assert game_state.ruleset_description == new_desc
-    assert game_state.ruleset_description != old_desc
+    assert game_state.ruleset.ruleset_description == new_desc
+    assert game_state.ruleset.ruleset_description != old_desc
 
 
 @pytest.mark.async_test
@@ -1209,7 +1322,7 @@ async def test_handle_ruleset_description_part_calls_decode(mock_client, game_st
     # Setup ruleset_control
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1244,9 +1357,9 @@ async def test_handle_ruleset_description_part_calls_decode(mock_client, game_st
     )
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
-        mock_decode.return_value = {"text": text}
+        mock_decode.return_value = {"text": text.encode("utf-8")}
 
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
         # Verify decoder was called with payload
         mock_decode.assert_called_once_with(payload)
@@ -1266,7 +1379,7 @@ async def test_handle_ruleset_description_part_byte_calculation_accuracy(mock_cl
     # Setup with byte length (not character count)
     from fc_client.game_state import RulesetControl
 
-    game_state.ruleset_control = RulesetControl(
+    game_state.ruleset.ruleset_control = RulesetControl(
         num_unit_classes=0,
         num_unit_types=0,
         num_impr_types=0,
@@ -1302,26 +1415,26 @@ async def test_handle_ruleset_description_part_byte_calculation_accuracy(mock_cl
 
     with patch("fc_client.handlers.protocol.decode_ruleset_description_part") as mock_decode:
         # Send part 1 (5 bytes)
-        mock_decode.return_value = {"text": part1}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
-        assert game_state.ruleset_description is None  # Not complete (5 < 12)
+        mock_decode.return_value = {"text": part1.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        assert game_state.ruleset.ruleset_description is None  # Not complete (5 < 12)
 
         # Send part 2 (7 bytes, total 12)
-        mock_decode.return_value = {"text": part2}
-        await handlers.handle_ruleset_description_part(mock_client, game_state, payload)
+        mock_decode.return_value = {"text": part2.encode("utf-8")}
+        handlers.handle_ruleset_description_part(mock_client, game_state, payload)
 
     # Should assemble when byte count (not char count) reaches threshold
-    assert game_state.ruleset_description == part1 + part2
-    assert len(game_state.ruleset_description) == 8  # 8 characters
-    assert len(game_state.ruleset_description.encode("utf-8")) == 12  # 12 bytes
+    assert game_state.ruleset.ruleset_description == part1 + part2
+    assert len(game_state.ruleset.ruleset_description) == 8  # 8 characters
+    assert len(game_state.ruleset.ruleset_description.encode("utf-8")) == 12  # 12 bytes
 
 
 @pytest.mark.async_test
 async def test_handle_ruleset_control_resets_accumulator(mock_client, game_state):
     """Handler should reset description accumulator when RULESET_CONTROL received."""
     # Setup: Pre-fill accumulator with stale data
-    game_state.ruleset_description_parts = ["stale part 1", "stale part 2"]
-    game_state.ruleset_description = "stale complete description"
+    game_state.ruleset.ruleset_description_buf = bytearray(b"stale part 1stale part 2")
+    game_state.ruleset.ruleset_description = "stale complete description"
 
     # Create sample RULESET_CONTROL packet data
     from fc_client.game_state import RulesetControl
@@ -1364,14 +1477,14 @@ async def test_handle_ruleset_control_resets_accumulator(mock_client, game_state
     with patch("fc_client.handlers.protocol.decode_delta_packet") as mock_decode:
         mock_decode.return_value = ruleset_data
 
-        await handlers.handle_ruleset_control(mock_client, game_state, payload)
+        handlers.handle_ruleset_control(mock_client, game_state, payload)
 
     # Should reset accumulator
-    assert game_state.ruleset_description_parts == []
-    assert game_state.ruleset_description is None
+    assert game_state.ruleset.ruleset_description_buf == b""
+    assert game_state.ruleset.ruleset_description is None
     # Should store new ruleset_control
-    assert game_state.ruleset_control is not None
-    assert game_state.ruleset_control.name == "Civ2Civ3"
+    assert game_state.ruleset.ruleset_control is not None
+    assert game_state.ruleset.ruleset_control.name == "Civ2Civ3"
 
 
 # PACKET_RULESET_NATION_SETS Tests
@@ -1396,20 +1509,20 @@ async def test_handle_ruleset_nation_sets_stores_in_game_state(mock_client, game
         b"Additional nations\x00"
     )
 
-    await handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
 
-    assert len(game_state.nation_sets) == 2
-    assert game_state.nation_sets[0].name == "Core"
-    assert game_state.nation_sets[0].rule_name == "core"
-    assert game_state.nation_sets[0].description == "Default nations"
-    assert game_state.nation_sets[1].name == "Extended"
+    assert len(game_state.ruleset.nation_sets) == 2
+    assert game_state.ruleset.nation_sets[0].name == "Core"
+    assert game_state.ruleset.nation_sets[0].rule_name == "core"
+    assert game_state.ruleset.nation_sets[0].description == "Default nations"
+    assert game_state.ruleset.nation_sets[1].name == "Extended"
 
 
 async def test_handle_ruleset_nation_sets_replaces_previous(mock_client, game_state):
     """Test handler replaces previous nation sets data."""
     from fc_client.game_state import NationSet
 
-    game_state.nation_sets = [NationSet("Old", "old", "Old data")]
+    game_state.ruleset.nation_sets = [NationSet("Old", "old", b"Old data")]
 
     # Delta protocol format with bitvector and null-terminated strings
     payload = (
@@ -1421,10 +1534,10 @@ async def test_handle_ruleset_nation_sets_replaces_previous(mock_client, game_st
         b"New data\x00"  # descriptions[0]
     )
 
-    await handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
 
-    assert len(game_state.nation_sets) == 1
-    assert game_state.nation_sets[0].name == "Core"
+    assert len(game_state.ruleset.nation_sets) == 1
+    assert game_state.ruleset.nation_sets[0].name == "Core"
 
 
 async def test_handle_ruleset_nation_sets_empty_list(mock_client, game_state):
@@ -1434,9 +1547,9 @@ async def test_handle_ruleset_nation_sets_empty_list(mock_client, game_state):
         b"\x00"  # nsets=0
     )
 
-    await handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
 
-    assert game_state.nation_sets == []
+    assert game_state.ruleset.nation_sets == []
 
 
 async def test_handle_ruleset_nation_sets_calls_decoder(mock_client, game_state):
@@ -1456,10 +1569,10 @@ async def test_handle_ruleset_nation_sets_calls_decoder(mock_client, game_state)
             "nsets": 1,
             "names": ["Core"],
             "rule_names": ["core"],
-            "descriptions": ["Description"],
+            "descriptions": [b"Description"],
         }
 
-        await handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
+        handlers.handle_ruleset_nation_sets(mock_client, game_state, payload)
 
         mock_decode.assert_called_once_with(payload)
 
@@ -1487,22 +1600,25 @@ async def test_handle_ruleset_nation_groups_stores_in_game_state(mock_client, ga
         b"\x01"  # hidden[2]=true (hidden)
     )
 
-    await handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
 
-    assert len(game_state.nation_groups) == 3
-    assert game_state.nation_groups[0].name == "?nationgroup:Ancient"
-    assert game_state.nation_groups[0].hidden == False
-    assert game_state.nation_groups[1].name == "?nationgroup:Medieval"
-    assert game_state.nation_groups[1].hidden == False
-    assert game_state.nation_groups[2].name == "?nationgroup:Modern"
-    assert game_state.nation_groups[2].hidden == True
+    assert len(game_state.ruleset.nation_groups) == 3
+    assert game_state.ruleset.nation_groups[0].name == "?nationgroup:Ancient"
+    assert game_state.ruleset.nation_groups[0].hidden == False
+    assert game_state.ruleset.nation_groups[1].name == "?nationgroup:Medieval"
+    assert game_state.ruleset.nation_groups[1].hidden == False
+    assert game_state.ruleset.nation_groups[2].name == "?nationgroup:Modern"
+    assert game_state.ruleset.nation_groups[2].hidden == True
+    assert game_state.ruleset.nation_group_names[1] == "?nationgroup:Medieval"
+    assert game_state.ruleset.nation_groups_hidden == 0b100
+    assert game_state.ruleset.is_nation_group_hidden(2)
 
 
 async def test_handle_ruleset_nation_groups_replaces_previous(mock_client, game_state):
     """Test handler replaces previous nation groups data."""
     from fc_client.game_state import NationGroup
 
-    game_state.nation_groups = [NationGroup("Old", False)]
+    game_state.ruleset.nation_groups = [NationGroup("Old", False)]
 
     # Delta protocol format with bitvector and null-terminated strings
     payload = (
@@ -1513,10 +1629,10 @@ async def test_handle_ruleset_nation_groups_replaces_previous(mock_client, game_
         b"\x00"  # hidden[0]=false
     )
 
-    await handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
 
-    assert len(game_state.nation_groups) == 1
-    assert game_state.nation_groups[0].name == "?nationgroup:Ancient"
+    assert len(game_state.ruleset.nation_groups) == 1
+    assert game_state.ruleset.nation_groups[0].name == "?nationgroup:Ancient"
 
 
 async def test_handle_ruleset_nation_groups_empty_list(mock_client, game_state):
@@ -1526,9 +1642,9 @@ async def test_handle_ruleset_nation_groups_empty_list(mock_client, game_state):
         b"\x00"  # ngroups=0
     )
 
-    await handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
 
-    assert game_state.nation_groups == []
+    assert game_state.ruleset.nation_groups == []
 
 
 async def test_handle_ruleset_nation_groups_calls_decoder(mock_client, game_state):
@@ -1545,7 +1661,7 @@ async def test_handle_ruleset_nation_groups_calls_decoder(mock_client, game_stat
     with patch("fc_client.handlers.protocol.decode_ruleset_nation_groups") as mock_decode:
         mock_decode.return_value = {"ngroups": 1, "groups": ["Ancient"], "hidden": [False]}
 
-        await handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
+        handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
 
         mock_decode.assert_called_once_with(payload)
 
@@ -1568,21 +1684,91 @@ async def test_handle_ruleset_nation_groups_transforms_parallel_arrays(mock_clie
         b"\x01"  # hidden[3]=true
     )
 
-    await handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
+    handlers.handle_ruleset_nation_groups(mock_client, game_state, payload)
 
     # Verify transformation from parallel arrays to objects
-    assert len(game_state.nation_groups) == 4
-    assert all(isinstance(group, NationGroup) for group in game_state.nation_groups)
+    assert len(game_state.ruleset.nation_groups) == 4
+    assert all(isinstance(group, NationGroup) for group in game_state.ruleset.nation_groups)
 
     # Verify each group has correct name and hidden status
-    assert game_state.nation_groups[0].name == "Ancient"
-    assert game_state.nation_groups[0].hidden == False
-    assert game_state.nation_groups[1].name == "Medieval"
-    assert game_state.nation_groups[1].hidden == False
-    assert game_state.nation_groups[2].name == "Modern"
-    assert game_state.nation_groups[2].hidden == False
-    assert game_state.nation_groups[3].name == "Barbarian"
-    assert game_state.nation_groups[3].hidden == True
+    assert game_state.ruleset.nation_groups[0].name == "Ancient"
+    assert game_state.ruleset.nation_groups[0].hidden == False
+    assert game_state.ruleset.nation_groups[1].name == "Medieval"
+    assert game_state.ruleset.nation_groups[1].hidden == False
+    assert game_state.ruleset.nation_groups[2].name == "Modern"
+    assert game_state.ruleset.nation_groups[2].hidden == False
+    assert game_state.ruleset.nation_groups[3].name == "Barbarian"
+    assert game_state.ruleset.nation_groups[3].hidden == True
+
+
+@pytest.mark.async_test
+async def test_handle_ruleset_nation_packs_fields(mock_client, game_state):
+    """Handler should pack ID lists into uint16 arrays and genders into a bitmask."""
+    decoded = {
+        "id": 2,
+        "adjective": "Roman",
+        "rule_name": "roman",
+        "leader_name": ["Caesar", "Livia", "Augustus"],
+        "leader_is_male": [True, False, True],
+        "nsets": 2,
+        "sets": [0, 3],
+        "ngroups": 1,
+        "groups": [5],
+        "init_techs_count": 2,
+        "init_techs": [10, 300],
+        "init_units_count": 0,
+        "init_units": [],
+    }
+
+    with patch("fc_client.handlers.protocol.decode_ruleset_nation", return_value=decoded):
+        handlers.handle_ruleset_nation(mock_client, game_state, b"dummy")
+
+    nation = game_state.ruleset.nations[2]
+    assert nation.sets == array("H", [0, 3])
+    assert nation.groups == array("H", [5])
+    assert nation.init_techs == array("H", [10, 300])
+    assert nation.init_units == array("H")
+    assert nation.init_buildings == array("H")
+    assert nation.leader_is_male_mask == 0b101
+    assert nation.is_leader_male(0)
+    assert not nation.is_leader_male(1)
+    assert nation.is_leader_male(2)
+    assert nation.leader_count == 3
+    assert nation.nsets == 2
+    assert nation.ngroups == 1
+    assert nation.init_techs_count == 2
+    assert nation.init_units_count == 0
+    assert nation.init_buildings_count == 0
+
+
+@pytest.mark.async_test
+async def test_handle_ruleset_nation_summary_logged_at_debug(mock_client, game_state, caplog):
+    """Per-nation summary should only be emitted when DEBUG logging is enabled."""
+    decoded = {"id": 4, "adjective": "Greek", "rule_name": "greek", "leader_name": ["Pericles"]}
+
+    with patch("fc_client.handlers.protocol.decode_ruleset_nation", return_value=decoded):
+        with caplog.at_level(logging.INFO, logger="fc_client.handlers.ruleset"):
+            handlers.handle_ruleset_nation(mock_client, game_state, b"dummy")
+        assert caplog.records == []
+
+        with caplog.at_level(logging.DEBUG, logger="fc_client.handlers.ruleset"):
+            handlers.handle_ruleset_nation(mock_client, game_state, b"dummy")
+
+    assert "[NATION 4] Greek (greek)" in caplog.text
+    assert "Leaders: Pericles" in caplog.text
+
+
+@pytest.mark.async_test
+async def test_handle_ruleset_resource_packs_output(mock_client, game_state):
+    """Handler should store the six UINT8 outputs as a byte array."""
+    decoded = {"id": 3, "output": [2, 0, 1, 0, 0, 0]}
+
+    with patch("fc_client.handlers.protocol.decode_ruleset_resource", return_value=decoded):
+        handlers.handle_ruleset_resource(mock_client, game_state, b"dummy")
+
+    resource = game_state.ruleset.resources[3]
+    assert resource.output == array("B", [2, 0, 1, 0, 0, 0])
+    assert resource.output[0] == 2
 
 
 # ============================================================================
@@ -1602,7 +1788,7 @@ async def test_handle_nation_availability_basic(mock_client, game_state):
         b"\x01"  # is_pickable[2]=True
     )
 
-    await handlers.handle_nation_availability(mock_client, game_state, payload)
+    handlers.handle_nation_availability(mock_client, game_state, payload)
 
     # Verify game state was updated
     assert game_state.nation_availability is not None
@@ -1622,7 +1808,7 @@ async def test_handle_nation_availability_nationset_change(mock_client, game_sta
         b"\x01"  # is_pickable[1]=True
     )
 
-    await handlers.handle_nation_availability(mock_client, game_state, payload)
+    handlers.handle_nation_availability(mock_client, game_state, payload)
 
     # Verify nationset_change flag is detected from bitvector
     assert game_state.nation_availability is not None
@@ -1645,23 +1831,17 @@ async def test_handle_nation_availability_with_nations_loaded(mock_client, game_
         noun_plural="Romans",
         graphic_str="",
         graphic_alt="",
-        legend="",
+        legend_raw=b"",
         style=0,
-        leader_count=1,
         leader_name=["Caesar"],
-        leader_is_male=[True],
+        leader_is_male_mask=0b1,
         is_playable=True,
         barbarian_type=0,
-        nsets=0,
         sets=[],
-        ngroups=0,
         groups=[],
         init_government_id=-1,
-        init_techs_count=0,
         init_techs=[],
-        init_units_count=0,
         init_units=[],
-        init_buildings_count=0,
         init_buildings=[],
     )
     nation1 = Nation(
@@ -1672,27 +1852,21 @@ async def test_handle_nation_availability_with_nations_loaded(mock_client, game_
         noun_plural="Babylonians",
         graphic_str="",
         graphic_alt="",
-        legend="",
+        legend_raw=b"",
         style=0,
-        leader_count=1,
         leader_name=["Hammurabi"],
-        leader_is_male=[True],
+        leader_is_male_mask=0b1,
         is_playable=True,
         barbarian_type=0,
-        nsets=0,
         sets=[],
-        ngroups=0,
         groups=[],
         init_government_id=-1,
-        init_techs_count=0,
         init_techs=[],
-        init_units_count=0,
         init_units=[],
-        init_buildings_count=0,
         init_buildings=[],
     )
 
-    game_state.nations = {0: nation0, 1: nation1}
+    game_state.ruleset.nations = [nation0, nation1]
 
     # Delta protocol packet indicating only nation 0 is available
     payload = (
@@ -1702,7 +1876,7 @@ async def test_handle_nation_availability_with_nations_loaded(mock_client, game_
         b"\x00"  # is_pickable[1]=False
     )
 
-    await handlers.handle_nation_availability(mock_client, game_state, payload)
+    handlers.handle_nation_availability(mock_client, game_state, payload)
 
     # Verify game state was updated correctly
     assert game_state.nation_availability is not None
@@ -1714,6 +1888,27 @@ async def test_handle_nation_availability_with_nations_loaded(mock_client, game_
     # and the availability data matches the nation IDs we have
 
 
+@pytest.mark.async_test
+async def test_handle_nation_availability_limits_listing(mock_client, game_state, caplog):
+    """Only the first 10 known available nations are listed, followed by a remainder line."""
+    for nation_id in range(12):
+        decoded = {"id": nation_id, "adjective": f"Adj{nation_id}", "rule_name": f"n{nation_id}"}
+        with patch("fc_client.handlers.protocol.decode_ruleset_nation", return_value=decoded):
+            handlers.handle_ruleset_nation(mock_client, game_state, b"dummy")
+    caplog.clear()
+
+    data = {"ncount": 12, "is_pickable": [True] * 12, "nationset_change": False}
+    with patch("fc_client.handlers.protocol.decode_nation_availability", return_value=data):
+        with caplog.at_level(logging.INFO, logger="fc_client.handlers"):
+            handlers.handle_nation_availability(mock_client, game_state, b"dummy")
+
+    out = caplog.text
+    assert "12/12 nations available" in out
+    assert "- Adj9 (n9)" in out
+    assert "Adj10" not in out
+    assert "... and 2 more" in out
+
+
 async def test_handle_ruleset_game(mock_client, game_state):
     """Test handle_ruleset_game with complete game configuration."""
     # Build payload with actual observed structure
@@ -1752,25 +1947,25 @@ async def test_handle_ruleset_game(mock_client, game_state):
     payload += struct.pack("<BBB", 139, 140, 141)
 
     # Call handler
-    await handlers.handle_ruleset_game(mock_client, game_state, payload)
+    handlers.handle_ruleset_game(mock_client, game_state, payload)
 
     # Verify game state was updated
-    assert game_state.ruleset_game is not None
+    assert game_state.ruleset.ruleset_game is not None
     # Tech/building fields not in actual packet (defaults)
-    assert game_state.ruleset_game.default_specialist == 0
-    assert game_state.ruleset_game.global_init_techs_count == 0
-    assert game_state.ruleset_game.global_init_techs == []
-    assert game_state.ruleset_game.global_init_buildings_count == 0
-    assert game_state.ruleset_game.global_init_buildings == []
-    assert game_state.ruleset_game.veteran_levels == 3
-    assert game_state.ruleset_game.veteran_name == ["Green", "Veteran", "Hardened"]
-    assert game_state.ruleset_game.power_fact == [100, 150, 175]
-    assert game_state.ruleset_game.move_bonus == [0, 3, 6]
-    assert game_state.ruleset_game.base_raise_chance == [50, 33, 20]
-    assert game_state.ruleset_game.work_raise_chance == [0, 5, 10]
-    assert game_state.ruleset_game.background_red == 139
-    assert game_state.ruleset_game.background_green == 140
-    assert game_state.ruleset_game.background_blue == 141
+    assert game_state.ruleset.ruleset_game.default_specialist == 0
+    assert game_state.ruleset.ruleset_game.global_init_techs_count == 0
+    assert list(game_state.ruleset.ruleset_game.global_init_techs) == []
+    assert game_state.ruleset.ruleset_game.global_init_buildings_count == 0
+    assert list(game_state.ruleset.ruleset_game.global_init_buildings) == []
+    assert game_state.ruleset.ruleset_game.veteran_levels == 3
+    assert game_state.ruleset.ruleset_game.veteran_name == ["Green", "Veteran", "Hardened"]
+    assert game_state.ruleset.ruleset_game.power_fact == array("H", [100, 150, 175])
+    assert game_state.ruleset.ruleset_game.move_bonus == array("I", [0, 3, 6])
+    assert list(game_state.ruleset.ruleset_game.base_raise_chance) == [50, 33, 20]
+    assert list(game_state.ruleset.ruleset_game.work_raise_chance) == [0, 5, 10]
+    assert game_state.ruleset.ruleset_game.background_red == 139
+    assert game_state.ruleset.ruleset_game.background_green == 140
+    assert game_state.ruleset.ruleset_game.background_blue == 141
 
 
 @pytest.mark.asyncio
@@ -1821,11 +2016,11 @@ async def test_handle_ruleset_achievement(mock_client, game_state):
         ]
     )
 
-    await handlers.handle_ruleset_achievement(mock_client, game_state, payload)
+    handlers.handle_ruleset_achievement(mock_client, game_state, payload)
 
     # Verify storage
-    assert 38 in game_state.achievements
-    achievement = game_state.achievements[38]
+    assert game_state.ruleset.achievements[38] is not None
+    achievement = game_state.ruleset.achievements[38]
     assert achievement.name == "Spaceship Launch"
     assert achievement.rule_name == "Spaceship Launch"
     assert achievement.type == 0
@@ -1837,10 +2032,10 @@ async def test_handle_ruleset_trade(mock_client, game_state):
     # Delta protocol: bitvector=0x0E (bits 1,2,3), trade_pct=100, cancelling=0, bonus_type=1
     payload = bytes([0x0E, 0, 100, 0, 1])  # bitvector, pct (big-endian), cancel, bonus
 
-    await handlers.handle_ruleset_trade(mock_client, game_state, payload)
+    handlers.handle_ruleset_trade(mock_client, game_state, payload)
 
-    assert 0 in game_state.trade_routes
-    trade = game_state.trade_routes[0]
+    assert game_state.ruleset.trade_routes[0] is not None
+    trade = game_state.ruleset.trade_routes[0]
     assert trade.id == 0  # Not in payload, defaults to 0
     assert trade.trade_pct == 100
     assert trade.cancelling == 0
@@ -1873,11 +2068,11 @@ async def test_handle_ruleset_action_auto(mock_client, game_state):
         ]
     )
 
-    await handlers.handle_ruleset_action_auto(mock_client, game_state, payload)
+    handlers.handle_ruleset_action_auto(mock_client, game_state, payload)
 
     # Verify storage in list
-    assert len(game_state.action_auto_performers) == 1
-    auto_performer = game_state.action_auto_performers[0]
+    assert len(game_state.ruleset.action_auto_performers) == 1
+    auto_performer = game_state.ruleset.action_auto_performers[0]
 
     # Verify fields
     assert auto_performer.id == 5
@@ -1997,11 +2192,11 @@ async def test_handle_ruleset_government_all_fields(mock_client, game_state):
         ]
     )
 
-    await handlers.handle_ruleset_government(mock_client, game_state, payload)
+    handlers.handle_ruleset_government(mock_client, game_state, payload)
 
     # Verify storage in dict
-    assert 0 in game_state.governments
-    gov = game_state.governments[0]
+    assert game_state.ruleset.governments[0] is not None
+    gov = game_state.ruleset.governments[0]
 
     # Verify fields
     assert gov.id == 0
@@ -2121,11 +2316,11 @@ async def test_handle_ruleset_government_with_requirements(mock_client, game_sta
         ]
     )
 
-    await handlers.handle_ruleset_government(mock_client, game_state, payload)
+    handlers.handle_ruleset_government(mock_client, game_state, payload)
 
     # Verify storage
-    assert 1 in game_state.governments
-    gov = game_state.governments[1]
+    assert game_state.ruleset.governments[1] is not None
+    gov = game_state.ruleset.governments[1]
 
     # Verify fields
     assert gov.id == 1
@@ -2155,7 +2350,7 @@ async def test_handle_ruleset_government_real_packet(mock_client, game_state):
             0x00,  # reqs_count: 0
         ]
     )
-    await handlers.handle_ruleset_government(mock_client, game_state, payload1)
+    handlers.handle_ruleset_government(mock_client, game_state, payload1)
 
     # Second packet: update strings only (like real captured packet)
     payload2 = bytes(
@@ -2236,11 +2431,11 @@ async def test_handle_ruleset_government_real_packet(mock_client, game_state):
             0x00,
         ]
     )
-    await handlers.handle_ruleset_government(mock_client, game_state, payload2)
+    handlers.handle_ruleset_government(mock_client, game_state, payload2)
 
     # Verify final state (should have both id from cache and new strings)
-    assert 0 in game_state.governments
-    gov = game_state.governments[0]
+    assert game_state.ruleset.governments[0] is not None
+    gov = game_state.ruleset.governments[0]
     assert gov.id == 0  # From first packet
     assert gov.reqs_count == 0  # From first packet
     assert gov.name == "Anarchy"  # From second packet
@@ -2274,11 +2469,11 @@ async def test_handle_ruleset_government_ruler_title(mock_client, game_state):
         ]
     )
 
-    await handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload)
+    handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload)
 
     # Verify storage
-    assert len(game_state.government_ruler_titles) == 1
-    title = game_state.government_ruler_titles[0]
+    assert len(game_state.ruleset.government_ruler_titles) == 1
+    title = game_state.ruleset.government_ruler_titles[0]
 
     # Verify fields
     assert title.gov == 2
@@ -2318,7 +2513,7 @@ async def test_handle_ruleset_government_ruler_title_multiple(mock_client, game_
         ]
     )
 
-    await handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload1)
+    handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload1)
 
     # Second title (delta update - only gov and nation)
     payload2 = bytes(
@@ -2330,20 +2525,20 @@ async def test_handle_ruleset_government_ruler_title_multiple(mock_client, game_
         ]
     )
 
-    await handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload2)
+    handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload2)
 
     # Verify storage
-    assert len(game_state.government_ruler_titles) == 2
+    assert len(game_state.ruleset.government_ruler_titles) == 2
 
     # First title
-    title1 = game_state.government_ruler_titles[0]
+    title1 = game_state.ruleset.government_ruler_titles[0]
     assert title1.gov == 0
     assert title1.nation == 0
     assert title1.male_title == "Chief"
     assert title1.female_title == "Chieftess"
 
     # Second title (should have ids from packet, titles from cache)
-    title2 = game_state.government_ruler_titles[1]
+    title2 = game_state.ruleset.government_ruler_titles[1]
     assert title2.gov == 1
     assert title2.nation == 2
     assert title2.male_title == "Chief"  # From cache
@@ -2364,11 +2559,11 @@ async def test_handle_ruleset_government_ruler_title_empty_strings(mock_client,
         ]
     )
 
-    await handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload)
+    handlers.handle_ruleset_government_ruler_title(mock_client, game_state, payload)
 
     # Verify storage
-    assert len(game_state.government_ruler_titles) == 1
-    title = game_state.government_ruler_titles[0]
+    assert len(game_state.ruleset.government_ruler_titles) == 1
+    title = game_state.ruleset.government_ruler_titles[0]
     assert title.gov == 1
     assert title.nation == 3
     assert title.male_title == ""
@@ -2384,11 +2579,11 @@ async def test_handle_ruleset_style(mock_client, game_state):
         b"asian\x00"  # rule_name
     )
 
-    await handlers.handle_ruleset_style(mock_client, game_state, payload)
+    handlers.handle_ruleset_style(mock_client, game_state, payload)
 
-    assert 0 in game_state.styles
-    assert game_state.styles[0].name == "Asian"
-    assert game_state.styles[0].rule_name == "asian"
+    assert game_state.ruleset.styles[0] is not None
+    assert game_state.ruleset.styles[0].name == "Asian"
+    assert game_state.ruleset.styles[0].rule_name == "asian"
 
 
 async def test_handle_ruleset_style_multiple(mock_client, game_state):
@@ -2400,7 +2595,7 @@ async def test_handle_ruleset_style_multiple(mock_client, game_state):
         b"European\x00"  # name
         b"european\x00"  # rule_name
     )
-    await handlers.handle_ruleset_style(mock_client, game_state, payload1)
+    handlers.handle_ruleset_style(mock_client, game_state, payload1)
 
     # Second style
     payload2 = (
@@ -2409,12 +2604,12 @@ async def test_handle_ruleset_style_multiple(mock_client, game_state):
         b"Classical\x00"  # name
         b"classical\x00"  # rule_name
     )
-    await handlers.handle_ruleset_style(mock_client, game_state, payload2)
+    handlers.handle_ruleset_style(mock_client, game_state, payload2)
 
     # Verify both stored
-    assert len(game_state.styles) == 2
-    assert game_state.styles[0].name == "European"
-    assert game_state.styles[1].name == "Classical"
+    assert len(game_state.ruleset.styles) == 2
+    assert game_state.ruleset.styles[0].name == "European"
+    assert game_state.ruleset.styles[1].name == "Classical"
 
 
 # ============================================================================
@@ -2429,7 +2624,7 @@ async def test_handle_rulesets_ready_sets_flag(mock_client, game_state):
 
     payload = b""  # Empty payload
 
-    await handlers.handle_rulesets_ready(mock_client, game_state, payload)
+    handlers.handle_rulesets_ready(mock_client, game_state, payload)
 
     # Should now be marked as ready
     assert game_state.rulesets_ready is True
@@ -2440,8 +2635,8 @@ async def test_handle_rulesets_ready_idempotent(mock_client, game_state):
     payload = b""
 
     # Call multiple times
-    await handlers.handle_rulesets_ready(mock_client, game_state, payload)
-    await handlers.handle_rulesets_ready(mock_client, game_state, payload)
+    handlers.handle_rulesets_ready(mock_client, game_state, payload)
+    handlers.handle_rulesets_ready(mock_client, game_state, payload)
 
     # Should still be marked as ready
     assert game_state.rulesets_ready is True
@@ -56,6 +56,8 @@ def mock_stream_writer():
     writer.close = MagicMock()
     writer.wait_closed = AsyncMock()
     writer.is_closing = MagicMock(return_value=False)
+    writer.transport = MagicMock()
+    writer.transport.get_write_buffer_size = MagicMock(return_value=0)
     return writer
 
 
@@ -474,6 +474,46 @@ def test_delta_packet_spec_from_registry(delta_cache):
     assert result["turn"] == 1
 
 
+@pytest.mark.integration
+def test_delta_packet_ruleset_control_integer_prefix(delta_cache):
+    """RULESET_CONTROL's 22 leading UINT16 counts decode in one pass, then fall back to cache."""
+    spec = PACKET_SPECS[155]
+    assert spec.prefix_struct is not None
+    assert spec.prefix_struct.format == ">" + "H" * 22
+
+    counts = list(range(1, 23))
+    # Bits 0-21 counts, 22-24 strings, 25 popup_tech_help, 26-28 strings, 29-30 ints
+    payload = (
+        struct.pack("<I", 0x7FFFFFFF)
+        + struct.pack(">22H", *counts)
+        + encode_string("amplio2")
+        + encode_string("stdsounds")
+        + encode_string("stdmusic")
+        + encode_string("civ2civ3")
+        + encode_string("3.0")
+        + encode_string("")
+        + encode_uint32(1234)
+        + struct.pack(">H", 3)
+    )
+    result = decode_delta_packet(payload, spec, delta_cache)
+
+    assert [result[name] for name in spec.prefix_names] == counts
+    assert result["preferred_tileset"] == "amplio2"
+    assert result["popup_tech_help"] is True
+    assert result["name"] == "civ2civ3"
+    assert result["desc_length"] == 1234
+    assert result["num_counters"] == 3
+
+    # Partial prefix: only num_unit_types (bit 1) changes, per-field path is used
+    payload2 = struct.pack("<I", 0x02) + struct.pack(">H", 99)
+    result2 = decode_delta_packet(payload2, spec, delta_cache)
+
+    assert result2["num_unit_classes"] == 1
+    assert result2["num_unit_types"] == 99
+    assert result2["num_nation_sets"] == 22
+    assert result2["name"] == "civ2civ3"
+
+
 @pytest.mark.integration
 @pytest.mark.slow
 def test_full_chat_msg_pipeline(delta_cache):
@@ -556,7 +596,7 @@ def test_decode_server_info_integration():
 
 @pytest.mark.integration
 def test_ruleset_tech_flag_handler_stores_in_game_state(freeciv_client, game_state):
-    """Test that handle_ruleset_tech_flag stores tech flag in game_state.tech_flags."""
+    """Test that handle_ruleset_tech_flag stores tech flag in game_state.ruleset.tech_flags."""
     from fc_client.handlers.ruleset import handle_ruleset_tech_flag
     from fc_client.protocol import encode_string
 
@@ -569,13 +609,11 @@ def test_ruleset_tech_flag_handler_stores_in_game_state(freeciv_client, game_sta
     )
 
     # Call handler
-    import asyncio
-
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload))
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload)
 
     # Verify tech flag was stored
-    assert 1 in game_state.tech_flags
-    tech_flag = game_state.tech_flags[1]
+    assert 1 in game_state.ruleset.tech_flags
+    tech_flag = game_state.ruleset.tech_flags[1]
     assert tech_flag.id == 1
     assert tech_flag.name == "Prerequisite"
     assert tech_flag.helptxt == "Technology has a prerequisite."
@@ -611,22 +649,20 @@ def test_ruleset_tech_flag_handler_multiple_flags(freeciv_client, game_state):
     )
 
     # Call handlers
-    import asyncio
-
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload1))
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload2))
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload3))
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload1)
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload2)
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload3)
 
     # Verify all three are stored
-    assert len(game_state.tech_flags) == 3
-    assert 0 in game_state.tech_flags
-    assert 1 in game_state.tech_flags
-    assert 2 in game_state.tech_flags
+    assert len(game_state.ruleset.tech_flags) == 3
+    assert 0 in game_state.ruleset.tech_flags
+    assert 1 in game_state.ruleset.tech_flags
+    assert 2 in game_state.ruleset.tech_flags
 
     # Verify each tech flag
-    assert game_state.tech_flags[0].name == "Bonus_Tech"
-    assert game_state.tech_flags[1].name == "Root_Req"
-    assert game_state.tech_flags[2].name == "Special"
+    assert game_state.ruleset.tech_flags[0].name == "Bonus_Tech"
+    assert game_state.ruleset.tech_flags[1].name == "Root_Req"
+    assert game_state.ruleset.tech_flags[2].name == "Special"
 
 
 @pytest.mark.integration
@@ -649,13 +685,11 @@ def test_ruleset_tech_flag_handler_with_delta_cache(freeciv_client, game_state):
     )
 
     # Call handlers
-    import asyncio
-
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload1))
-    asyncio.run(handle_ruleset_tech_flag(freeciv_client, game_state, payload2))
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload1)
+    handle_ruleset_tech_flag(freeciv_client, game_state, payload2)
 
     # Verify final state has updated name but cached id and helptxt
-    tech_flag = game_state.tech_flags[5]
+    tech_flag = game_state.ruleset.tech_flags[5]
     assert tech_flag.id == 5  # From cache (not transmitted in 2nd packet)
     assert tech_flag.name == "Updated_Name"  # Updated value
     assert tech_flag.helptxt == "Initial help text."  # From cache
@@ -217,11 +217,11 @@ class TestHandleRulesetBase:
             ]
         )
 
-        await handle_ruleset_base(client, game_state, payload)
+        handle_ruleset_base(client, game_state, payload)
 
         # Verify BaseType was created and stored
-        assert 1 in game_state.base_types
-        base_type = game_state.base_types[1]
+        assert 1 in game_state.ruleset.base_types
+        base_type = game_state.ruleset.base_types[1]
 
         assert isinstance(base_type, BaseType)
         assert base_type.id == 1
@@ -239,21 +239,21 @@ class TestHandleRulesetBase:
 
         # First base type (Fortress)
         payload1 = bytes([0x03, 0x00, 0x00])  # id=0, gui_type=0
-        await handle_ruleset_base(client, game_state, payload1)
+        handle_ruleset_base(client, game_state, payload1)
 
         # Second base type (Airbase)
         payload2 = bytes([0x03, 0x01, 0x01])  # id=1, gui_type=1
-        await handle_ruleset_base(client, game_state, payload2)
+        handle_ruleset_base(client, game_state, payload2)
 
         # Third base type (Other)
         payload3 = bytes([0x03, 0x02, 0x02])  # id=2, gui_type=2
-        await handle_ruleset_base(client, game_state, payload3)
+        handle_ruleset_base(client, game_state, payload3)
 
         # Verify all three are stored
-        assert len(game_state.base_types) == 3
-        assert game_state.base_types[0].gui_type == 0  # Fortress
-        assert game_state.base_types[1].gui_type == 1  # Airbase
-        assert game_state.base_types[2].gui_type == 2  # Other
+        assert len(game_state.ruleset.base_types) == 3
+        assert game_state.ruleset.base_types[0].gui_type == 0  # Fortress
+        assert game_state.ruleset.base_types[1].gui_type == 1  # Airbase
+        assert game_state.ruleset.base_types[2].gui_type == 2  # Other
 
     @pytest.mark.asyncio
     async def test_handler_with_cached_values(self):
@@ -263,14 +263,14 @@ class TestHandleRulesetBase:
 
         # First packet: full data
         payload1 = bytes([0x3F, 0x05, 0x01, 0x0A, 0x08, 0x06, 0x04])
-        await handle_ruleset_base(client, game_state, payload1)
+        handle_ruleset_base(client, game_state, payload1)
 
         # Second packet: only update border_sq (bit 2)
         payload2 = bytes([0x04, 0x14])  # border_sq=20
-        await handle_ruleset_base(client, game_state, payload2)
+        handle_ruleset_base(client, game_state, payload2)
 
         # Verify cached values are preserved
-        base_type = game_state.base_types[5]
+        base_type = game_state.ruleset.base_types[5]
         assert base_type.id == 5
         assert base_type.gui_type == 1  # From first packet
         assert base_type.border_sq == 20  # Updated
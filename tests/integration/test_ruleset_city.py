@@ -247,14 +247,13 @@ class TestPacketRulesetCity:
 
         # Import handler
         from fc_client.handlers.ruleset import handle_ruleset_city
-        import asyncio
 
         # Call handler
-        asyncio.run(handle_ruleset_city(freeciv_client, game_state, bytes(payload)))
+        handle_ruleset_city(freeciv_client, game_state, bytes(payload))
 
         # Verify stored in game state
-        assert 7 in freeciv_client.game_state.city_styles
-        city_style = freeciv_client.game_state.city_styles[7]
+        assert freeciv_client.game_state.ruleset.city_styles[7] is not None
+        city_style = freeciv_client.game_state.ruleset.city_styles[7]
 
         assert isinstance(city_style, CityStyle)
         assert city_style.style_id == 7
@@ -272,7 +271,6 @@ class TestPacketRulesetCity:
         freeciv_client.game_state = game_state
 
         from fc_client.handlers.ruleset import handle_ruleset_city
-        import asyncio
 
         # Define helper to create packet
         def create_packet(style_id, name, rule_name):
@@ -296,14 +294,14 @@ class TestPacketRulesetCity:
 
         for style_id, name, rule_name in styles:
             packet = create_packet(style_id, name, rule_name)
-            asyncio.run(handle_ruleset_city(freeciv_client, game_state, packet))
+            handle_ruleset_city(freeciv_client, game_state, packet)
 
         # Verify all stored
-        assert len(freeciv_client.game_state.city_styles) == 3
+        assert len(freeciv_client.game_state.ruleset.city_styles) == 3
 
         for style_id, name, rule_name in styles:
-            assert style_id in freeciv_client.game_state.city_styles
-            city_style = freeciv_client.game_state.city_styles[style_id]
+            assert freeciv_client.game_state.ruleset.city_styles[style_id] is not None
+            city_style = freeciv_client.game_state.ruleset.city_styles[style_id]
             assert city_style.name == name
             assert city_style.rule_name == rule_name
             assert city_style.citizens_graphic == f"city.{rule_name}"
@@ -31,7 +31,7 @@ def test_decode_ruleset_specialist_entertainers():
     assert "?" in data["short_name"] or "Elvis" in data["short_name"]
     assert data["graphic_str"] == "specialist.entertainer"
     assert data["graphic_alt"] in ["-", ""]
-    assert "luxury" in data["helptext"].lower()
+    assert b"luxury" in data["helptext"].lower()
 
 
 def test_decode_ruleset_specialist_delta_protocol():
@@ -45,11 +45,9 @@ def test_decode_ruleset_specialist_delta_protocol():
     data1 = protocol.decode_ruleset_specialist(payload1, delta_cache)
 
     # Verify data is cached
-    # DeltaCache stores by packet_type as key, with () tuple as subkey
-    assert protocol.PACKET_RULESET_SPECIALIST in delta_cache._cache
-    packet_cache = delta_cache._cache[protocol.PACKET_RULESET_SPECIALIST]
-    assert () in packet_cache
-    cached_data = packet_cache[()]
+    # DeltaCache stores by (packet_type, key_tuple), with () as the key tuple
+    assert (protocol.PACKET_RULESET_SPECIALIST, ()) in delta_cache._cache
+    cached_data = delta_cache._cache[(protocol.PACKET_RULESET_SPECIALIST, ())]
     assert cached_data["id"] == data1["id"]
     assert cached_data["plural_name"] == data1["plural_name"]
 
@@ -68,12 +66,12 @@ async def test_handle_ruleset_specialist():
     game_state = GameState()
 
     # Call handler
-    await ruleset.handle_ruleset_specialist(client, game_state, payload)
+    ruleset.handle_ruleset_specialist(client, game_state, payload)
 
     # Verify game state was updated
     # NOTE: ID is 0 because bit 0 not set in this captured packet
-    assert 0 in game_state.specialists
-    specialist = game_state.specialists[0]
+    assert game_state.ruleset.specialists[0] is not None
+    specialist = game_state.ruleset.specialists[0]
 
     assert isinstance(specialist, Specialist)
     assert specialist.id == 0
@@ -93,9 +91,8 @@ def test_specialist_dataclass():
         short_name="?Sci",
         graphic_str="specialist.scientist",
         graphic_alt="-",
-        reqs_count=0,
         reqs=[],
-        helptext="Scientists produce research.",
+        helptext_raw=b"Scientists produce research.",
     )
 
     assert specialist.id == 1
@@ -199,20 +199,36 @@ def test_clear_nonexistent_packet_type_no_error(delta_cache):
 
 
 @pytest.mark.unit
-def test_cache_stores_copy_not_reference(delta_cache):
-    """Cache should store a copy to prevent external modification."""
-    # Create mutable dict
+def test_cache_takes_ownership_of_fields(delta_cache):
+    """Cache should store the fields dict itself (caller hands off ownership)."""
     original = {"turn": 1, "year": 1850}
 
-    # Store in cache
     delta_cache.update_cache(25, (0,), original)
 
-    # Modify original
+    assert delta_cache.get_cached_packet(25, (0,)) is original
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not __debug__, reason="ownership check uses assert")
+def test_cache_detects_mutation_after_update():
+    """Mutating fields after update_cache should be caught when check_ownership is set."""
+    delta_cache = DeltaCache(check_ownership=True)
+    original = {"turn": 1, "year": 1850}
+    delta_cache.update_cache(25, (0,), original)
+
+    # Violate the ownership contract
     original["turn"] = 999
 
-    # Cached value should be unchanged
-    cached = delta_cache.get_cached_packet(25, (0,))
-    assert cached["turn"] == 1
+    with pytest.raises(AssertionError):
+        delta_cache.get_cached_packet(25, (0,))
+
+
+@pytest.mark.unit
+def test_cache_ownership_check_off_by_default(delta_cache):
+    """Without check_ownership no snapshots are kept."""
+    delta_cache.update_cache(25, (0,), {"turn": 1})
+
+    assert delta_cache._snapshots == {}
 
 
 @pytest.mark.unit
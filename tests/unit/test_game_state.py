@@ -5,8 +5,25 @@ Tests the simple data class that maintains current game state as packets
 are received from the server.
 """
 
+import sys
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+
 import pytest
-from fc_client.game_state import GameState, RulesetControl
+from fc_client.game_state import (
+    CHAT_HISTORY_LIMIT,
+    ActionType,
+    FlagTable,
+    GameState,
+    NationGroup,
+    Resource,
+    RulesetBundle,
+    RulesetControl,
+    Requirement,
+    TechFlag,
+    UnitFlag,
+    store_by_id,
+)
 
 # ============================================================================
 # Initialization Tests
@@ -19,14 +36,24 @@ def test_game_state_initializes_with_defaults():
     state = GameState()
 
     assert state.server_info is None
-    assert state.chat_history == []
+    assert list(state.chat_history) == []
+
+
+@pytest.mark.unit
+def test_game_state_rejects_undeclared_attributes():
+    """GameState uses __slots__, so unknown attributes cannot be created."""
+    state = GameState()
+
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(AttributeError):
+        state.server_infos = {}
 
 
 @pytest.mark.unit
 def test_game_state_fixture_provides_fresh_instance(game_state):
     """Fixture should provide a fresh GameState with default values."""
     assert game_state.server_info is None
-    assert game_state.chat_history == []
+    assert list(game_state.chat_history) == []
 
 
 # ============================================================================
@@ -100,8 +127,8 @@ def test_game_state_chat_history_preserves_order(game_state):
 
 
 @pytest.mark.unit
-def test_game_state_chat_history_is_persistent_list(game_state):
-    """chat_history should be a persistent list across accesses."""
+def test_game_state_chat_history_is_persistent(game_state):
+    """chat_history should be the same container across accesses."""
     # Add message
     game_state.chat_history.append({"message": "first"})
 
@@ -152,7 +179,56 @@ def test_multiple_game_states_are_independent():
 
     # state2 should be unaffected
     assert state2.server_info is None
-    assert state2.chat_history == []
+    assert list(state2.chat_history) == []
+
+
+@pytest.mark.unit
+def test_clone_for_rollout_shares_ruleset_and_copies_runtime():
+    """clone_for_rollout shares the ruleset bundle but copies runtime containers."""
+    state = GameState()
+    state.game_info = {"turn": 5}
+    state.chat_history.append({"message": "hello"})
+
+    clone = state.clone_for_rollout()
+    clone.game_info["turn"] = 6
+    clone.chat_history.append({"message": "rollout"})
+
+    assert clone.ruleset is state.ruleset
+    assert state.game_info == {"turn": 5}
+    assert list(state.chat_history) == [{"message": "hello"}]
+
+
+@pytest.mark.unit
+def test_ruleset_bundle_from_control_starts_fresh_ruleset(game_state):
+    """A new RULESET_CONTROL replaces the bundle, leaving clones on the old ruleset."""
+    old_ruleset = game_state.ruleset
+    old_ruleset.ruleset_description = "Old ruleset"
+    clone = game_state.clone_for_rollout()
+    rc = SimpleNamespace(
+        nation_count=3,
+        num_disaster_types=0,
+        num_achievement_types=0,
+        num_tech_types=2,
+        government_count=0,
+        terrain_count=0,
+        num_specialist_types=0,
+        num_goods_types=0,
+        num_extra_types=0,
+        num_unit_classes=0,
+        num_unit_types=0,
+        num_styles=0,
+        num_music_styles=0,
+        num_impr_types=0,
+        num_city_styles=0,
+    )
+
+    game_state.ruleset = RulesetBundle.from_control(rc)
+
+    assert game_state.ruleset.ruleset_control is rc
+    assert game_state.ruleset.ruleset_description is None
+    assert game_state.ruleset.nations == [None] * 3
+    assert clone.ruleset is old_ruleset
+    assert clone.ruleset.ruleset_description == "Old ruleset"
 
 
 # ============================================================================
@@ -177,15 +253,15 @@ def test_game_state_handles_empty_dict_vs_none(game_state):
 
 
 @pytest.mark.unit
-def test_game_state_handles_large_chat_history(game_state):
-    """Should handle large chat history without issues."""
+def test_game_state_chat_history_is_bounded(game_state):
+    """chat_history keeps only the most recent CHAT_HISTORY_LIMIT messages."""
     # Add many messages
     for i in range(1000):
         game_state.chat_history.append({"id": i, "message": f"msg{i}"})
 
-    assert len(game_state.chat_history) == 1000
-    assert game_state.chat_history[0]["id"] == 0
-    assert game_state.chat_history[999]["id"] == 999
+    assert len(game_state.chat_history) == CHAT_HISTORY_LIMIT
+    assert game_state.chat_history[0]["id"] == 1000 - CHAT_HISTORY_LIMIT
+    assert game_state.chat_history[-1]["id"] == 999
 
 
 @pytest.mark.unit
@@ -334,9 +410,217 @@ def test_game_state_stores_ruleset_control_dataclass(game_state):
         "num_counters": 5,
     }
 
-    assert game_state.ruleset_control is None
+    assert game_state.ruleset.ruleset_control is None
+
+    game_state.ruleset.ruleset_control = RulesetControl(**data)
+
+    assert isinstance(game_state.ruleset.ruleset_control, RulesetControl)
+    assert game_state.ruleset.ruleset_control.name == "Classic"
+
+    game_state.ruleset._allocate_from_control(game_state.ruleset.ruleset_control)
+
+    assert game_state.ruleset.nations == [None] * 200
+    assert len(game_state.ruleset.techs) == 88
+    assert len(game_state.ruleset.governments) == 8
+    assert len(game_state.ruleset.disasters) == 7
+    assert len(game_state.ruleset.achievements) == 12
+    assert len(game_state.ruleset.terrains) == 30
+    assert len(game_state.ruleset.unit_types) == 50
+    assert len(game_state.ruleset.buildings) == 40
+    assert len(game_state.ruleset.extras) == 20
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+def test_ruleset_dataclasses_use_slots():
+    """Ruleset dataclasses are slotted, so instances carry no __dict__."""
+    resource = Resource(id=1, output=[1, 0, 0, 0, 0, 0])
+
+    assert not hasattr(resource, "__dict__")
+    assert type(resource).__slots__ == ("id", "output")
+
+
+@pytest.mark.unit
+def test_store_by_id_grows_dense_table():
+    """store_by_id should pad with None up to the ID and store in place."""
+    table = [None, None]
+
+    store_by_id(table, 1, "b")
+    assert table == [None, "b"]
+
+    store_by_id(table, 4, "e")
+    assert table == [None, "b", None, None, "e"]
+
+
+@pytest.mark.unit
+def test_identifier_strings_are_interned():
+    """Equal rule names decoded separately should share one interned object."""
+    name_a = b"Barbarian".decode("utf-8")
+    name_b = b"Barbarian".decode("utf-8")
+    assert name_a is not name_b
+
+    group_a = NationGroup(name=name_a, hidden=False)
+    group_b = NationGroup(name=name_b, hidden=True)
 
-    game_state.ruleset_control = RulesetControl(**data)
+    assert group_a.name is group_b.name
 
-    assert isinstance(game_state.ruleset_control, RulesetControl)
-    assert game_state.ruleset_control.name == "Classic"
+
+@pytest.mark.unit
+def test_action_type_flags_round_trip():
+    """ActionType packs bool/enum fields into flags and unpacks them via properties."""
+    action = ActionType(
+        id=3,
+        ui_name="Establish %sEmbassy%s",
+        flags=ActionType.pack_flags(True, False, 3, 5, 9),
+        result=0,
+        sub_results=0,
+        min_distance=0,
+        max_distance=1,
+        blocked_by=0,
+    )
+
+    assert action.quiet is True
+    assert action.actor_consuming_always is False
+    assert action.act_kind == 3
+    assert action.tgt_kind == 5
+    assert action.sub_tgt_kind == 9
+
+
+@pytest.mark.unit
+def test_frozen_requirements_are_hashable_and_deduplicate():
+    """Requirement is frozen: equal requirements hash alike and cannot be mutated."""
+    req_a = Requirement(type=1, value=42, range=3, survives=False, present=True, quiet=False)
+    req_b = Requirement(type=1, value=42, range=3, survives=False, present=True, quiet=False)
+
+    assert len({req_a, req_b}) == 1
+    with pytest.raises(FrozenInstanceError):
+        req_a.packed = 7
+
+
+@pytest.mark.unit
+def test_requirement_packs_fields_into_one_int():
+    """Requirement fields round-trip through the packed int, including negative values."""
+    req = Requirement(type=22, value=-5, range=7, survives=True, present=False, quiet=True)
+
+    assert req.type == 22
+    assert req.value == -5
+    assert req.range == 7
+    assert req.survives is True
+    assert req.present is False
+    assert req.quiet is True
+    assert req.packed == Requirement.pack(22, -5, 7, True, False, True)
+    assert repr(req) == (
+        "Requirement(type=22, value=-5, range=7, survives=True, present=False, quiet=True)"
+    )
+
+
+@pytest.mark.unit
+def test_help_text_is_decoded_on_access():
+    """Help text is stored as raw UTF-8 bytes and decoded when the property is read."""
+    flag = TechFlag(id=0, name="Claim_Ocean", helptxt_raw="Océan claims".encode("utf-8"))
+
+    assert flag.helptxt_raw == b"Oc\xc3\xa9an claims"
+    assert flag.helptxt == "Océan claims"
+
+
+@pytest.mark.unit
+def test_flag_table_stores_names_and_help_by_id():
+    """FlagTable keeps parallel name/helptxt lists and builds flag records on demand."""
+    table = FlagTable(UnitFlag)
+    table.store(2, "Diplomat", "Can establish embassies.".encode("utf-8"))
+    table.store(0, "TradeRoute", b"")
+
+    assert len(table) == 2
+    assert list(table) == [0, 2]
+    assert 1 not in table
+    assert table.name(2) == "Diplomat"
+    assert table.helptxt(2) == "Can establish embassies."
+    assert table[0] == UnitFlag(id=0, name="TradeRoute", helptxt_raw=b"")
+    with pytest.raises(KeyError):
+        table[1]
+
+
+@pytest.mark.unit
+def test_shared_requirements_reuse_one_instance():
+    """Requirement.shared returns the same object for equal fields."""
+    req_a = Requirement.shared(type=1, value=42, range=3, survives=False, present=True, quiet=False)
+    req_b = Requirement.shared(type=1, value=42, range=3, survives=False, present=True, quiet=False)
+    req_c = Requirement.shared(type=1, value=43, range=3, survives=False, present=True, quiet=False)
+
+    assert req_a is req_b
+    assert req_a is not req_c
+    assert req_a == Requirement(
+        type=1, value=42, range=3, survives=False, present=True, quiet=False
+    )
+
+
+@pytest.mark.unit
+def test_rule_name_lookup_builds_index_and_resets_on_new_ruleset(game_state):
+    """*_id_by_rule_name builds its index lazily and a new ruleset clears it."""
+    game_state.ruleset.terrains = [
+        SimpleNamespace(id=0, rule_name="Inaccessible"),
+        None,
+        SimpleNamespace(id=2, rule_name="Grassland"),
+    ]
+
+    assert game_state.ruleset.terrain_id_by_rule_name("Grassland") == 2
+    assert game_state.ruleset.terrain_id_by_rule_name("Swamp") is None
+
+    game_state.ruleset._invalidate_rule_caches()
+    game_state.ruleset.terrains = [SimpleNamespace(id=0, rule_name="Swamp")]
+
+    assert game_state.ruleset.terrain_id_by_rule_name("Swamp") == 0
+    assert game_state.ruleset.terrain_id_by_rule_name("Grassland") is None
+
+
+@pytest.mark.unit
+def test_derived_queries_are_memoized_until_invalidated(game_state):
+    """Derived ruleset queries are cached per bundle and cleared with the rule caches."""
+    ruleset = game_state.ruleset
+    bronze, masonry = 5, 7
+    ruleset.unit_types = [
+        SimpleNamespace(id=0, build_reqs=[]),
+        SimpleNamespace(
+            id=1,
+            build_reqs=[
+                Requirement(
+                    type=1, value=bronze, range=0, survives=False, present=True, quiet=False
+                )
+            ],
+        ),
+        SimpleNamespace(
+            id=2,
+            build_reqs=[
+                Requirement(
+                    type=1, value=masonry, range=0, survives=False, present=True, quiet=False
+                )
+            ],
+        ),
+    ]
+    ruleset.extras = [
+        SimpleNamespace(id=0, hidden_by=0),
+        SimpleNamespace(id=1, hidden_by=0b1),
+    ]
+    ruleset._mark_loaded()
+
+    assert ruleset.unit_types_buildable_with(frozenset({bronze})) == (0, 1)
+    assert ruleset.extras_hidden_by(0) == (1,)
+
+    # Cached: table changes are not seen until the caches are invalidated
+    ruleset.unit_types = []
+    assert ruleset.unit_types_buildable_with(frozenset({bronze})) == (0, 1)
+
+    ruleset._invalidate_rule_caches()
+    assert ruleset.unit_types_buildable_with(frozenset({bronze})) == ()
+
+
+@pytest.mark.unit
+def test_derived_queries_not_cached_during_ruleset_burst(game_state):
+    """Before RULESETS_READY, queries see entries added by later ruleset packets."""
+    ruleset = game_state.ruleset
+    ruleset.extras = [SimpleNamespace(id=0, hidden_by=0)]
+    assert ruleset.extras_hidden_by(0) == ()
+
+    ruleset.extras.append(SimpleNamespace(id=1, hidden_by=0b1))
+    assert ruleset.extras_hidden_by(0) == (1,)
+    assert ruleset._query_cache == {}
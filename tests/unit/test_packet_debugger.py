@@ -251,6 +251,25 @@ def test_write_outbound_packet_large_data(tmp_path):
     assert content == packet_data
 
 
+# ============================================================================
+# write_inbound_batch Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_write_inbound_batch_writes_in_order(tmp_path):
+    """write_inbound_batch should write each packet with sequential numbering."""
+    debug_dir = tmp_path / "debug"
+    debugger = PacketDebugger(str(debug_dir))
+
+    debugger.write_inbound_batch([(b"\x01", 5), (b"\x02\x03", 25), (b"\x04", 29)])
+
+    assert (debug_dir / "inbound_0001_type005.packet").read_bytes() == b"\x01"
+    assert (debug_dir / "inbound_0002_type025.packet").read_bytes() == b"\x02\x03"
+    assert (debug_dir / "inbound_0003_type029.packet").read_bytes() == b"\x04"
+    assert debugger._inbound_counter == 3
+
+
 # ============================================================================
 # Edge Cases
 # ============================================================================
@@ -280,6 +280,17 @@ def test_decode_sint16_boundaries():
     assert offset == 2
 
 
+@pytest.mark.unit
+def test_decode_integers_at_offset_from_memoryview():
+    """Integer decoders read in place at an offset, from bytes or memoryview."""
+    data = b"\xaa\xff\xd6\x00\x00\x00\x2a\xff"
+    for buf in (data, memoryview(data)):
+        assert decode_sint16(buf, 1) == (-42, 3)
+        assert decode_uint32(buf, 3) == (42, 7)
+        assert decode_sint32(buf, 3) == (42, 7)
+        assert decode_sint8(buf, 7) == (-1, 8)
+
+
 @pytest.mark.unit
 def test_decode_sint32_positive():
     """Test decoding positive SINT32 values."""
@@ -1076,7 +1087,7 @@ def test_decode_ruleset_nation_sets_single():
     assert result["nsets"] == 1
     assert result["names"] == ["Core"]
     assert result["rule_names"] == ["core"]
-    assert result["descriptions"] == ["Default nations"]
+    assert result["descriptions"] == [b"Default nations"]
 
 
 def test_decode_ruleset_nation_sets_multiple():
@@ -1102,7 +1113,7 @@ def test_decode_ruleset_nation_sets_multiple():
     assert result["nsets"] == 3
     assert result["names"] == ["Core", "Extended", "Custom"]
     assert result["rule_names"] == ["core", "extended", "custom"]
-    assert result["descriptions"] == ["Default", "Additional", "User-created"]
+    assert result["descriptions"] == [b"Default", b"Additional", b"User-created"]
 
 
 def test_decode_ruleset_nation_sets_empty_strings():
@@ -1119,7 +1130,7 @@ def test_decode_ruleset_nation_sets_empty_strings():
     assert result["nsets"] == 1
     assert result["names"] == [""]
     assert result["rule_names"] == ["core"]
-    assert result["descriptions"] == [""]
+    assert result["descriptions"] == [b""]
 
 
 def test_decode_ruleset_nation_sets_unicode():
@@ -2000,7 +2011,7 @@ def test_decode_ruleset_tech_flag_all_fields(delta_cache):
 
     assert result["id"] == 5
     assert result["name"] == "Bonus_Tech"
-    assert result["helptxt"] == "This flag grants bonus research points."
+    assert result["helptxt"] == b"This flag grants bonus research points."
 
 
 @pytest.mark.unit
@@ -2024,7 +2035,7 @@ def test_decode_ruleset_tech_flag_delta_id_only(delta_cache):
 
     assert result2["id"] == 2  # New value
     assert result2["name"] == "Tech_A"  # From cache
-    assert result2["helptxt"] == "Help text A"  # From cache
+    assert result2["helptxt"] == b"Help text A"  # From cache
 
 
 @pytest.mark.unit
@@ -2048,7 +2059,7 @@ def test_decode_ruleset_tech_flag_delta_name_only(delta_cache):
 
     assert result2["id"] == 3  # From cache
     assert result2["name"] == "Updated_Name"  # New value
-    assert result2["helptxt"] == "Original help"  # From cache
+    assert result2["helptxt"] == b"Original help"  # From cache
 
 
 @pytest.mark.unit
@@ -2072,7 +2083,7 @@ def test_decode_ruleset_tech_flag_delta_helptxt_only(delta_cache):
 
     assert result2["id"] == 4  # From cache
     assert result2["name"] == "Flag_Name"  # From cache
-    assert result2["helptxt"] == "Updated description with more details"  # New value
+    assert result2["helptxt"] == b"Updated description with more details"  # New value
 
 
 @pytest.mark.unit
@@ -2097,7 +2108,7 @@ def test_decode_ruleset_tech_flag_delta_multiple_fields(delta_cache):
 
     assert result2["id"] == 17  # New value
     assert result2["name"] == "Flag2"  # New value
-    assert result2["helptxt"] == "Help1"  # From cache
+    assert result2["helptxt"] == b"Help1"  # From cache
 
 
 @pytest.mark.unit
@@ -2115,7 +2126,7 @@ def test_decode_ruleset_tech_flag_empty_strings(delta_cache):
 
     assert result["id"] == 0
     assert result["name"] == ""
-    assert result["helptxt"] == ""
+    assert result["helptxt"] == b""
 
 
 # ============================================================================
@@ -2154,7 +2165,7 @@ def test_decode_ruleset_government_all_fields(delta_cache):
     assert result["sound_str"] == "g_anarchy"
     assert result["sound_alt"] == "-"
     assert result["sound_alt2"] == "-"
-    assert result["helptext"] == "A chaotic form of government."
+    assert result["helptext"] == b"A chaotic form of government."
 
 
 @pytest.mark.unit
@@ -2233,7 +2244,7 @@ def test_decode_ruleset_government_delta_update(delta_cache):
     assert result2["name"] == "Democracy"  # New value
     assert result2["rule_name"] == "Anarchy"  # From cache
     assert result2["graphic_str"] == "gov.anarchy"  # From cache
-    assert result2["helptext"] == "Original help."  # From cache
+    assert result2["helptext"] == b"Original help."  # From cache
 
 
 @pytest.mark.unit
@@ -2266,7 +2277,7 @@ def test_decode_ruleset_government_strings_only(delta_cache):
     assert result2["name"] == "Anarchy"  # New value
     assert result2["rule_name"] == "Anarchy"  # New value
     assert result2["graphic_str"] == "gov.anarchy"  # New value
-    assert result2["helptext"].startswith("Anarchy is simply")  # New value
+    assert result2["helptext"].startswith(b"Anarchy is simply")  # New value
 
 
 @pytest.mark.unit
@@ -2292,7 +2303,7 @@ def test_decode_ruleset_government_empty_strings(delta_cache):
     assert result["name"] == "Test Gov"
     assert result["graphic_str"] == ""
     assert result["sound_str"] == ""
-    assert result["helptext"] == ""
+    assert result["helptext"] == b""
 
 
 # ============================================================================
@@ -2431,7 +2442,7 @@ def test_decode_ruleset_impr_flag_all_fields(delta_cache):
 
     assert result["id"] == 4
     assert result["name"] == "Barracks"
-    assert result["helptxt"] == ""
+    assert result["helptxt"] == b""
 
 
 @pytest.mark.unit
@@ -2448,7 +2459,7 @@ def test_decode_ruleset_impr_flag_with_helptxt(delta_cache):
 
     assert result["id"] == 2
     assert result["name"] == "Airport"
-    assert result["helptxt"] == "Allows air units to land and refuel"
+    assert result["helptxt"] == b"Allows air units to land and refuel"
 
 
 @pytest.mark.unit
@@ -2472,7 +2483,7 @@ def test_decode_ruleset_impr_flag_delta_update(delta_cache):
 
     assert result2["id"] == 5  # From cache
     assert result2["name"] == "Capitol"  # Updated
-    assert result2["helptxt"] == "Seat of government"  # From cache
+    assert result2["helptxt"] == b"Seat of government"  # From cache
 
 
 @pytest.mark.unit
@@ -2488,7 +2499,7 @@ def test_decode_ruleset_impr_flag_empty_cache(delta_cache):
 
     assert result["id"] == 1
     assert result["name"] == "Granary"
-    assert result["helptxt"] == ""  # Default value
+    assert result["helptxt"] == b""  # Default value
 
 
 @pytest.mark.unit
@@ -2505,7 +2516,7 @@ def test_decode_ruleset_impr_flag_empty_strings(delta_cache):
 
     assert result["id"] == 0
     assert result["name"] == ""
-    assert result["helptxt"] == ""
+    assert result["helptxt"] == b""
 
 
 @pytest.mark.unit